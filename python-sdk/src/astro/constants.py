@@ -34,6 +34,10 @@ class FileType(Enum):
     JSON = "json"
     NDJSON = "ndjson"
     PARQUET = "parquet"
+    ARROW = "arrow"
+    FEATHER = "feather"
+    ORC = "orc"
+    AVRO = "avro"
     # [END filetypes]
 
     def __str__(self) -> str:
@@ -14,7 +14,9 @@ if airflow.__version__ >= "2.3":
 else:
     from sqlalchemy.engine.result import RowProxy as SQLAlcRow
 
+from astro.dataframes.pandas import LazyPandasDataframe
 from astro.files import File
+from astro.sql.operators.raw_sql import ColumnarRows
 from astro.table import Table, TempTable
 
 log = logging.getLogger("astro.utils.serializer")
@@ -31,10 +33,15 @@ def serialize(obj: Table | File | Any) -> dict | Any:  # noqa
         return obj.to_json()
     elif isinstance(obj, File):
         return obj.to_json()
+    elif isinstance(obj, ColumnarRows):
+        return {"class": "ColumnarRows", "version": ColumnarRows.version, **obj.serialize()}
     elif isinstance(obj, (list, tuple)):
         return [serialize(o) for o in obj]
     elif isinstance(obj, dict):
         return {k: serialize(v) for k, v in obj.items()}
+    elif isinstance(obj, LazyPandasDataframe) and not obj.is_materialized:
+        # The dataframe is forwarded without being read, so the reference to its file is kept
+        return obj.serialize()
     elif isinstance(obj, pandas.DataFrame):
         from astro.utils.dataframe import convert_dataframe_to_file
 
@@ -70,7 +77,7 @@ def _attempt_to_serialize_unknown_object(obj: object):
 
 
 def _is_serialized_astro_object(obj) -> bool:
-    return bool(obj.get("class") and obj["class"] in ["Table", "File", "string", "SQLAlcRow"])
+    return bool(obj.get("class") and obj["class"] in ["Table", "File", "string", "SQLAlcRow", "ColumnarRows"])
 
 
 def deserialize(obj: dict | str | list) -> Table | File | Any:  # noqa
@@ -89,6 +96,8 @@ def deserialize(obj: dict | str | list) -> Table | File | Any:  # noqa
         elif obj["class"] == "File":
             log.debug("Found file dictionary %s, will attempt to deserialize", obj)
             return _deserialize_file(obj)
+        elif obj["class"] == "ColumnarRows":
+            return ColumnarRows.deserialize(obj, obj["version"])
         elif obj["class"] == "SQLAlcRow":
             if airflow.__version__ >= "2.3":
                 return SQLAlcRow(None, None, obj["key_map"], obj["key_style"], obj["data"])
@@ -108,7 +117,7 @@ def deserialize(obj: dict | str | list) -> Table | File | Any:  # noqa
 def _deserialize_file(obj):
     file = File.from_json(obj)
     if file.is_dataframe:
-        return file.export_to_dataframe()
+        return LazyPandasDataframe.from_file(file)
     return file
 
 
@@ -43,6 +43,9 @@ NATIVE_PATHS_SUPPORTED_FILE_TYPES = {
     # Refer: https://docs.aws.amazon.com/redshift/latest/dg/copy-parameters-data-format.html#copy-json
     FileType.NDJSON: "JSON 'auto ignorecase'",
     FileType.PARQUET: "PARQUET",
+    # Like for JSON, Avro fields are matched to the (lowercase) column names case-insensitively
+    FileType.AVRO: "AVRO 'auto ignorecase'",
+    FileType.ORC: "ORC",
 }
 
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import datetime
+import decimal
 import logging
 import warnings
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Callable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping
 
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy
 from airflow.hooks.dbapi import DbApiHook
 from pandas.io.sql import SQLDatabase
@@ -30,12 +33,26 @@ from astro.constants import (
     MergeConflictStrategy,
 )
 from astro.exceptions import DatabaseCustomError, NonExistentTableException
-from astro.files import File, resolve_file_path_pattern
+from astro.files import File, iter_file_path_pattern
 from astro.files.types import create_file_type
 from astro.files.types.base import FileType as FileTypeConstants
 from astro.options import LoadOptions
 from astro.settings import LOAD_FILE_ENABLE_NATIVE_FALLBACK, LOAD_TABLE_AUTODETECT_ROWS_COUNT, SCHEMA
 from astro.table import BaseTable, Metadata
+from astro.utils.filters import Filters
+
+
+# Arrow types of the columns whose values pandas reads as these Python types. Decimals are read as floats.
+PYTHON_TYPE_TO_ARROW_TYPE = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    decimal.Decimal: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    datetime.date: pa.date32(),
+    datetime.time: pa.time64("us"),
+}
 
 
 class BaseDatabase(ABC):
@@ -66,6 +83,9 @@ class BaseDatabase(ABC):
     DEFAULT_SCHEMA = SCHEMA
     NATIVE_LOAD_EXCEPTIONS: Any = DatabaseCustomError
     NATIVE_AUTODETECT_SCHEMA_CONFIG: Mapping[FileLocation, Mapping[str, list[FileType] | Callable]] = {}
+    # Maximum number of dataframes loaded to tables concurrently, e.g. when staging the dataframe arguments of a
+    # SQL function. None means the load concurrency is only bounded by the settings.
+    MAX_CONCURRENT_DATAFRAME_LOADS: int | None = None
     FILE_PATTERN_BASED_AUTODETECT_SCHEMA_SUPPORTED: set[FileLocation] = set()
 
     def __init__(self, conn_id: str):
@@ -348,6 +368,7 @@ class BaseDatabase(ABC):
         columns_names_capitalization: ColumnCapitalization = "original",
         if_exists: LoadExistStrategy = "replace",
         use_native_support: bool = True,
+        columns: list[str] | None = None,
     ):
         """
         Checks if the autodetect schema exists for native support else creates the schema and table
@@ -357,7 +378,10 @@ class BaseDatabase(ABC):
         :param columns_names_capitalization:  determines whether to convert all columns to lowercase/uppercase
         :param if_exists:  Overwrite file if exists
         :param use_native_support: Use native support for data transfer if available on the destination
+        :param columns: Only create the table with these columns of the file
         """
+        # The partition columns of Hive-partitioned datasets are not part of the files natively loaded
+        use_native_support = use_native_support and not file.hive_partitioning
         is_schema_autodetection_supported = self.check_schema_autodetection_is_supported(source_file=file)
         is_file_pattern_based_schema_autodetection_supported = (
             self.check_file_pattern_based_schema_autodetection_is_supported(source_file=file)
@@ -376,18 +400,32 @@ class BaseDatabase(ABC):
 
         self.create_schema_if_needed(table.metadata.schema)
         if if_exists == "replace" or not self.table_exists(table):
-            files = resolve_file_path_pattern(
-                file.path,
-                file.conn_id,
-                normalize_config=normalize_config,
-                filetype=file.type.name,
-            )
-            self.create_table(
-                table,
-                # We only use the first file for inferring the table schema
-                files[0],
-                columns_names_capitalization=columns_names_capitalization,
+            # We only use the first file for inferring the table schema
+            first_file = next(
+                iter_file_path_pattern(
+                    file.path,
+                    file.conn_id,
+                    normalize_config=normalize_config,
+                    filetype=file.type.name,
+                    hive_partitioning=file.hive_partitioning,
+                )
             )
+            if columns or file.hive_partitioning:
+                # The schema of the projected columns, or of the partition columns added to the file, is inferred
+                # from a sample, instead of the whole file
+                self.create_table(
+                    table,
+                    dataframe=first_file.export_to_dataframe(
+                        nrows=LOAD_TABLE_AUTODETECT_ROWS_COUNT, columns=columns
+                    ),
+                    columns_names_capitalization=columns_names_capitalization,
+                )
+            else:
+                self.create_table(
+                    table,
+                    first_file,
+                    columns_names_capitalization=columns_names_capitalization,
+                )
 
     def load_file_to_table(
         self,
@@ -401,6 +439,8 @@ class BaseDatabase(ABC):
         columns_names_capitalization: ColumnCapitalization = "original",
         enable_native_fallback: bool | None = LOAD_FILE_ENABLE_NATIVE_FALLBACK,
         load_options: LoadOptions | None = None,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
         **kwargs,
     ):
         """
@@ -418,6 +458,8 @@ class BaseDatabase(ABC):
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
         :param enable_native_fallback: Use enable_native_fallback=True to fall back to default transfer
+        :param columns: Only load these columns of the file
+        :param filters: Only load the rows matching these ``(column, operator, value)`` predicates
         """
         normalize_config = normalize_config or {}
 
@@ -427,12 +469,17 @@ class BaseDatabase(ABC):
             columns_names_capitalization=columns_names_capitalization,
             if_exists=if_exists,
             normalize_config=normalize_config,
+            columns=columns,
         )
 
-        if use_native_support and self.is_native_load_file_available(
-            source_file=input_file, target_table=output_table
+        if (
+            use_native_support
+            and not input_file.hive_partitioning
+            and self.is_native_load_file_available(source_file=input_file, target_table=output_table)
+            and self.is_native_load_selection_available(
+                source_file=input_file, columns=columns, filters=filters
+            )
         ):
-
             self.load_file_to_table_natively_with_fallback(
                 source_file=input_file,
                 target_table=output_table,
@@ -441,6 +488,8 @@ class BaseDatabase(ABC):
                 native_support_kwargs=native_support_kwargs,
                 enable_native_fallback=enable_native_fallback,
                 chunk_size=chunk_size,
+                columns=columns,
+                filters=filters,
             )
         else:
             self.load_file_to_table_using_pandas(
@@ -449,10 +498,12 @@ class BaseDatabase(ABC):
                 normalize_config=normalize_config,
                 if_exists="append",
                 chunk_size=chunk_size,
+                columns=columns,
+                filters=filters,
             )
 
     @staticmethod
-    def get_dataframe_from_file(file: File):
+    def get_dataframe_from_file(file: File, **kwargs):
         """
         Get pandas dataframe file. We need export_to_dataframe() for Biqqery,Snowflake and Redshift except for Postgres.
         For postgres we are overriding this method and using export_to_dataframe_via_byte_stream().
@@ -460,9 +511,10 @@ class BaseDatabase(ABC):
         With this approach we have significant performance boost for postgres.
 
         :param file: File path and conn_id for object stores
+        :param kwargs: Options of the file reader, such as ``columns`` and ``filters``
         """
 
-        return file.export_to_dataframe()
+        return file.export_to_dataframe(**kwargs)
 
     @staticmethod
     def _assert_not_empty_df(df):
@@ -480,22 +532,56 @@ class BaseDatabase(ABC):
         normalize_config: dict | None = None,
         if_exists: LoadExistStrategy = "replace",
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
     ):
         logging.info("Loading file(s) with Pandas...")
-        input_files = resolve_file_path_pattern(
+        input_files = iter_file_path_pattern(
             input_file.path,
             input_file.conn_id,
             normalize_config=normalize_config,
             filetype=input_file.type.name,
+            hive_partitioning=input_file.hive_partitioning,
+            filters=filters,
         )
 
+        # Filtered chunks may be empty, they are skipped and the table is created or replaced by the first chunk
+        # holding rows
+        loaded = False
         for file in input_files:
-            self.load_pandas_dataframe_to_table(
-                self.get_dataframe_from_file(file),
-                output_table,
-                chunk_size=chunk_size,
-                if_exists=if_exists,
+            for df in self._iter_file_dataframes(
+                file, chunk_size=chunk_size, columns=columns, filters=filters
+            ):
+                if df.empty:
+                    continue
+                self.load_pandas_dataframe_to_table(
+                    df,
+                    output_table,
+                    chunk_size=chunk_size,
+                    if_exists="append" if loaded else if_exists,
+                )
+                loaded = True
+        if not loaded:
+            raise ValueError("Can't load empty dataframe")
+
+    def _iter_file_dataframes(
+        self, file: File, chunk_size: int, columns: list[str] | None, filters: Filters | None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a file as dataframes. Files supporting it are parsed a chunk at a time, so that only a few chunks of
+        rows are held in memory, the other ones are read as a single dataframe.
+
+        :param file: File to read
+        :param chunk_size: Number of rows in each chunk
+        :param columns: Only read these columns of the file
+        :param filters: Only read the rows matching these ``(column, operator, value)`` predicates
+        """
+        if file.supports_chunked_reads:
+            yield from file.export_to_dataframe_chunks(
+                chunk_size=chunk_size, columns=columns, filters=filters
             )
+        else:
+            yield self.get_dataframe_from_file(file, columns=columns, filters=filters)
 
     def load_file_to_table_natively_with_fallback(
         self,
@@ -506,6 +592,8 @@ class BaseDatabase(ABC):
         native_support_kwargs: dict | None = None,
         enable_native_fallback: bool | None = LOAD_FILE_ENABLE_NATIVE_FALLBACK,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
         **kwargs,
     ):
         """
@@ -518,7 +606,12 @@ class BaseDatabase(ABC):
         :param native_support_kwargs: kwargs to be used by method involved in native support flow
         :param enable_native_fallback: Use enable_native_fallback=True to fall back to default transfer
         :param normalize_config: pandas json_normalize params config
+        :param columns: Only load these columns of the file
+        :param filters: Only load the rows matching these ``(column, operator, value)`` predicates
         """
+        if columns or filters:
+            # Only the databases whose native load supports the selection receive it
+            kwargs.update(columns=columns, filters=filters)
 
         try:
             logging.info("Loading file(s) with Native Support...")
@@ -542,6 +635,8 @@ class BaseDatabase(ABC):
                     normalize_config=normalize_config,
                     if_exists=if_exists,
                     chunk_size=chunk_size,
+                    columns=columns,
+                    filters=filters,
                 )
             else:
                 raise load_exception
@@ -573,6 +668,39 @@ class BaseDatabase(ABC):
             index=False,
         )
 
+    def load_record_batches_to_table(
+        self,
+        source_batches: Iterable[pa.RecordBatch],
+        target_table: BaseTable,
+        if_exists: LoadExistStrategy = "replace",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Create a table with the content of a stream of Arrow record batches.
+        If the table already exists, append or replace the content, depending on the value of `if_exists`.
+        Databases without a native Arrow loader convert each batch to a dataframe, so that only one batch is held
+        in memory at a time. Empty batches are skipped, the table being created or replaced by the first batch
+        holding rows.
+
+        :param source_batches: Record batches sharing the same schema
+        :param target_table: Table in which the batches will be loaded
+        :param if_exists: Strategy to be used in case the target table already exists.
+        :param chunk_size: Specify the number of rows in each batch to be written at a time.
+        """
+        loaded = False
+        for batch in source_batches:
+            if batch.num_rows == 0:
+                continue
+            self.load_pandas_dataframe_to_table(
+                batch.to_pandas(),
+                target_table,
+                if_exists="append" if loaded else if_exists,
+                chunk_size=chunk_size,
+            )
+            loaded = True
+        if not loaded:
+            raise ValueError("Can't load empty record batches")
+
     def append_table(
         self,
         source_table: BaseTable,
@@ -660,6 +788,54 @@ class BaseDatabase(ABC):
         table_qualified_name = self.get_table_qualified_name(source_table)
         raise NonExistentTableException(f"The table {table_qualified_name} does not exist")
 
+    def export_table_to_record_batches(
+        self, source_table: BaseTable, batch_size: int = DEFAULT_CHUNK_SIZE, select_kwargs: dict | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the content of a table as Arrow record batches.
+        Databases without a native Arrow cursor fetch the rows in chunks using a server-side cursor when the driver
+        supports it. The schema is inferred from the first chunk, so that all the batches share it even if pandas
+        infers other dtypes for the following chunks (e.g. floats for integer columns holding nulls). Columns
+        holding only nulls in the first chunk are typed after their SQL type instead.
+
+        :param source_table: An existing table in the database
+        :param batch_size: Maximum number of rows in each record batch
+        :param select_kwargs: kwargs for select statement
+        """
+        select_kwargs = select_kwargs or {}
+
+        if not self.table_exists(source_table):
+            table_qualified_name = self.get_table_qualified_name(source_table)
+            raise NonExistentTableException(f"The table {table_qualified_name} does not exist")
+
+        sqla_table = self.get_sqla_table(source_table)
+        schema = None
+        with self.sqlalchemy_engine.connect() as connection:
+            streaming_connection = connection.execution_options(stream_results=True)
+            for df in pd.read_sql(
+                sql=sqla_table.select(**select_kwargs), con=streaming_connection, chunksize=batch_size
+            ):
+                if schema is None:
+                    schema = self._get_record_batch_schema(df, sqla_table)
+                yield pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+
+    @staticmethod
+    def _get_record_batch_schema(df: pd.DataFrame, sqla_table: SqlaTable) -> pa.Schema:
+        """
+        Infer the Arrow schema of the records of a table from a chunk of them. The columns holding only nulls in the
+        chunk are typed after their SQL type, or as strings if it has no Arrow equivalent, so that the following
+        chunks holding values can be converted.
+
+        :param df: First chunk of the records of the table
+        :param sqla_table: Reflected table
+        """
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        for index, field in enumerate(schema):
+            if pa.types.is_null(field.type):
+                sql_column = sqla_table.columns.get(field.name)
+                schema = schema.set(index, field.with_type(_get_arrow_type(sql_column)))
+        return schema
+
     def export_table_to_file(
         self,
         source_table: BaseTable,
@@ -786,6 +962,22 @@ class BaseDatabase(ABC):
         """
         return False
 
+    def is_native_load_selection_available(  # skipcq: PYL-R0201
+        self,
+        source_file: File,  # skipcq: PYL-W0613
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> bool:
+        """
+        Check if the native load can project the columns and filter the rows of the file by itself. Otherwise,
+        the file is loaded with pandas, which pushes the selection down to the file readers.
+
+        :param source_file: File from which we need to transfer data
+        :param columns: Columns of the file to load
+        :param filters: Predicates the loaded rows must match
+        """
+        return not columns and not filters
+
     def load_file_to_table_natively(
         self,
         source_file: File,
@@ -860,3 +1052,21 @@ class BaseDatabase(ABC):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         """
         raise NotImplementedError
+
+
+def _get_arrow_type(sql_column: sqlalchemy.Column | None) -> pa.DataType:
+    """
+    Return the Arrow type of the values pandas reads from a SQL column, defaulting to strings for the types without
+    an Arrow equivalent.
+
+    :param sql_column: Reflected column, if any
+    """
+    if sql_column is None:
+        return pa.string()
+    try:
+        python_type = sql_column.type.python_type
+    except NotImplementedError:
+        return pa.string()
+    if python_type is datetime.datetime:
+        return pa.timestamp("ns", tz="UTC" if getattr(sql_column.type, "timezone", False) else None)
+    return PYTHON_TYPE_TO_ARROW_TYPE.get(python_type, pa.string())
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Iterator, Mapping
 
 import pandas as pd
+import pyarrow as pa
 from airflow.providers.google.cloud.hooks.bigquery import BigQueryHook
 from airflow.providers.google.cloud.hooks.bigquery_dts import BiqQueryDataTransferServiceHook
 from google.api_core.exceptions import (
@@ -43,16 +44,19 @@ from astro.constants import (
     MergeConflictStrategy,
 )
 from astro.databases.base import BaseDatabase
-from astro.exceptions import DatabaseCustomError
+from astro.exceptions import DatabaseCustomError, NonExistentTableException
 from astro.files import File
 from astro.settings import BIGQUERY_SCHEMA, BIGQUERY_SCHEMA_LOCATION
 from astro.table import BaseTable, Metadata
+from astro.utils.filters import Filters, render_filters_as_sql
 
 DEFAULT_CONN_ID = BigQueryHook.default_conn_name
 NATIVE_PATHS_SUPPORTED_FILE_TYPES = {
     FileType.CSV: "CSV",
     FileType.NDJSON: "NEWLINE_DELIMITED_JSON",
     FileType.PARQUET: "PARQUET",
+    FileType.AVRO: "AVRO",
+    FileType.ORC: "ORC",
 }
 BIGQUERY_WRITE_DISPOSITION = {"replace": "WRITE_TRUNCATE", "append": "WRITE_APPEND"}
 
@@ -72,7 +76,7 @@ class BigqueryDatabase(BaseDatabase):
 
     NATIVE_AUTODETECT_SCHEMA_CONFIG: Mapping[FileLocation, Mapping[str, list[FileType] | Callable]] = {
         FileLocation.GS: {
-            "filetype": [FileType.CSV, FileType.NDJSON, FileType.PARQUET],
+            "filetype": [FileType.CSV, FileType.NDJSON, FileType.PARQUET, FileType.AVRO, FileType.ORC],
             "method": lambda table, file: None,
         },
     }
@@ -211,6 +215,30 @@ class BigqueryDatabase(BaseDatabase):
             credentials=creds,
         )
 
+    def export_table_to_record_batches(
+        self, source_table: BaseTable, batch_size: int = DEFAULT_CHUNK_SIZE, select_kwargs: dict | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the content of a table as Arrow record batches, reading the table pages directly (without running
+        a query) in the Arrow format.
+
+        :param source_table: An existing table in the database
+        :param batch_size: Maximum number of rows in each record batch
+        :param select_kwargs: kwargs for select statement
+        """
+        if select_kwargs:
+            yield from super().export_table_to_record_batches(source_table, batch_size, select_kwargs)
+            return
+
+        table_qualified_name = self.get_table_qualified_name(source_table)
+        if not self.table_exists(source_table):
+            raise NonExistentTableException(f"The table {table_qualified_name} does not exist")
+
+        client = self.hook.get_client(project_id=self.hook.project_id)
+        rows = client.list_rows(table_qualified_name, page_size=batch_size)
+        for batch in rows.to_arrow_iterable():
+            yield from pa.Table.from_batches([batch]).to_batches(max_chunksize=batch_size)
+
     def create_schema_if_needed(self, schema: str | None, location: str | None = None) -> None:
         """
         This function checks if the expected schema exists in the database. If the schema does not exist,
@@ -311,12 +339,31 @@ class BigqueryDatabase(BaseDatabase):
         location_type = self.NATIVE_PATHS.get(source_file.location.location_type)
         return bool(location_type and file_type)
 
+    def is_native_load_selection_available(  # skipcq PYL-R0201
+        self,
+        source_file: File,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> bool:
+        """
+        Load jobs can't select columns or rows, so the file is loaded natively to a staging table, from which the
+        selection is copied by a ``SELECT`` statement. This is not available for S3 files, since data transfers
+        need an existing destination table.
+
+        :param source_file: File from which we need to transfer data
+        :param columns: Columns of the file to load
+        :param filters: Predicates the loaded rows must match
+        """
+        return not (columns or filters) or source_file.location.location_type != FileLocation.S3
+
     def load_file_to_table_natively(
         self,
         source_file: File,
         target_table: BaseTable,
         if_exists: LoadExistStrategy = "replace",
         native_support_kwargs: dict | None = None,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
         **kwargs,
     ):
         """
@@ -327,7 +374,21 @@ class BigqueryDatabase(BaseDatabase):
         :param target_table: Table that needs to be populated with file data
         :param if_exists: Overwrite file if exists. Default False
         :param native_support_kwargs: kwargs to be used by method involved in native support flow
+        :param columns: Only load these columns of the file
+        :param filters: Only load the rows matching these ``(column, operator, value)`` predicates
         """
+        if columns or filters:
+            self._load_file_to_table_natively_with_selection(
+                source_file=source_file,
+                target_table=target_table,
+                if_exists=if_exists,
+                native_support_kwargs=native_support_kwargs,
+                columns=columns,
+                filters=filters,
+                **kwargs,
+            )
+            return
+
         method_name = self.NATIVE_PATHS.get(source_file.location.location_type)
         if method_name:
             transfer_method = self.__getattribute__(method_name)
@@ -344,6 +405,59 @@ class BigqueryDatabase(BaseDatabase):
                 f"for {source_file.location.location_type} to bigquery."
             )
 
+    def _load_file_to_table_natively_with_selection(
+        self,
+        source_file: File,
+        target_table: BaseTable,
+        if_exists: LoadExistStrategy = "replace",
+        native_support_kwargs: dict | None = None,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+        **kwargs,
+    ):
+        """
+        Load the file natively to a staging table, and copy the selected columns and rows to the target table with a
+        ``SELECT`` statement run by BigQuery. The staging table is dropped afterwards.
+
+        :param source_file: File from which we need to transfer data
+        :param target_table: Table that needs to be populated with file data
+        :param if_exists: Overwrite table if exists. Default 'replace'
+        :param native_support_kwargs: kwargs to be used by method involved in native support flow
+        :param columns: Only load these columns of the file
+        :param filters: Only load the rows matching these ``(column, operator, value)`` predicates
+        """
+        staging_table = target_table.create_similar_table()
+        try:
+            self.load_file_to_table_natively(
+                source_file=source_file,
+                target_table=staging_table,
+                if_exists="replace",
+                native_support_kwargs=native_support_kwargs,
+                **kwargs,
+            )
+            selected_columns = ", ".join(self._quote_identifier(column) for column in columns or []) or "*"
+            statement = f"SELECT {selected_columns} FROM {self.get_table_qualified_name(staging_table)}"
+            if filters:
+                statement += f" WHERE {render_filters_as_sql(filters, self._quote_identifier)}"
+
+            if if_exists == "replace":
+                self.drop_table(target_table)
+            if self.table_exists(target_table):
+                columns_list = f" ({selected_columns})" if columns else ""
+                self.run_sql(
+                    f"INSERT INTO {self.get_table_qualified_name(target_table)}{columns_list} {statement}"
+                )
+            else:
+                self.create_table_from_select_statement(statement, target_table)
+        finally:
+            self.drop_table(staging_table)
+
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quote a column name as a BigQuery identifier"""
+        escaped_name = name.replace("\\", "\\\\").replace("`", "\\`")
+        return f"`{escaped_name}`"
+
     def load_gs_file_to_table(
         self,
         source_file: File,
@@ -450,6 +564,8 @@ class BigqueryDatabase(BaseDatabase):
             FileType.CSV: "CSV",
             FileType.NDJSON: "JSON",
             FileType.PARQUET: "PARQUET",
+            FileType.AVRO: "AVRO",
+            FileType.ORC: "ORC",
         }
 
         client = self.hook.get_client()
@@ -533,6 +649,8 @@ class S3ToBigqueryDataTransfer:
             FileType.CSV: "CSV",
             FileType.NDJSON: "JSON",
             FileType.PARQUET: "PARQUET",
+            FileType.AVRO: "AVRO",
+            FileType.ORC: "ORC",
         }
         self.s3_file_type = file_types_to_bigquery_format.get(source_file.type.name)
 
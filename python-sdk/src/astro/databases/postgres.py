@@ -200,13 +200,14 @@ class PostgresDatabase(BaseDatabase):
         self.run_sql(sql=sql)
 
     @staticmethod
-    def get_dataframe_from_file(file: File):
+    def get_dataframe_from_file(file: File, **kwargs):
         """
         Get pandas dataframe file
 
         :param file: File path and conn_id for object stores
+        :param kwargs: Options of the file reader, such as ``columns`` and ``filters``
         """
-        return file.export_to_dataframe_via_byte_stream()
+        return file.export_to_dataframe_via_byte_stream(**kwargs)
 
     def openlineage_dataset_name(self, table: BaseTable) -> str:
         """
@@ -5,10 +5,12 @@ import logging
 import os
 import random
 import string
+from contextlib import closing
 from dataclasses import dataclass, field
-from typing import Any, Sequence
+from typing import Any, Iterator, Sequence
 
 import pandas as pd
+import pyarrow as pa
 from airflow.providers.snowflake.hooks.snowflake import SnowflakeHook
 from snowflake.connector import pandas_tools
 from snowflake.connector.errors import (
@@ -36,10 +38,11 @@ from astro.constants import (
     MergeConflictStrategy,
 )
 from astro.databases.base import BaseDatabase
-from astro.exceptions import DatabaseCustomError
-from astro.files import File
+from astro.exceptions import DatabaseCustomError, NonExistentTableException
+from astro.files import File, iter_file_path_pattern
 from astro.settings import LOAD_TABLE_AUTODETECT_ROWS_COUNT, SNOWFLAKE_SCHEMA
 from astro.table import BaseTable, Metadata
+from astro.utils.filters import Filters
 
 DEFAULT_CONN_ID = SnowflakeHook.default_conn_name
 
@@ -47,12 +50,16 @@ ASTRO_SDK_TO_SNOWFLAKE_FILE_FORMAT_MAP = {
     FileType.CSV: "CSV",
     FileType.NDJSON: "JSON",
     FileType.PARQUET: "PARQUET",
+    FileType.AVRO: "AVRO",
+    FileType.ORC: "ORC",
 }
 
 COPY_OPTIONS = {
     FileType.CSV: "ON_ERROR=CONTINUE",
     FileType.NDJSON: "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE",
     FileType.PARQUET: "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE",
+    FileType.AVRO: "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE",
+    FileType.ORC: "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE",
 }
 
 DEFAULT_STORAGE_INTEGRATION = {
@@ -60,10 +67,16 @@ DEFAULT_STORAGE_INTEGRATION = {
     FileLocation.GS: settings.SNOWFLAKE_STORAGE_INTEGRATION_GOOGLE,
 }
 
-NATIVE_LOAD_SUPPORTED_FILE_TYPES = (FileType.CSV, FileType.NDJSON, FileType.PARQUET)
+NATIVE_LOAD_SUPPORTED_FILE_TYPES = (
+    FileType.CSV,
+    FileType.NDJSON,
+    FileType.PARQUET,
+    FileType.AVRO,
+    FileType.ORC,
+)
 NATIVE_LOAD_SUPPORTED_FILE_LOCATIONS = (FileLocation.GS, FileLocation.S3)
 
-NATIVE_AUTODETECT_SCHEMA_SUPPORTED_FILE_TYPES = {FileType.PARQUET}
+NATIVE_AUTODETECT_SCHEMA_SUPPORTED_FILE_TYPES = {FileType.PARQUET, FileType.AVRO, FileType.ORC}
 NATIVE_AUTODETECT_SCHEMA_SUPPORTED_FILE_LOCATIONS = {FileLocation.GS, FileLocation.S3}
 
 COPY_INTO_COMMAND_FAIL_STATUS = "LOAD_FAILED"
@@ -567,12 +580,29 @@ class SnowflakeDatabase(BaseDatabase):
         )
         return is_file_type_supported and is_file_location_supported
 
+    def is_native_load_selection_available(  # skipcq PYL-R0201
+        self,
+        source_file: File,  # skipcq PYL-W0613
+        columns: list[str] | None = None,  # skipcq PYL-W0613
+        filters: Filters | None = None,
+    ) -> bool:
+        """
+        COPY INTO loads a subset of the columns with a column list and a ``SELECT`` transformation of the staged
+        files. Transformations can't filter rows though, so filtered files are loaded with pandas.
+
+        :param source_file: File from which we need to transfer data
+        :param columns: Columns of the file to load
+        :param filters: Predicates the loaded rows must match
+        """
+        return not filters
+
     def load_file_to_table_natively(
         self,
         source_file: File,
         target_table: BaseTable,
         if_exists: LoadExistStrategy = "replace",
         native_support_kwargs: dict | None = None,
+        columns: list[str] | None = None,
         **kwargs,
     ):  # skipcq PYL-W0613
         """
@@ -591,6 +621,7 @@ class SnowflakeDatabase(BaseDatabase):
         :param target_table: Table to which the content of the file will be loaded to
         :param if_exists: Strategy used to load (currently supported: "append" or "replace")
         :param native_support_kwargs: may be used for the stage creation, as described above.
+        :param columns: Only load these columns of the file, using a COPY INTO transformation
 
         .. seealso::
             `Snowflake official documentation on COPY INTO
@@ -603,9 +634,7 @@ class SnowflakeDatabase(BaseDatabase):
         storage_integration = native_support_kwargs.get("storage_integration")
         stage = self.create_stage(file=source_file, storage_integration=storage_integration)
 
-        table_name = self.get_table_qualified_name(target_table)
-        file_path = os.path.basename(source_file.path) or ""
-        sql_statement = f"COPY INTO {table_name} FROM @{stage.qualified_name}/{file_path}"
+        sql_statement = self._get_copy_into_statement(source_file, target_table, stage, columns)
 
         # Below code is added due to breaking change in apache-airflow-providers-snowflake==3.2.0,
         # we need to pass handler param to get the rows. But in version apache-airflow-providers-snowflake==3.1.0
@@ -623,6 +652,56 @@ class SnowflakeDatabase(BaseDatabase):
             self.drop_stage(stage)
         self.evaluate_results(rows)
 
+    def _get_copy_into_statement(
+        self, source_file: File, target_table: BaseTable, stage: SnowflakeStage, columns: list[str] | None
+    ) -> str:
+        """
+        Build the COPY INTO statement loading the staged files to the table, projecting the given columns if any.
+
+        :param source_file: File from which we need to transfer data
+        :param target_table: Table to which the content of the file will be loaded to
+        :param stage: Stage of the file location
+        :param columns: Columns of the file to load
+        """
+        table_name = self.get_table_qualified_name(target_table)
+        file_path = os.path.basename(source_file.path) or ""
+        if not columns:
+            return f"COPY INTO {table_name} FROM @{stage.qualified_name}/{file_path}"
+
+        target_columns, source_columns = self._get_copy_transformation_columns(source_file, columns)
+        return (
+            f"COPY INTO {table_name} ({target_columns}) "
+            f"FROM (SELECT {source_columns} FROM @{stage.qualified_name}/{file_path}) "
+            "MATCH_BY_COLUMN_NAME=NONE"
+        )
+
+    def _get_copy_transformation_columns(self, source_file: File, columns: list[str]) -> tuple[str, str]:
+        """
+        Build the target column list and the ``SELECT`` list of a COPY INTO transformation projecting the given
+        columns of the staged files. Elements of semi-structured files are selected by name, while CSV columns
+        are selected by their position in the header of the first file.
+
+        :param source_file: File from which we need to transfer data
+        :param columns: Columns of the file to load
+        """
+        if source_file.type.name == FileType.CSV:
+            first_file = next(
+                iter_file_path_pattern(source_file.path, source_file.conn_id, filetype=source_file.type.name)
+            )
+            header = list(first_file.export_to_dataframe(nrows=0).columns)
+            missing_columns = [column for column in columns if column not in header]
+            if missing_columns:
+                raise ValueError(f"Columns {missing_columns} are not in the header of {first_file.path}")
+            source_columns = [f"${header.index(column) + 1}" for column in columns]
+        else:
+            source_columns = ['$1:"{}"'.format(column.replace('"', '""')) for column in columns]
+
+        if self.use_quotes(columns):
+            target_columns = ['"{}"'.format(column.replace('"', '""')) for column in columns]
+        else:
+            target_columns = list(columns)
+        return ", ".join(target_columns), ", ".join(source_columns)
+
     @staticmethod
     def evaluate_results(rows):
         """check the error state returned by snowflake when running `copy into` query."""
@@ -672,6 +751,30 @@ class SnowflakeDatabase(BaseDatabase):
             auto_create_table=auto_create_table,
         )
 
+    def export_table_to_record_batches(
+        self, source_table: BaseTable, batch_size: int = DEFAULT_CHUNK_SIZE, select_kwargs: dict | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the content of a table as Arrow record batches, using the Arrow result chunks returned by the
+        Snowflake connector.
+
+        :param source_table: An existing table in the database
+        :param batch_size: Maximum number of rows in each record batch
+        :param select_kwargs: kwargs for select statement
+        """
+        if select_kwargs:
+            yield from super().export_table_to_record_batches(source_table, batch_size, select_kwargs)
+            return
+
+        table_qualified_name = self.get_table_qualified_name(source_table)
+        if not self.table_exists(source_table):
+            raise NonExistentTableException(f"The table {table_qualified_name} does not exist")
+
+        with closing(self.hook.get_conn()) as conn, closing(conn.cursor()) as cursor:
+            cursor.execute("SELECT * FROM IDENTIFIER(%(table_name)s)", {"table_name": table_qualified_name})
+            for table in cursor.fetch_arrow_batches():
+                yield from table.to_batches(max_chunksize=batch_size)
+
     def get_sqlalchemy_template_table_identifier_and_parameter(
         self, table: BaseTable, jinja_table_identifier: str
     ) -> tuple[str, str]:  # skipcq PYL-R0201
@@ -20,6 +20,9 @@ class SqliteDatabase(BaseDatabase):
     logic in other parts of our code-base.
     """
 
+    # SQLite locks the whole database file while writing to it
+    MAX_CONCURRENT_DATAFRAME_LOADS = 1
+
     def __init__(self, conn_id: str = DEFAULT_CONN_ID, table: BaseTable | None = None):
         super().__init__(conn_id)
         self.table = table
@@ -3,7 +3,7 @@ import logging
 import pathlib
 import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from airflow.configuration import conf
 from airflow.exceptions import AirflowException
@@ -16,6 +16,7 @@ from requests.exceptions import HTTPError
 
 from astro.databricks.load_file.load_file_python_code_generator import render
 from astro.databricks.load_options import DeltaLoadOptions
+from astro.utils.filters import Filters, get_columns_to_read, render_filters_as_sql
 
 cwd = pathlib.Path(__file__).parent
 log = logging.getLogger(__name__)
@@ -71,6 +72,8 @@ def generate_file(
     output_file_path: Path,
     load_options: DeltaLoadOptions,
     file_type: str = "",
+    columns: Optional[List[str]] = None,
+    filters: Optional[Filters] = None,
 ):
     """
     In order to run autoloader jobs in databricks, we need to generate a python file that creates a pyspark job.
@@ -84,8 +87,14 @@ def generate_file(
     :param file_type: when using the COPY INTO command, Spark requires explicitly stating the data type you are loading.
         For individual files we can infer the file type, but if you are loading a directory please explicitly state
         the file type in the File object.
+    :param columns: Only load these columns, selected by the COPY INTO command
+    :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates. COPY INTO can't
+        filter rows, so the table is overwritten with the matching rows once loaded
     :return: output file path
     """
+    columns_to_read = get_columns_to_read(columns, filters)
+    where_condition = render_filters_as_sql(filters, _quote_identifier) if filters else ""
+    output_columns = list(columns) if where_condition and columns and columns_to_read != columns else []
     render(
         Path("jinja_templates/load_file_to_delta.py.jinja2"),
         {
@@ -94,6 +103,9 @@ def generate_file(
             "load_options": load_options,
             "input_path": data_source_path,
             "file_type": file_type.upper(),
+            "select_columns": ", ".join(_quote_identifier(column) for column in columns_to_read or []),
+            "where_condition": where_condition,
+            "output_columns": output_columns,
         },
         output_file_path,
     )
@@ -106,6 +118,12 @@ def generate_file(
     return output_file_path
 
 
+def _quote_identifier(name: str) -> str:
+    """Quote a column name as a Spark SQL identifier"""
+    escaped_name = name.replace("`", "``")
+    return f"`{escaped_name}`"
+
+
 def load_file_to_dbfs(local_file_path: Path, file_name: str, api_client: ApiClient) -> Path:
     # TODO we should allow arbitrary dbfs paths set by env vars/users
     """Load a file into DBFS. Used to move a python file into DBFS, so we can run the jobs as pyspark jobs.
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from contextlib import closing
 from textwrap import dedent
+from typing import Iterator
 
 import pandas
+import pyarrow as pa
 from airflow.providers.databricks.hooks.databricks import DatabricksHook
 from airflow.providers.databricks.hooks.databricks_sql import DatabricksSqlHook
 from databricks.sql.client import Cursor
@@ -17,6 +20,7 @@ from astro.databricks.load_options import DeltaLoadOptions
 from astro.files import File
 from astro.options import LoadOptions
 from astro.table import BaseTable, Metadata
+from astro.utils.filters import Filters
 
 
 class DeltaDatabase(BaseDatabase):
@@ -114,6 +118,8 @@ class DeltaDatabase(BaseDatabase):
         columns_names_capitalization: ColumnCapitalization = "original",
         enable_native_fallback: bool | None = None,
         load_options: LoadOptions | None = DeltaLoadOptions.get_default_delta_options(),
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
         databricks_job_name: str = "",
         **kwargs,
     ):
@@ -135,7 +141,8 @@ class DeltaDatabase(BaseDatabase):
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
         :param enable_native_fallback: Use enable_native_fallback=True to fall back to default transfer
-
+        :param columns: Only load these columns of the file, selected by the COPY INTO command
+        :param filters: Only load the rows matching these ``(column, operator, value)`` predicates
         """
         if not load_options:
             load_options = DeltaLoadOptions.get_default_delta_options()
@@ -146,6 +153,8 @@ class DeltaDatabase(BaseDatabase):
             delta_table=output_table,
             databricks_job_name=databricks_job_name,
             delta_load_options=load_options,  # type: ignore
+            columns=columns,
+            filters=filters,
         )
 
     def openlineage_dataset_name(self, table: BaseTable) -> str:
@@ -269,3 +278,22 @@ class DeltaDatabase(BaseDatabase):
             return df
 
         return self.hook.run(f"SELECT * FROM {source_table.name}", handler=convert_delta_table_to_df)
+
+    def export_table_to_record_batches(
+        self, source_table: BaseTable, batch_size: int = DEFAULT_CHUNK_SIZE, select_kwargs: dict | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the content of a delta table as Arrow record batches, fetched in the Arrow format by the
+        Databricks SQL connector.
+
+        :param source_table: Delta table to stream
+        :param batch_size: Maximum number of rows in each record batch
+        :param select_kwargs: Unused in this function
+        """
+        with closing(self.hook.get_conn()) as conn, closing(conn.cursor()) as cursor:
+            cursor.execute(f"SELECT * FROM {source_table.name}")
+            while True:
+                table = cursor.fetchmany_arrow(batch_size)
+                if table.num_rows == 0:
+                    break
+                yield from table.to_batches(max_chunksize=batch_size)
@@ -18,6 +18,7 @@ from astro.databricks.api_utils import (
 from astro.databricks.load_options import DeltaLoadOptions
 from astro.files import File
 from astro.table import BaseTable
+from astro.utils.filters import Filters
 
 cwd = pathlib.Path(__file__).parent
 
@@ -29,6 +30,8 @@ def load_file_to_delta(
     delta_table: BaseTable,
     databricks_job_name: str,
     delta_load_options: DeltaLoadOptions,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
 ):
     """
     Load a file object into a databricks delta table
@@ -37,6 +40,8 @@ def load_file_to_delta(
     :param databricks_job_name: The name of the job as it will show up in databricks.
     :param input_file: File to load into delta
     :param delta_table: a Table object with necessary metadata for accessing the cluster.
+    :param columns: Only load these columns of the file
+    :param filters: Only load the rows matching these ``(column, operator, value)`` predicates
     """
     from astro.databricks.delta import DeltaDatabase
 
@@ -58,7 +63,7 @@ def load_file_to_delta(
 
     with tempfile.NamedTemporaryFile(suffix=".py") as tfile:
         dbfs_file_path = _create_load_file_pyspark_file(
-            api_client, delta_load_options, dbfs_file_path, delta_table, input_file, tfile
+            api_client, delta_load_options, dbfs_file_path, delta_table, input_file, tfile, columns, filters
         )
     try:
         create_and_run_job(
@@ -80,6 +85,8 @@ def _create_load_file_pyspark_file(
     delta_table: BaseTable,
     input_file: File,
     output_file: Any,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
 ):
     file_type = _find_file_type(input_file)
     file_path = generate_file(
@@ -89,6 +96,8 @@ def _create_load_file_pyspark_file(
         output_file_path=Path(output_file.name),
         file_type=file_type or "",
         load_options=databricks_options,
+        columns=columns,
+        filters=filters,
     )
     dbfs_file_path = load_file_to_dbfs(
         file_path, file_name=f"load_file_{delta_table.name}.py", api_client=api_client
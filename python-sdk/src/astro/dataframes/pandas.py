@@ -1,26 +1,81 @@
 from __future__ import annotations
 
+import base64
 import logging
-from typing import ClassVar
+import sys
+from typing import TYPE_CHECKING, ClassVar
 
-from pandas import DataFrame, read_json
+import numpy as np
+import pyarrow as pa
+from lazy_object_proxy import Proxy
+from pandas import DataFrame, Series, read_json
 
 from astro import settings
+from astro.constants import FileType
+
+if TYPE_CHECKING:  # pragma: no cover
+    from astro.files import File
 
 logger = logging.getLogger(__name__)
 
+# Number of values whose size is measured to estimate the memory used by a column of Python objects
+SIZE_ESTIMATE_SAMPLE_SIZE = 100
+
+# Formats of the dataframes stored in the Airflow metadata DB
+JSON_FORMAT = "json"
+ARROW_FORMAT = "arrow"
+
+# File types from which a subset of the columns can be read without parsing the other ones
+COLUMNAR_FILE_TYPES = (FileType.PARQUET, FileType.ARROW, FileType.FEATHER, FileType.ORC)
+
+
+def estimate_memory_usage(df: DataFrame, sample_size: int = SIZE_ESTIMATE_SAMPLE_SIZE) -> int:
+    """
+    Estimate the memory used by a dataframe, in bytes. Unlike ``df.memory_usage(deep=True)``, which measures every
+    Python object, the size of columns of objects (e.g. strings) is extrapolated from evenly spaced values.
+
+    :param df: Dataframe to measure
+    :param sample_size: Number of values measured in each column of objects
+    """
+    size = int(df.memory_usage(index=True, deep=False).sum())
+    row_count = len(df)
+    if not row_count:
+        return size
+    positions = np.unique(np.linspace(0, row_count - 1, num=min(sample_size, row_count), dtype=int))
+    for _, series in df.items():
+        if series.dtype == object:
+            sample = series.iloc[positions]
+            size += int(sum(sys.getsizeof(value) for value in sample) * row_count / len(sample))
+    return size
+
+
+def encode_arrow_table(table: pa.Table) -> str:
+    """Encode an Arrow table as a zstd-compressed Arrow IPC stream, wrapped in base64 to be stored in XCom"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=pa.ipc.IpcWriteOptions(compression="zstd")) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode()
+
+
+def decode_arrow_table(data: str) -> pa.Table:
+    """Decode an Arrow table encoded by ``encode_arrow_table``"""
+    with pa.ipc.open_stream(pa.py_buffer(base64.b64decode(data))) as reader:
+        return reader.read_all()
+
 
 class PandasDataframe(DataFrame):
     """Pandas-compatible dataframe class that can be serialized and deserialized into XCom by Airflow 2.5"""
 
-    version: ClassVar[int] = 1
+    # Version 2 stores small dataframes in the Airflow metadata DB as compressed Arrow IPC streams,
+    # version 1 stored them as JSON
+    version: ClassVar[int] = 2
 
     def serialize(self):
         # Store in the metadata DB if Dataframe < 100 kb
-        df_size = self.memory_usage(deep=True).sum()
+        df_size = estimate_memory_usage(self)
         if df_size < (settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB * 1024):
             logger.info("Dataframe size: %s bytes. Storing it in Airflow's metadata DB", df_size)
-            return {"data": self.to_json()}
+            return self._to_xcom_db_data()
         else:
             # Avoid cyclic dependency
             from astro.utils.dataframe import convert_dataframe_to_file
@@ -33,9 +88,21 @@ class PandasDataframe(DataFrame):
             )
             return convert_dataframe_to_file(self).to_json()
 
+    def _to_xcom_db_data(self) -> dict:
+        """
+        Encode the dataframe as a zstd-compressed Arrow IPC stream, wrapped in base64. The Arrow schema keeps the
+        pandas metadata, so dtypes (e.g. datetimes with time zones, categoricals, nullable integers) and the index
+        are restored as they were. Columns of mixed Python objects, which Arrow can't represent, are stored as JSON.
+        """
+        try:
+            table = pa.Table.from_pandas(self)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return {"format": JSON_FORMAT, "data": self.to_json()}
+        return {"format": ARROW_FORMAT, "data": encode_arrow_table(table)}
+
     @staticmethod
     def deserialize(data: dict, version: int):
-        if version > 1:
+        if version > PandasDataframe.version:
             raise TypeError(f"version > {PandasDataframe.version}")
         if isinstance(data, dict) and data.get("class", "") == "File":
             # Avoid cyclic dependency
@@ -43,11 +110,109 @@ class PandasDataframe(DataFrame):
 
             file = File.from_json(data)
             if file.is_dataframe:
-                logger.info("Retrieving file from %s using %s conn_id ", file.path, file.conn_id)
-                return file.export_to_dataframe()
+                return LazyPandasDataframe.from_file(file)
             return file
+        if data.get("format") == ARROW_FORMAT:
+            return PandasDataframe.from_pandas_df(decode_arrow_table(data["data"]).to_pandas())
         return PandasDataframe.from_pandas_df(read_json(data["data"]))
 
     @classmethod
     def from_pandas_df(cls, df: DataFrame) -> PandasDataframe:
-        return cls(df)
+        """
+        Wrap a dataframe without copying its data: the returned dataframe shares the blocks of ``df``, which is
+        returned as it is if it already is an instance of this class.
+        """
+        if type(df) is cls:  # skipcq: PYL-C0123
+            return df
+        return cls(df, copy=False)
+
+
+class _DataframeFileReader:
+    """Read a dataframe stored in a file, keeping the columns read on their own until the whole file is read"""
+
+    def __init__(self, file: File):
+        self.file = file
+        self.columns: dict[str, Series] = {}
+        self.is_read = False
+
+    def __call__(self) -> PandasDataframe:
+        logger.info("Retrieving file from %s using %s conn_id ", self.file.path, self.file.conn_id)
+        df = PandasDataframe.from_pandas_df(self.file.export_to_dataframe())
+        self.is_read = True
+        self.columns.clear()
+        return df
+
+    def read_columns(self, columns: list[str]) -> PandasDataframe:
+        """
+        Read some columns of the file, only reading the ones which weren't read before.
+
+        :param columns: Names of the columns
+        """
+        missing_columns = [column for column in columns if column not in self.columns]
+        if missing_columns:
+            df = self.file.export_to_dataframe(columns=missing_columns)
+            self.columns.update((column, df[column]) for column in missing_columns)
+        return PandasDataframe({column: self.columns[column] for column in columns})
+
+
+class LazyPandasDataframe(Proxy):
+    """
+    Dataframe stored in a file (e.g. a large dataframe pulled from XCom), which is only read when its content is
+    first accessed. It is a proxy to the dataframe read from the file, passing for a ``PandasDataframe`` to
+    ``isinstance`` checks. Until the file is read, selecting columns of a columnar file (e.g. ``df[["id", "name"]]``)
+    only reads these columns, once, and serializing the dataframe (e.g. when a task forwards it) returns the reference
+    to the file.
+    """
+
+    @classmethod
+    def from_file(cls, file: File) -> LazyPandasDataframe:
+        """
+        Create a dataframe whose content will be read from a file.
+
+        :param file: File holding the dataframe
+        """
+        return cls(_DataframeFileReader(file))
+
+    @property  # type: ignore[misc]
+    def __class__(self):
+        # Checking the type of the dataframe doesn't read the file
+        return PandasDataframe
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the content of the file was read"""
+        return bool(self.__factory__.is_read)
+
+    def load(self, columns: list[str] | None = None) -> PandasDataframe:
+        """
+        Read the content of the dataframe.
+
+        :param columns: Only read these columns. The dataframe itself is then left unread.
+        """
+        if columns is None:
+            return PandasDataframe.from_pandas_df(self.__wrapped__)
+        if self.is_materialized:
+            return PandasDataframe.from_pandas_df(self.__wrapped__[columns])
+        reader: _DataframeFileReader = self.__factory__
+        return reader.read_columns(list(dict.fromkeys(columns)))
+
+    def __getitem__(self, key):
+        is_column_selection = isinstance(key, str) or (
+            isinstance(key, list) and key and all(isinstance(column, str) for column in key)
+        )
+        if (
+            is_column_selection
+            and not self.is_materialized
+            and self.__factory__.file.type.name in COLUMNAR_FILE_TYPES
+        ):
+            try:
+                return self.load(columns=[key] if isinstance(key, str) else key)[key]
+            except (KeyError, ValueError):
+                # Missing columns are reported by pandas, once the whole file is read
+                pass
+        return self.__wrapped__[key]
+
+    def serialize(self):
+        if not self.is_materialized:
+            return self.__factory__.file.to_json()
+        return self.__wrapped__.serialize()
@@ -0,0 +1,128 @@
+"""
+Parallel execution of a dataframe function over partitions of its input, in a pool of processes.
+
+Partitions and results are sent between processes as Arrow IPC streams rather than pickled dataframes, which costs a
+single copy of the column buffers. The workers are started with ``settings.DATAFRAME_PARALLELISM_START_METHOD``. The
+function is sent to them pickled by value with dill, so that functions which can't be pickled by reference (e.g. the
+ones decorated with ``aql.dataframe``, or lambdas) can be run, unless the workers are forked and inherit it.
+"""
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+import dill
+import pandas as pd
+import pyarrow as pa
+
+from astro import settings
+
+# Function called by the workers of the pool, set when they start
+_worker_function: Callable[[pd.DataFrame], Any] | None = None
+
+
+def encode_dataframe(df: pd.DataFrame) -> bytes | pd.DataFrame:
+    """
+    Encode a dataframe as an Arrow IPC stream, keeping its dtypes and index. Dataframes with columns of mixed Python
+    objects, which Arrow can't represent, are returned as they are, to be pickled.
+    """
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    data: bytes = sink.getvalue().to_pybytes()
+    return data
+
+
+def decode_dataframe(data: bytes | pd.DataFrame) -> pd.DataFrame:
+    """Decode a dataframe encoded by ``encode_dataframe``"""
+    if isinstance(data, pd.DataFrame):
+        return data
+    with pa.ipc.open_stream(pa.py_buffer(data)) as reader:
+        df: pd.DataFrame = reader.read_all().to_pandas()
+    return df
+
+
+def partition_by_key(df: pd.DataFrame, keys: list[str], partition_count: int) -> Iterator[pd.DataFrame]:
+    """
+    Split a dataframe in partitions by the hash of some of its columns, so that the rows sharing the same values
+    of these columns are in the same partition. Empty partitions are skipped.
+
+    :param df: Dataframe to split
+    :param keys: Columns whose values are hashed
+    :param partition_count: Number of partitions
+    """
+    partition_ids = pd.util.hash_pandas_object(df[keys], index=False).to_numpy() % partition_count
+    for partition_id in range(partition_count):
+        partition = df[partition_ids == partition_id]
+        if not partition.empty:
+            yield partition
+
+
+def _initialize_worker(function: Callable[[pd.DataFrame], Any] | bytes) -> None:
+    global _worker_function  # skipcq: PYL-W0603
+    _worker_function = dill.loads(function) if isinstance(function, bytes) else function
+
+
+def _call_on_partition(data: bytes | pd.DataFrame) -> Any:
+    """Call the function of the worker on a partition, encoding the dataframe it returns"""
+    output = _worker_function(decode_dataframe(data))  # type: ignore
+    return encode_dataframe(output) if isinstance(output, pd.DataFrame) else output
+
+
+def _get_multiprocessing_context() -> multiprocessing.context.BaseContext:
+    """Return the context starting the workers with the configured start method"""
+    mp_context: multiprocessing.context.BaseContext = multiprocessing.get_context(
+        settings.DATAFRAME_PARALLELISM_START_METHOD
+    )
+    return mp_context
+
+
+def _get_worker_function(
+    function: Callable[[pd.DataFrame], Any], mp_context: multiprocessing.context.BaseContext
+) -> Callable[[pd.DataFrame], Any] | bytes:
+    """Return the function as forked workers inherit it, or pickled by value for the workers to unpickle"""
+    if mp_context.get_start_method() == "fork":
+        return function
+    data: bytes = dill.dumps(function, recurse=True)
+    return data
+
+
+def map_partitions(
+    function: Callable[[pd.DataFrame], Any], partitions: Iterable[pd.DataFrame], max_workers: int
+) -> Iterator[Any]:
+    """
+    Call a function on each partition in a pool of processes, yielding the results in the order of the partitions.
+    At most ``2 * max_workers`` partitions are sent to the pool ahead of the result being yielded, so that only a
+    few partitions are held in memory when they are read from a stream.
+
+    :param function: Function called with each partition
+    :param partitions: Dataframes to call the function with
+    :param max_workers: Number of processes of the pool
+    """
+    partitions = iter(partitions)
+    mp_context = _get_multiprocessing_context()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+        initargs=(_get_worker_function(function, mp_context),),
+    ) as executor:
+        pending: deque[Future] = deque()
+
+        def submit_next() -> None:
+            partition = next(partitions, None)
+            if partition is not None:
+                pending.append(executor.submit(_call_on_partition, encode_dataframe(partition)))
+
+        for _ in range(2 * max_workers):
+            submit_next()
+        while pending:
+            output = pending.popleft().result()
+            submit_next()
+            yield decode_dataframe(output) if isinstance(output, (bytes, pd.DataFrame)) else output
@@ -0,0 +1,374 @@
+"""
+Storage of the dataframes which are too large for the Airflow metadata DB (see ``PandasDataframe.serialize``).
+
+Dataframes stored by a task are laid out as ``<xcom_storage_url>/<dag_id>/<run_id>/<task_id>/<name>.parquet``
+(mapped task instances use ``<task_id>__<map_index>``), and every task records the files it stored in the
+``_manifest.json`` file of its directory. Once a DAG run is finished, or older than a retention period, all its files
+can be deleted with ``DataframeStorage.cleanup``, the ``DataframeStorageCleanupOperator``, or the command line:
+
+.. code-block:: bash
+
+   python -m astro.dataframes.storage --max-age-days 7
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import shutil
+import string
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
+from urllib.parse import urlparse
+
+import pandas as pd
+import pyarrow as pa
+import smart_open
+from airflow.exceptions import AirflowException
+from airflow.models.dagrun import DagRun
+from airflow.utils.state import DagRunState
+from attr import define
+
+from astro import settings
+from astro.constants import FileLocation, FileType
+from astro.files import File
+from astro.files.locations import create_file_location
+from astro.files.locations.base import BaseFileLocation
+from astro.files.types import create_file_type
+from astro.utils.typing_compat import Context
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_manifest.json"
+# Directory of a DAG run holding the deduplicated dataframes shared by its tasks
+CONTENT_DIRECTORY_NAME = "_content"
+# Size of the blocks read when hashing a stored dataframe
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# States of the DAG runs whose dataframes are no longer needed
+FINISHED_DAG_RUN_STATES = (DagRunState.SUCCESS, DagRunState.FAILED)
+
+
+@define
+class StoredRun:
+    """
+    DAG run which stored dataframes.
+
+    :param dag_id: ID of the DAG
+    :param run_id: ID of the DAG run
+    :param path: Directory holding the dataframes stored by the tasks of the DAG run, ending with a slash
+    """
+
+    dag_id: str
+    run_id: str
+    path: str
+
+
+def _generate_name() -> str:
+    return random.choice(string.ascii_lowercase) + "".join(
+        random.choice(string.ascii_lowercase + string.digits) for _ in range(64)
+    )
+
+
+def _get_directory_name(path: str) -> str:
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _list_subdirectories(location: BaseFileLocation, directory: str) -> list[str]:
+    """List the subdirectories of a directory, skipping the local ones which can't be read"""
+    try:
+        return location.list_directory(directory)[0]
+    except PermissionError:
+        return []
+
+
+def _get_current_context() -> Context | None:
+    """Return the context of the task being run, if any"""
+    from airflow.operators.python import get_current_context
+
+    try:
+        context: Context = get_current_context()
+    except AirflowException:
+        return None
+    return context
+
+
+class DataframeStorage:
+    """
+    Store dataframes as Parquet files under a directory of an object store, and delete them once their DAG run
+    no longer needs them.
+
+    :param url: Directory holding the dataframes. Defaults to ``settings.DATAFRAME_STORAGE_URL``
+    :param conn_id: Airflow connection used to access it. Defaults to ``settings.DATAFRAME_STORAGE_CONN_ID``
+    """
+
+    def __init__(self, url: str | None = None, conn_id: str | None = None):
+        if url is None:
+            url = settings.DATAFRAME_STORAGE_URL
+            conn_id = conn_id or settings.DATAFRAME_STORAGE_CONN_ID
+        self.url = url.rstrip("/")
+        self.conn_id = conn_id
+
+    def get_run_directory(self, dag_id: str, run_id: str) -> str:
+        """Return the directory of the dataframes stored by a DAG run, ending with a slash"""
+        return f"{self.url}/{dag_id}/{run_id}/"
+
+    def get_task_directory(self, dag_id: str, run_id: str, task_id: str, map_index: int = -1) -> str:
+        """Return the directory of the dataframes stored by a task instance, ending with a slash"""
+        task_directory = task_id if map_index < 0 else f"{task_id}__{map_index}"
+        return f"{self.get_run_directory(dag_id, run_id)}{task_directory}/"
+
+    def store_dataframe(
+        self, df: pd.DataFrame, context: Context | None = None, deduplicate: bool | None = None
+    ) -> File:
+        """
+        Write a dataframe to a new Parquet file, in the directory of the task instance being run. Dataframes
+        stored outside of a task are written at the root of the storage, and can't be cleaned up by DAG run.
+
+        :param df: Dataframe to store
+        :param context: Context of the task instance. Defaults to the one of the task being run
+        :param deduplicate: Write the dataframe to a file named after the hash of its content, shared by the tasks
+            of the DAG run which store identical dataframes. Defaults to ``settings.DATAFRAME_STORAGE_DEDUPLICATION``
+        """
+        if deduplicate is None:
+            deduplicate = settings.DATAFRAME_STORAGE_DEDUPLICATION
+        ti = self._get_task_instance(context)
+        directory = self._get_output_directory(ti)
+        self._create_local_directory(directory)
+        if deduplicate:
+            content_directory = (
+                f"{self.url}/" if ti is None else self.get_run_directory(ti.dag_id, ti.run_id)
+            ) + f"{CONTENT_DIRECTORY_NAME}/"
+            self._create_local_directory(content_directory)
+            file = self._store_deduplicated_dataframe(df, content_directory)
+        else:
+            file = File(
+                path=f"{directory}{_generate_name()}.parquet",
+                conn_id=self.conn_id,
+                filetype=FileType.PARQUET,
+                is_dataframe=True,
+            )
+            file.create_from_dataframe(df)
+        if ti is not None:
+            self._record_file(directory, file, ti)
+        return file
+
+    def store_arrow_table(self, table: pa.Table, context: Context | None = None) -> File:
+        """
+        Write an Arrow table to a new Parquet file, in the directory of the task instance being run, without
+        converting it to a dataframe first.
+
+        :param table: Arrow table to store
+        :param context: Context of the task instance. Defaults to the one of the task being run
+        """
+        ti = self._get_task_instance(context)
+        directory = self._get_output_directory(ti)
+        self._create_local_directory(directory)
+        file = File(
+            path=f"{directory}{_generate_name()}.parquet",
+            conn_id=self.conn_id,
+            filetype=FileType.PARQUET,
+        )
+        file.create_from_record_batches(table.to_batches())
+        if ti is not None:
+            self._record_file(directory, file, ti)
+        return file
+
+    @staticmethod
+    def _get_task_instance(context: Context | None) -> Any:
+        context = context or _get_current_context()
+        return context["ti"] if context else None
+
+    def _get_output_directory(self, ti: Any) -> str:
+        """Return the directory of the files stored by a task instance, or the root of the storage outside tasks"""
+        if ti is None:
+            return f"{self.url}/"
+        return self.get_task_directory(ti.dag_id, ti.run_id, ti.task_id, getattr(ti, "map_index", -1))
+
+    def _create_local_directory(self, directory: str) -> None:
+        """Create a directory of the storage, if it is local. Object stores have no directories."""
+        if create_file_location(directory, self.conn_id).location_type == FileLocation.LOCAL:
+            os.makedirs(urlparse(directory).path, exist_ok=True)
+
+    def _store_deduplicated_dataframe(self, df: pd.DataFrame, directory: str) -> File:
+        """
+        Write a dataframe to a file named after the SHA-256 hash of its Parquet content, unless a previous task
+        already wrote it. The Parquet file is first written to a local temporary file, to be hashed.
+        """
+        with tempfile.TemporaryFile() as buffer:
+            create_file_type(path="", filetype=FileType.PARQUET).create_from_dataframe(df=df, stream=buffer)
+            buffer.seek(0)
+            content_hash = hashlib.sha256()
+            for block in iter(lambda: buffer.read(HASH_BLOCK_SIZE), b""):
+                content_hash.update(block)
+            file = File(
+                path=f"{directory}{content_hash.hexdigest()}.parquet",
+                conn_id=self.conn_id,
+                filetype=FileType.PARQUET,
+                is_dataframe=True,
+            )
+            if file.exists():
+                logger.info("Dataframe already stored in %s", file.path)
+            else:
+                buffer.seek(0)
+                file.create_from_stream(buffer)
+        return file
+
+    def _record_file(self, directory: str, file: File, ti: Any) -> None:
+        """Add a stored file to the manifest of the directory of its task instance"""
+        manifest_path = directory + MANIFEST_NAME
+        manifest = self._read_manifest(manifest_path) or {
+            "dag_id": ti.dag_id,
+            "run_id": ti.run_id,
+            "task_id": ti.task_id,
+            "map_index": getattr(ti, "map_index", -1),
+            "files": [],
+        }
+        manifest["files"].append({"path": file.path, "created_at": datetime.now(timezone.utc).isoformat()})
+        transport_params = create_file_location(manifest_path, self.conn_id).transport_params
+        with smart_open.open(manifest_path, mode="w", transport_params=transport_params) as stream:
+            json.dump(manifest, stream)
+
+    def _read_manifest(self, path: str) -> dict | None:
+        location = create_file_location(path, self.conn_id)
+        if not location.exists():
+            return None
+        with smart_open.open(path, mode="r", transport_params=location.transport_params) as stream:
+            manifest: dict = json.load(stream)
+        return manifest
+
+    def iter_manifests(self, run: StoredRun) -> Iterator[dict]:
+        """Read the manifests of the task instances of a DAG run"""
+        location = create_file_location(run.path, self.conn_id)
+        for file in location.iter_files(suffix=MANIFEST_NAME):
+            manifest = self._read_manifest(file.path)
+            if manifest is not None:
+                yield manifest
+
+    def iter_runs(self, dag_id: str | None = None) -> Iterator[StoredRun]:
+        """
+        List the DAG runs which stored dataframes, from the directories of the storage. Only the directories
+        holding manifests are listed, so that unrelated directories (e.g. of the default temporary directory)
+        are never cleaned up.
+
+        :param dag_id: Only list the runs of this DAG
+        """
+        location = create_file_location(self.url + "/", self.conn_id)
+        if not location.supports_directory_listing:
+            return
+        for dag_directory in _list_subdirectories(location, self.url + "/"):
+            directory_dag_id = _get_directory_name(dag_directory)
+            if dag_id is not None and directory_dag_id != dag_id:
+                continue
+            for run_directory in _list_subdirectories(location, dag_directory):
+                task_directories = _list_subdirectories(location, run_directory)
+                if any(
+                    create_file_location(task_directory + MANIFEST_NAME, self.conn_id).exists()
+                    for task_directory in task_directories
+                ):
+                    yield StoredRun(
+                        dag_id=directory_dag_id,
+                        run_id=_get_directory_name(run_directory),
+                        path=run_directory,
+                    )
+
+    def is_expired(
+        self, run: StoredRun, dag_run: DagRun | None, delete_finished: bool, max_age: timedelta | None
+    ) -> bool:
+        """
+        Whether the dataframes stored by a DAG run can be deleted: the run no longer exists in the Airflow DB,
+        it is finished (if ``delete_finished``), or it stored its last dataframe more than ``max_age`` ago.
+        """
+        if dag_run is None:
+            return True
+        if delete_finished and dag_run.state in FINISHED_DAG_RUN_STATES:
+            return True
+        if max_age is None:
+            return False
+        created_at = [
+            datetime.fromisoformat(entry["created_at"])
+            for manifest in self.iter_manifests(run)
+            for entry in manifest["files"]
+        ]
+        return bool(created_at) and max(created_at) < datetime.now(timezone.utc) - max_age
+
+    def delete_run(self, run: StoredRun) -> int:
+        """
+        Delete all the files stored by a DAG run, with batched requests.
+
+        :return: Number of deleted files
+        """
+        location = create_file_location(run.path, self.conn_id)
+        paths = [file.path for file in location.iter_files()]
+        if paths:
+            location.delete_files(paths)
+        if location.location_type == FileLocation.LOCAL:
+            # Object stores have no directories, local ones are removed so that they are no longer listed
+            shutil.rmtree(urlparse(run.path).path, ignore_errors=True)
+        logger.info("Deleted %s files stored by %s/%s", len(paths), run.dag_id, run.run_id)
+        return len(paths)
+
+    def cleanup(
+        self,
+        dag_id: str | None = None,
+        delete_finished: bool = True,
+        max_age: timedelta | None = None,
+        dry_run: bool = False,
+    ) -> list[StoredRun]:
+        """
+        Delete the dataframes of the DAG runs which no longer need them (see ``is_expired``).
+
+        :param dag_id: Only clean up the runs of this DAG
+        :param delete_finished: Delete the dataframes of the succeeded and failed DAG runs. Dataframes pulled from
+            XCom when tasks of these runs are cleared can no longer be read.
+        :param max_age: Delete the dataframes of the DAG runs which stored their last dataframe before that
+        :param dry_run: Only list the DAG runs whose dataframes would be deleted
+        :return: The DAG runs whose dataframes were deleted
+        """
+        expired_runs = []
+        for run in self.iter_runs(dag_id):
+            dag_runs = DagRun.find(dag_id=run.dag_id, run_id=run.run_id)
+            if self.is_expired(run, dag_runs[0] if dag_runs else None, delete_finished, max_age):
+                expired_runs.append(run)
+                if not dry_run:
+                    self.delete_run(run)
+        return expired_runs
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Delete the dataframes stored by finished or expired DAG runs"""
+    parser = argparse.ArgumentParser(
+        prog="python -m astro.dataframes.storage",
+        description="Delete the dataframes stored in xcom_storage_url by finished or expired DAG runs.",
+    )
+    parser.add_argument("--url", help="Directory holding the dataframes. Defaults to xcom_storage_url")
+    parser.add_argument(
+        "--conn-id", help="Airflow connection of the directory. Defaults to xcom_storage_conn_id"
+    )
+    parser.add_argument("--dag-id", help="Only clean up the runs of this DAG")
+    parser.add_argument(
+        "--max-age-days", type=float, help="Also delete the dataframes of runs older than this number of days"
+    )
+    parser.add_argument(
+        "--keep-finished", action="store_true", help="Keep the dataframes of succeeded and failed runs"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only list the runs which would be cleaned up")
+    args = parser.parse_args(argv)
+
+    storage = DataframeStorage(url=args.url, conn_id=args.conn_id)
+    runs = storage.cleanup(
+        dag_id=args.dag_id,
+        delete_finished=not args.keep_finished,
+        max_age=timedelta(days=args.max_age_days) if args.max_age_days is not None else None,
+        dry_run=args.dry_run,
+    )
+    for run in runs:
+        print(f"{'Would delete' if args.dry_run else 'Deleted'} {run.path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
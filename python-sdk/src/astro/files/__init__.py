@@ -1,6 +1,10 @@
 from typing import TYPE_CHECKING
 
-from astro.files.base import File, resolve_file_path_pattern  # noqa: F401 # skipcq: PY-W2000
+from astro.files.base import (  # noqa: F401 # skipcq: PY-W2000
+    File,
+    iter_file_path_pattern,
+    resolve_file_path_pattern,
+)
 
 if TYPE_CHECKING:
     from airflow.models.xcom_arg import XComArg
@@ -2,17 +2,38 @@ from __future__ import annotations
 
 import io
 import pathlib
+import shutil
+from typing import IO, BinaryIO, Callable, Iterable, Iterator, cast
+from urllib.parse import urlparse
 
 import pandas as pd
+import pyarrow as pa
 import smart_open
 from airflow.utils.log.logging_mixin import LoggingMixin
 from attr import define, field
 
-from astro import constants
+from astro import constants, settings
 from astro.airflow.datasets import Dataset
+from astro.dataframes.pandas import PandasDataframe
 from astro.files.locations import create_file_location
-from astro.files.locations.base import BaseFileLocation
+from astro.files.locations.base import BaseFileLocation, FileMetadata
+from astro.files.sharding import SHARDED_READ_OPTIONS, ShardedFileReader
 from astro.files.types import FileType, create_file_type
+from astro.files.types.base import WritableStream
+from astro.utils.filters import Filters, match_partition_values
+
+
+class _FileCache(dict):
+    """
+    Objects derived from a File, indexed by the attributes they were built from. The cache is neither pickled
+    nor deep-copied, since it may hold clients bound to the current process (e.g. boto3 clients).
+    """
+
+    def __reduce__(self):
+        return self.__class__, ()
+
+    def __deepcopy__(self, memo):
+        return self.__class__()
 
 
 @define
@@ -25,6 +46,8 @@ class File(LoggingMixin, Dataset):
     :param conn_id: Airflow connection ID
     :param filetype: constant to provide an explicit file type
     :param normalize_config: parameters in dict format of pandas json_normalize() function.
+    :param hive_partitioning: Whether the path is the directory of a Hive-partitioned dataset
+        (e.g. ``<path>/dt=2024-01-01/region=eu/part-0.csv``), whose partition values are added as columns
     """
 
     path: str
@@ -33,26 +56,72 @@ class File(LoggingMixin, Dataset):
     normalize_config: dict | None = None
     is_dataframe: bool = False
     is_bytes: bool = False
+    hive_partitioning: bool = False
 
     uri: str = field(init=False)
     extra: dict | None = field(init=False, factory=dict)
+    # Metadata returned when the file was listed, which saves a metadata request per file
+    _listing_metadata: FileMetadata | None = field(init=False, default=None, eq=False, repr=False)
+    _cache: _FileCache = field(init=False, factory=_FileCache, eq=False, repr=False)
+    # Values of the partition columns, when the file was listed as part of a Hive-partitioned dataset
+    _partition_values: dict[str, str | None] | None = field(init=False, default=None, eq=False, repr=False)
 
     template_fields = (
         "path",
         "conn_id",
     )
 
+    @classmethod
+    def from_listing(
+        cls, metadata: FileMetadata, partition_values: dict[str, str | None] | None = None, **kwargs
+    ) -> File:
+        """
+        Create a File from the metadata returned when it was listed, which saves a metadata request per file.
+
+        :param metadata: Metadata of the file, returned by ``BaseFileLocation.iter_files``
+        :param partition_values: Values of the partition columns, when the file was listed as part of a
+            Hive-partitioned dataset
+        :param kwargs: Other attributes of the file (e.g. ``conn_id``, ``filetype``)
+        """
+        file = cls(path=metadata.path, **kwargs)
+        file._listing_metadata = metadata
+        file._partition_values = partition_values
+        return file
+
     @property
     def location(self) -> BaseFileLocation:
-        return create_file_location(self.path, self.conn_id)
+        key = (self.path, self.conn_id)
+        location: BaseFileLocation | None
+        cached_key, location = self._cache.get("location", (None, None))
+        if location is None or cached_key != key:
+            location = create_file_location(self.path, self.conn_id)
+            self._cache["location"] = (key, location)
+        return location
 
     @property
     def type(self) -> FileType:  # noqa: A003
-        return create_file_type(
-            path=self.path,
-            filetype=self.filetype,
-            normalize_config=self.normalize_config,
-        )
+        key = (self.path, self.filetype, self.normalize_config)
+        file_type: FileType | None
+        cached_key, file_type = self._cache.get("type", (None, None))
+        if file_type is None or cached_key != key:
+            file_type = create_file_type(
+                path=self.path,
+                filetype=self.filetype,
+                normalize_config=self.normalize_config,
+            )
+            self._cache["type"] = (key, file_type)
+        return file_type
+
+    @property
+    def transport_params(self) -> dict | None:
+        """Parameters used by smart_open to access the file, built once per location"""
+        location = self.location
+        transport_params: dict | None
+        cached_location, transport_params = self._cache.get("transport_params", (None, None))
+        if cached_location is not location:
+            transport_params = location.transport_params
+            self._cache["transport_params"] = (location, transport_params)
+        return transport_params
 
     @property
     def size(self) -> int:
@@ -61,6 +130,9 @@ class File(LoggingMixin, Dataset):
 
         :return: File size in bytes
         """
+        metadata = self._listing_metadata
+        if metadata is not None and metadata.path == self.path and metadata.size is not None:
+            return metadata.size
         size: int = self.location.size
         return size
 
@@ -70,7 +142,7 @@ class File(LoggingMixin, Dataset):
 
         :return: True or False
         """
-        result: bool = self.type.name == constants.FileType.PARQUET
+        result: bool = self.type.is_binary
         return result
 
     def is_local(self) -> bool:
@@ -96,8 +168,43 @@ class File(LoggingMixin, Dataset):
         :param df: pandas dataframe
         """
         self.is_dataframe = store_as_dataframe
-        with smart_open.open(self.path, mode="wb", transport_params=self.location.transport_params) as stream:
+        with self._open_write_stream() as stream:
             self.type.create_from_dataframe(stream=stream, df=df)
+        self._forget_metadata()
+
+    def create_from_record_batches(self, batches: Iterable[pa.RecordBatch]) -> None:
+        """Create a file in the desired location by writing Arrow record batches, one at a time.
+
+        :param batches: Record batches sharing the same schema
+        """
+        with self._open_write_stream() as stream:
+            self.type.write_record_batches(batches, stream)
+        self._forget_metadata()
+
+    def create_from_stream(self, source: IO[bytes]) -> None:
+        """Create a file in the desired location by copying the content of a binary stream, e.g. a file
+        already written to a local temporary file.
+
+        :param source: Binary stream, read from its current position
+        """
+        with self._open_write_stream() as stream:
+            shutil.copyfileobj(source, stream)
+        self._forget_metadata()
+
+    def _forget_metadata(self) -> None:
+        """Discard the metadata known about the file, once it has been written to"""
+        self._listing_metadata = None
+        self.location.invalidate_metadata_cache()
+
+    def _open_write_stream(self) -> WritableStream:
+        """
+        Open a binary stream to write the file. Object stores which support it (S3, GCS) receive the content
+        as parts uploaded concurrently, other locations are written through smart_open.
+        """
+        if self.location.supports_parallel_upload:
+            return self.location.open_parallel_upload_stream()
+        stream: BinaryIO = smart_open.open(self.path, mode="wb", transport_params=self.transport_params)
+        return stream
 
     @property
     def openlineage_dataset_namespace(self) -> str:
@@ -117,24 +224,180 @@ class File(LoggingMixin, Dataset):
 
     def export_to_dataframe(self, **kwargs) -> pd.DataFrame:
         """Read file from all supported location and convert them into dataframes."""
-        mode = "rb" if self.is_binary() else "r"
-        with smart_open.open(self.path, mode=mode, transport_params=self.location.transport_params) as stream:
+        return self._read_with_partition_columns(self._export_to_dataframe, **kwargs)
+
+    def _export_to_dataframe(self, **kwargs) -> pd.DataFrame:
+        if self._is_sharded_read_available(**kwargs):
+            dataframes = ShardedFileReader(self).iter_dataframes(**kwargs)
+            return PandasDataframe.from_pandas_df(pd.concat(list(dataframes), ignore_index=True))
+        with self._open_read_stream() as stream:
             return self.type.export_to_dataframe(stream, **kwargs)
 
+    @property
+    def supports_chunked_reads(self) -> bool:
+        """
+        Whether ``export_to_dataframe_chunks`` reads the file a chunk at a time: either the file type parses it
+        incrementally, or the file is big enough to be parsed in byte ranges by a pool of processes
+        """
+        return self.type.supports_chunked_reads or self._is_sharded_read_available()
+
+    def _is_sharded_read_available(self, **kwargs) -> bool:
+        """
+        Whether the file is split into byte ranges parsed in parallel (see ``astro.files.sharding``). Only files
+        bigger than ``settings.SHARDED_READ_MIN_SIZE`` are, when the reader options support it.
+
+        :param kwargs: Options of the file type reader
+        """
+        options = {key for key, value in kwargs.items() if value is not None}
+        return (
+            settings.SHARDED_READ_MIN_SIZE > 0
+            and settings.SHARDED_READ_MAX_WORKERS > 1
+            and options <= SHARDED_READ_OPTIONS
+            and self.type.supports_sharded_reads
+            and self.location.supports_ranged_reads
+            and self.size >= settings.SHARDED_READ_MIN_SIZE
+        )
+
+    def export_to_dataframe_chunks(
+        self, chunk_size: int = constants.DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Read file from all supported locations as a sequence of dataframes. File types which support chunked
+        reads (see ``FileType.supports_chunked_reads``) hold at most ``chunk_size`` rows in memory at a time,
+        large files which can be split into byte ranges are read a byte range at a time, and the other ones are
+        read as a single dataframe.
+
+        :param chunk_size: Maximum number of rows in each dataframe
+        """
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+        selection = self._get_file_selection(columns, filters)
+        if self._is_sharded_read_available(**selection, **kwargs):
+            for df in ShardedFileReader(self).iter_dataframes(**selection, **kwargs):
+                yield self._add_partition_columns(
+                    df, columns, filters, kwargs.get("columns_names_capitalization", "original")
+                )
+            return
+        with self._open_read_stream() as stream:
+            for df in self.type.export_to_dataframe_chunks(
+                stream, chunk_size=chunk_size, **selection, **kwargs
+            ):
+                yield self._add_partition_columns(
+                    df, columns, filters, kwargs.get("columns_names_capitalization", "original")
+                )
+
+    def _read_with_partition_columns(self, read: Callable[..., pd.DataFrame], **kwargs) -> pd.DataFrame:
+        """
+        Read the file into a dataframe, adding the partition columns of the Hive-partitioned dataset it was
+        listed from. Projections and predicates on the partition columns are resolved from the partition values,
+        the other ones are given to the file reader.
+
+        :param read: Function reading the file into a dataframe, given the options of the file type reader
+        """
+        if self._partition_values is None:
+            return read(**kwargs)
+
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+        df = read(**self._get_file_selection(columns, filters), **kwargs)
+        return self._add_partition_columns(
+            df, columns, filters, kwargs.get("columns_names_capitalization", "original")
+        )
+
+    def _get_file_selection(self, columns: list[str] | None, filters: Filters | None) -> dict:
+        """Return the ``columns`` and ``filters`` given to the file type reader, without the partition columns"""
+        partition_values = self._partition_values
+        if partition_values is None:
+            return {"columns": columns, "filters": filters}
+        file_columns = None
+        if columns is not None:
+            # If only partition columns are selected, the file is still read to know its number of rows
+            file_columns = [column for column in columns if column not in partition_values] or None
+        file_filters = [predicate for predicate in filters or [] if predicate[0] not in partition_values]
+        return {"columns": file_columns, "filters": file_filters or None}
+
+    def _add_partition_columns(
+        self,
+        df: pd.DataFrame,
+        columns: list[str] | None,
+        filters: Filters | None,
+        columns_names_capitalization: constants.ColumnCapitalization,
+    ) -> pd.DataFrame:
+        """Add the partition columns to a dataframe read from the file, and resolve the selection made on them"""
+        partition_values = self._partition_values
+        if partition_values is None:
+            return df
+        if not match_partition_values(partition_values, filters):
+            df = df.iloc[0:0].copy()
+        # Partition values are kept as the strings written in the paths, e.g. "0012" isn't read as 12, so that a
+        # column has the same type whichever file it is read from
+        for column, value in partition_values.items():
+            df[_capitalize_column_name(column, columns_names_capitalization)] = value
+        if columns is not None:
+            df = df[[_capitalize_column_name(column, columns_names_capitalization) for column in columns]]
+        return df
+
+    def export_to_record_batches(
+        self, batch_size: int = constants.DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Read file from all supported locations as a stream of Arrow record batches.
+
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        with self._open_read_stream() as stream:
+            yield from self.type.read_record_batches(stream, batch_size=batch_size, **kwargs)
+
+    def _open_read_stream(self) -> IO | io.IOBase:
+        """
+        Open the file for reading, as a memory map where the location supports it, or through smart_open.
+        Files whose type reads them whole are buffered instead, large objects being downloaded using concurrent
+        requests. Binary files are opened in binary mode, the other ones in text mode.
+        """
+        if self.location.supports_memory_map or self.type.reads_whole_file:
+            return self._convert_remote_file_to_byte_stream()
+        mode = "rb" if self.is_binary() else "r"
+        stream: IO = smart_open.open(self.path, mode=mode, transport_params=self.transport_params)
+        return stream
+
+    def _open_memory_map(self) -> io.IOBase:
+        """
+        Open a file whose location supports it as a read-only memory map. Binary files are returned as
+        zero-copy pyarrow buffers, text files are decoded lazily on top of the mapped pages.
+
+        :returns: an io object backed by the memory-mapped file
+        """
+        memory_map = self.location.open_memory_map()
+        if self.is_binary():
+            # Pyarrow files are registered as io.IOBase subclasses
+            return cast(io.IOBase, memory_map)
+        return io.TextIOWrapper(memory_map)
+
     def _convert_remote_file_to_byte_stream(self) -> io.IOBase:
         """
         Read file from all supported location and convert them into a buffer that can be streamed into other data
         structures.
         Due to noted issues with using smart_open with pandas (like
         https://github.com/RaRe-Technologies/smart_open/issues/524), we create a BytesIO or StringIO buffer
-        before exporting to a dataframe. We've found a sizable speed improvement with this optimization
+        before exporting to a dataframe. We've found a sizable speed improvement with this optimization.
+        Files which are already available on local disk are memory-mapped instead of copied, and large objects
+        stored in locations which support ranged reads (S3, GCS) are downloaded using concurrent requests.
 
         :returns: an io object that can be streamed into a dataframe (or other object)
         """
+        if self.location.supports_memory_map:
+            return self._open_memory_map()
+        if self.location.supports_ranged_reads:
+            size = self.size
+            if size > settings.PARALLEL_DOWNLOAD_PART_SIZE:
+                self.log.info(
+                    "Downloading %s (%s bytes) using concurrent byte range requests", self.path, size
+                )
+                byte_buffer = io.BytesIO()
+                self.location.download_in_parallel(byte_buffer, size=size)
+                return byte_buffer if self.is_binary() else io.TextIOWrapper(byte_buffer)
 
         mode = "rb" if self.is_binary() else "r"
         remote_obj_buffer = io.BytesIO() if self.is_binary() else io.StringIO()
-        with smart_open.open(self.path, mode=mode, transport_params=self.location.transport_params) as stream:
+        with smart_open.open(self.path, mode=mode, transport_params=self.transport_params) as stream:
             remote_obj_buffer.write(stream.read())
         remote_obj_buffer.seek(0)
         return remote_obj_buffer
@@ -144,9 +407,14 @@ class File(LoggingMixin, Dataset):
         Due to noted issues with using smart_open with pandas (like
         https://github.com/RaRe-Technologies/smart_open/issues/524), we create a BytesIO or StringIO buffer
         before exporting to a dataframe. We've found a sizable speed improvement with this optimization.
+        The buffer (or memory map) is closed once the dataframe is read.
         """
 
-        return self.type.export_to_dataframe(self._convert_remote_file_to_byte_stream(), **kwargs)
+        def read(**read_kwargs) -> pd.DataFrame:
+            with self._convert_remote_file_to_byte_stream() as stream:
+                return self.type.export_to_dataframe(stream, **read_kwargs)
+
+        return self._read_with_partition_columns(read, **kwargs)
 
     def exists(self) -> bool:
         """Check if the file exists or not"""
@@ -167,7 +435,7 @@ class File(LoggingMixin, Dataset):
     @uri.default
     def _path_to_dataset_uri(self) -> str:
         """Build a URI to be passed to Dataset obj introduced in Airflow 2.4"""
-        from urllib.parse import urlencode, urlparse
+        from urllib.parse import urlencode
 
         parsed_url = urlparse(url=self.path)
         netloc = parsed_url.netloc
@@ -188,7 +456,7 @@ class File(LoggingMixin, Dataset):
     def to_json(self):
         self.log.debug("converting file %s into json", self.path)
         filetype = self.filetype.value if self.filetype else None
-        return {
+        serialized_object = {
             "class": "File",
             "conn_id": self.conn_id,
             "path": self.path,
@@ -196,6 +464,9 @@ class File(LoggingMixin, Dataset):
             "normalize_config": self.normalize_config,
             "is_dataframe": self.is_dataframe,
         }
+        if self.hive_partitioning:
+            serialized_object["hive_partitioning"] = True
+        return serialized_object
 
     @classmethod
     def from_json(cls, serialized_object: dict):
@@ -208,6 +479,7 @@ class File(LoggingMixin, Dataset):
             filetype=filetype,
             normalize_config=serialized_object["normalize_config"],
             is_dataframe=serialized_object["is_dataframe"],
+            hive_partitioning=serialized_object.get("hive_partitioning", False),
         )
 
 
@@ -216,6 +488,8 @@ def resolve_file_path_pattern(
     conn_id: str | None = None,
     filetype: constants.FileType | None = None,
     normalize_config: dict | None = None,
+    hive_partitioning: bool = False,
+    filters: Filters | None = None,
 ) -> list[File]:
     """get file objects by resolving path_pattern from local/object stores
     path_pattern can be
@@ -227,20 +501,84 @@ def resolve_file_path_pattern(
     :param conn_id: Airflow connection ID
     :param filetype: constant to provide an explicit file type
     :param normalize_config: parameters in dict format of pandas json_normalize() function
+    :param hive_partitioning: Whether the path is the directory of a Hive-partitioned dataset, whose partition
+        values are added as columns to the dataframes read from its files
+    :param filters: Row filter, used to skip the partitions which can't match it without listing them
+    """
+    return list(
+        iter_file_path_pattern(
+            path_pattern,
+            conn_id,
+            filetype=filetype,
+            normalize_config=normalize_config,
+            hive_partitioning=hive_partitioning,
+            filters=filters,
+        )
+    )
+
+
+def iter_file_path_pattern(
+    path_pattern: str,
+    conn_id: str | None = None,
+    filetype: constants.FileType | None = None,
+    normalize_config: dict | None = None,
+    hive_partitioning: bool = False,
+    filters: Filters | None = None,
+) -> Iterator[File]:
+    """Lazily resolve path_pattern, like ``resolve_file_path_pattern``, yielding the files as each page of the
+    listing arrives. Patterns ending with a file type extension (e.g. ``s3://bucket/data/sample.csv``) only list
+    the files sharing it, filtered server-side where the location supports it.
+
+    :param path_pattern: path/pattern to a file in the filesystem/Object stores,
+        supports glob and prefix pattern for object stores
+    :param conn_id: Airflow connection ID
+    :param filetype: constant to provide an explicit file type
+    :param normalize_config: parameters in dict format of pandas json_normalize() function
+    :param hive_partitioning: Whether the path is the directory of a Hive-partitioned dataset, whose partition
+        values are added as columns to the dataframes read from its files
+    :param filters: Row filter, used to skip the partitions which can't match it without listing them
     """
     location = create_file_location(path_pattern, conn_id)
+    suffix = _get_listing_suffix(path_pattern)
 
-    files = [
-        File(
-            path=path,
+    if hive_partitioning:
+        listing: Iterator[tuple[FileMetadata, dict | None]] = location.iter_partitioned_files(
+            filters=filters, suffix=suffix
+        )
+    else:
+        listing = ((metadata, None) for metadata in location.iter_files(suffix=suffix))
+
+    found = False
+    for metadata, partition_values in listing:
+        if metadata.path.endswith("/"):
+            continue
+        found = True
+        yield File.from_listing(
+            metadata,
+            partition_values,
             conn_id=conn_id,
             filetype=filetype,
             normalize_config=normalize_config,
         )
-        for path in location.paths
-        if not path.endswith("/")
-    ]
-    if len(files) == 0:
+    if not found:
         raise FileNotFoundError(f"File(s) not found for path/pattern '{path_pattern}'")
 
-    return files
+
+def _get_listing_suffix(path_pattern: str) -> str | None:
+    """
+    Return the file type extension a path pattern ends with (e.g. ``.csv`` for ``s3://bucket/data/sample.csv``), if
+    any. Other patterns, such as directories, match files of any extension.
+    """
+    extension = pathlib.PurePosixPath(urlparse(path_pattern).path).suffix
+    if extension[1:] in {filetype.value for filetype in constants.FileType}:
+        return extension
+    return None
+
+
+def _capitalize_column_name(column: str, columns_names_capitalization: constants.ColumnCapitalization) -> str:
+    """Convert a column name to the required case, as ``convert_columns_names_capitalization`` does"""
+    if columns_names_capitalization == "lower":
+        return column.lower()
+    if columns_names_capitalization == "upper":
+        return column.upper()
+    return column
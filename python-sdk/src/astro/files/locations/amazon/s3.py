@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import os
+from datetime import datetime
+from typing import Any, Callable, Iterator
 from urllib.parse import urlparse, urlunparse
 
 from airflow.providers.amazon.aws.hooks.s3 import S3Hook
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
+from astro import settings
 from astro.constants import FileLocation
-from astro.files.locations.base import BaseFileLocation
+from astro.files.locations.base import BaseFileLocation, FileMetadata, MultipartUpload, client_registry
+
+# Maximum number of keys deleted by a single S3 DeleteObjects request
+MAX_DELETE_OBJECTS = 1000
 
 
 class S3Location(BaseFileLocation):
@@ -28,7 +37,48 @@ class S3Location(BaseFileLocation):
         """Structure s3fs credentials from Airflow connection.
         s3fs enables pandas to write to s3
         """
-        return {"client": self.hook.conn}
+        return {"client": self.get_client()}
+
+    def get_client(self, max_pool_connections: int | None = None) -> Any:
+        """
+        Return the boto3 S3 client shared by all the locations using the same connection and credentials.
+
+        :param max_pool_connections: Minimum size of the client connection pool.
+            Defaults to ``settings.OBJECT_STORE_MAX_POOL_CONNECTIONS``
+        """
+        pool_size = max(settings.OBJECT_STORE_MAX_POOL_CONNECTIONS, max_pool_connections or 0)
+        hook, fingerprint = client_registry.get_connection(
+            (self.location_type, self.conn_id), self._resolve_connection
+        )
+        key = (self.location_type, self.conn_id, fingerprint, pool_size)
+        return client_registry.get_client(key, lambda: self._create_client(hook, pool_size))
+
+    def _resolve_connection(self) -> tuple[S3Hook, str]:
+        """
+        Look up the connection, returning its hook along with a fingerprint of the credentials and endpoint the
+        clients are built with, so that clients are rebuilt when they change
+        """
+        hook = self.hook
+        config = hook.conn_config
+        settings_used = (
+            config.aws_access_key_id,
+            config.aws_secret_access_key,
+            config.aws_session_token,
+            config.profile_name,
+            config.role_arn,
+            config.region_name,
+            config.endpoint_url,
+            hook.verify,
+        )
+        return hook, hashlib.sha256(repr(settings_used).encode()).hexdigest()
+
+    @staticmethod
+    def _create_client(hook: S3Hook, pool_size: int) -> tuple[Any, datetime | None]:
+        """
+        Build a new boto3 S3 client. Its credentials are never reported as expiring: botocore refreshes the
+        temporary credentials of assumed roles by itself.
+        """
+        return hook.get_client_type(config=Config(max_pool_connections=pool_size)), None
 
     @property
     def paths(self) -> list[str]:
@@ -40,15 +90,151 @@ class S3Location(BaseFileLocation):
         paths = [urlunparse((url.scheme, url.netloc, keys, "", "", "")) for keys in prefixes]
         return paths
 
+    def iter_files(self, suffix: str | None = None) -> Iterator[FileMetadata]:
+        """
+        Lazily list the objects with the path as prefix, one page of results at a time, along with their size,
+        ETag and last modification time. S3 does not filter keys by suffix server-side, so the suffix is matched
+        while iterating over each page.
+
+        :param suffix: Only list objects whose key ends with this suffix (e.g. ``.csv``)
+        """
+        url = urlparse(self.path)
+        paginator = self.get_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=url.netloc, Prefix=url.path[1:]):
+            for obj in page.get("Contents", []):
+                if suffix is None or obj["Key"].endswith(suffix):
+                    yield FileMetadata(
+                        path=urlunparse((url.scheme, url.netloc, obj["Key"], "", "", "")),
+                        size=obj["Size"],
+                        etag=obj["ETag"].strip('"'),
+                        mtime=obj["LastModified"],
+                    )
+
+    @property
+    def supports_directory_listing(self) -> bool:
+        """S3 lists the keys of a "directory" using the slash as delimiter"""
+        return True
+
+    def list_directory(self, directory: str) -> tuple[list[str], list[FileMetadata]]:
+        """
+        List the objects and common prefixes directly under a prefix ending with a slash.
+
+        :param directory: Path to the prefix, ending with a slash
+        :return: The paths to the common prefixes, ending with a slash, and the metadata of the objects
+        """
+        url = urlparse(directory)
+        paginator = self.get_client().get_paginator("list_objects_v2")
+        subdirectories: list[str] = []
+        files: list[FileMetadata] = []
+        for page in paginator.paginate(Bucket=url.netloc, Prefix=url.path[1:], Delimiter="/"):
+            for common_prefix in page.get("CommonPrefixes", []):
+                subdirectories.append(
+                    urlunparse((url.scheme, url.netloc, common_prefix["Prefix"], "", "", ""))
+                )
+            for obj in page.get("Contents", []):
+                if obj["Key"].endswith("/"):
+                    continue
+                files.append(
+                    FileMetadata(
+                        path=urlunparse((url.scheme, url.netloc, obj["Key"], "", "", "")),
+                        size=obj["Size"],
+                        etag=obj["ETag"].strip('"'),
+                        mtime=obj["LastModified"],
+                    )
+                )
+        return subdirectories, files
+
+    @property
+    def supports_ranged_reads(self) -> bool:
+        """S3 objects can be downloaded in parts using ranged GET requests, unless they are compressed"""
+        return not self.is_compressed
+
+    def get_byte_range_reader(self, max_concurrency: int) -> Callable[[int, int], bytes]:
+        """
+        Return a callable which fetches a byte range of the object. All the requests share the pooled boto3 client,
+        whose connection pool fits ``max_concurrency`` simultaneous downloads.
+
+        :param max_concurrency: Maximum number of byte ranges which will be fetched at the same time
+        """
+        url = urlparse(self.path)
+        bucket_name = url.netloc
+        object_name = url.path.lstrip("/")
+        client = self.get_client(max_concurrency)
+
+        def read_byte_range(start: int, end: int) -> bytes:
+            response = client.get_object(Bucket=bucket_name, Key=object_name, Range=f"bytes={start}-{end}")
+            content: bytes = response["Body"].read()
+            return content
+
+        return read_byte_range
+
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete S3 objects, sending up to 1000 keys per DeleteObjects request.
+
+        :param paths: Paths to the objects to delete, in the bucket of the location
+        """
+        bucket_name = urlparse(self.path).netloc
+        keys = [urlparse(path).path.lstrip("/") for path in paths]
+        client = self.get_client()
+        for start in range(0, len(keys), MAX_DELETE_OBJECTS):
+            response = client.delete_objects(
+                Bucket=bucket_name,
+                Delete={
+                    "Objects": [{"Key": key} for key in keys[start : start + MAX_DELETE_OBJECTS]],
+                    "Quiet": True,
+                },
+            )
+            errors = response.get("Errors")
+            if errors:
+                raise OSError(f"Failed to delete {len(errors)} objects from {bucket_name}: {errors[:3]}")
+
+    @property
+    def supports_parallel_upload(self) -> bool:
+        """S3 objects can be written using multipart uploads, unless smart_open has to compress them"""
+        return not self.is_compressed
+
+    def create_multipart_upload(self, max_concurrency: int) -> S3MultipartUpload:
+        """
+        Create the multipart upload engine of the object, using the pooled boto3 client whose connection pool fits
+        ``max_concurrency`` simultaneous part uploads.
+
+        :param max_concurrency: Maximum number of parts which will be uploaded at the same time
+        """
+        url = urlparse(self.path)
+        client = self.get_client(max_concurrency)
+        return S3MultipartUpload(client=client, bucket_name=url.netloc, object_name=url.path.lstrip("/"))
+
     @property
     def size(self) -> int:
         """Return file size for S3 location"""
+        metadata = self.stat()
+        if metadata is None:
+            raise FileNotFoundError(f"File {self.path} does not exist")
+        return metadata.size or -1
+
+    def get_metadata(self) -> FileMetadata | None:
+        """
+        Fetch the object metadata with a single HEAD request. S3 answers 403 rather than 404 for missing objects
+        when the credentials can't list the bucket, so both are reported as a missing file.
+        """
         url = urlparse(self.path)
         bucket_name = url.netloc
         object_name = url.path
         if object_name.startswith("/"):
             object_name = object_name[1:]
-        return self.hook.head_object(key=object_name, bucket_name=bucket_name).get("ContentLength") or -1
+        try:
+            response = self.get_client().head_object(Bucket=bucket_name, Key=object_name)
+        except ClientError as error:
+            if error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") in (403, 404):
+                return None
+            raise
+        return FileMetadata(
+            path=self.path,
+            size=response.get("ContentLength"),
+            etag=response.get("ETag", "").strip('"') or None,
+            mtime=response.get("LastModified"),
+        )
 
     @property
     def openlineage_dataset_namespace(self) -> str:
@@ -84,3 +270,49 @@ class S3Location(BaseFileLocation):
             ] = "org.apache.hadoop.fs.s3a.TemporaryAWSCredentialsProvider"
             cred_dict["fs.s3a.session.token"] = credentials.token
         return cred_dict
+
+
+class S3MultipartUpload(MultipartUpload):
+    """
+    Write an S3 object using the multipart upload API.
+
+    :param client: boto3 S3 client, shared by all the part uploads
+    :param bucket_name: Name of the bucket
+    :param object_name: Key of the object
+    """
+
+    def __init__(self, client: Any, bucket_name: str, object_name: str):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.upload_id: str | None = None
+
+    def upload_whole(self, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket_name, Key=self.object_name, Body=data)
+
+    def begin(self) -> None:
+        response = self.client.create_multipart_upload(Bucket=self.bucket_name, Key=self.object_name)
+        self.upload_id = response["UploadId"]
+
+    def upload_part(self, part_number: int, data: bytes) -> dict:
+        response = self.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.object_name,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def complete(self, parts: list[Any]) -> None:
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.object_name,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    def abort(self, parts: list[Any]) -> None:  # skipcq: PYL-W0613
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket_name, Key=self.object_name, UploadId=self.upload_id
+        )
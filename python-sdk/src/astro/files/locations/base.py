@@ -1,14 +1,238 @@
 from __future__ import annotations
 
 import glob
+import io
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import IO, Any, Callable, Hashable, Iterator
+from urllib.parse import unquote, urlparse
 
+import pyarrow as pa
 import smart_open
+from attr import define
+from smart_open.compression import get_supported_extensions
 
+from astro import settings
 from astro.constants import FileLocation
+from astro.utils.filters import Filters, match_partition_values
+
+
+@define(frozen=True)
+class FileMetadata:
+    """
+    Metadata of a file, as returned by listing a location. Fields the location does not expose are None.
+
+    :param path: Path to the file in the filesystem/Object stores
+    :param size: Size of the file in bytes
+    :param etag: Entity tag of the object
+    :param mtime: Last time the file was modified
+    """
+
+    path: str
+    size: int | None = None
+    etag: str | None = None
+    mtime: datetime | None = None
+
+
+#: Directory name used by Hive (and Spark) for the partition of null values, e.g. ``region=__HIVE_DEFAULT_PARTITION__``
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+# Characters with a special meaning in glob patterns
+GLOB_SPECIAL_CHARS = set("*?[]{}\\")
+
+
+def parse_partition_segment(segment: str) -> tuple[str, str | None] | None:
+    """
+    Parse a Hive-style ``key=value`` directory name, whose key and value are URL-encoded.
+
+    :param segment: Name of a directory, without slashes
+    :return: The partition column and its value (None for null partitions), or None if it isn't a partition
+    """
+    key, separator, value = segment.partition("=")
+    if not separator or not key:
+        return None
+    value = unquote(value)
+    return unquote(key), None if value in ("", HIVE_DEFAULT_PARTITION) else value
+
+
+def get_partition_values(path: str, root: str) -> dict[str, str | None]:
+    """
+    Return the partition values encoded in the directories between a dataset root and one of its files,
+    e.g. ``{"dt": "2024-01-01", "region": "eu"}`` for ``<root>/dt=2024-01-01/region=eu/part-0.csv``.
+
+    :param path: Path to a file of the dataset
+    :param root: Path to the directory of the dataset
+    """
+    relative_path = path[len(root) :] if path.startswith(root) else path
+    partition_values: dict[str, str | None] = {}
+    for segment in relative_path.split("/")[:-1]:
+        partition = parse_partition_segment(segment)
+        if partition is not None:
+            partition_values[partition[0]] = partition[1]
+    return partition_values
+
+
+def _is_hidden(path: str) -> bool:
+    """Whether a file or directory is ignored by Hive-style readers (e.g. ``_SUCCESS`` or ``.part.crc``)"""
+    return path.rstrip("/").rsplit("/", 1)[-1].startswith(("_", "."))
+
+
+def _get_matching_subdirectories(
+    subdirectories: list[str], partition_values: dict[str, str | None], filters: Filters | None
+) -> list[tuple[str, dict[str, str | None]]]:
+    """
+    Return the subdirectories of a partition directory which may hold matching files, along with their partition
+    values. Hidden directories, and partitions whose values don't match the filters, are skipped.
+
+    :param subdirectories: Paths to the subdirectories, ending with a slash
+    :param partition_values: Partition values of the parent directory
+    :param filters: Row filter
+    """
+    matching_subdirectories = []
+    for subdirectory in subdirectories:
+        if _is_hidden(subdirectory):
+            continue
+        partition = parse_partition_segment(subdirectory.rstrip("/").rsplit("/", 1)[-1])
+        subdirectory_values = partition_values
+        if partition is not None:
+            subdirectory_values = {**partition_values, partition[0]: partition[1]}
+            if not match_partition_values(subdirectory_values, filters):
+                continue
+        matching_subdirectories.append((subdirectory, subdirectory_values))
+    return matching_subdirectories
+
+
+# Results of the file metadata probes, indexed by (path, conn_id), along with the time they expire at. The least
+# recently used entries are evicted once it holds settings.FILE_METADATA_CACHE_MAX_SIZE entries.
+_METADATA_CACHE: OrderedDict[tuple[str, str | None], tuple[float, FileMetadata | None]] = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_metadata(key: tuple[str, str | None]) -> tuple[bool, FileMetadata | None]:
+    """
+    Look up the result of a metadata probe in the cache, evicting it if it expired.
+
+    :param key: Path and connection ID of the file
+    :return: Whether a fresh result was cached, and the cached metadata
+    """
+    with _METADATA_CACHE_LOCK:
+        expires_at, metadata = _METADATA_CACHE.get(key, (0.0, None))
+        if expires_at > time.monotonic():
+            _METADATA_CACHE.move_to_end(key)
+            return True, metadata
+        _METADATA_CACHE.pop(key, None)
+    return False, None
+
+
+def _cache_metadata(key: tuple[str, str | None], metadata: FileMetadata | None, ttl: int) -> None:
+    """
+    Cache the result of a metadata probe for ``ttl`` seconds, evicting the least recently used entries.
+
+    :param key: Path and connection ID of the file
+    :param metadata: Metadata of the file, or None if it does not exist
+    :param ttl: Number of seconds the result is cached for
+    """
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[key] = (time.monotonic() + ttl, metadata)
+        _METADATA_CACHE.move_to_end(key)
+        while len(_METADATA_CACHE) > settings.FILE_METADATA_CACHE_MAX_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+
+
+class ClientRegistry:
+    """
+    Process-wide registry of object store clients. Locations using the same connection share a client, so that
+    they reuse its warm keep-alive connections instead of resolving credentials and opening new connections.
+    Clients are rebuilt shortly before the credentials they were created with expire, and after a fork.
+    The Airflow connections the clients are built from are also cached for a few minutes, so that locations don't
+    look them up for every file, while credentials rotated in the connection are still picked up.
+    """
+
+    #: Clients are rebuilt this long before their credentials expire
+    expiry_margin = timedelta(minutes=5)
+
+    def __init__(self):
+        self._clients: dict[Hashable, tuple[Any, datetime | None]] = {}
+        self._connections: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get_connection(self, key: Hashable, resolve_connection: Callable[[], Any]) -> Any:
+        """
+        Return the connection resolved for the key (e.g. a hook along with a fingerprint of its credentials),
+        resolving it again once it is older than ``settings.OBJECT_STORE_CONNECTION_CACHE_TTL`` seconds.
+
+        :param key: Identifies the connection, e.g. the location type and the Airflow connection ID
+        :param resolve_connection: Look up the connection
+        """
+        with self._lock:
+            self._forget_parent_process_clients()
+            expires_at, connection = self._connections.get(key, (0.0, None))
+        if expires_at > time.monotonic():
+            return connection
+
+        connection = resolve_connection()
+        with self._lock:
+            self._connections[key] = (
+                time.monotonic() + settings.OBJECT_STORE_CONNECTION_CACHE_TTL,
+                connection,
+            )
+        return connection
+
+    def get_client(self, key: Hashable, create_client: Callable[[], tuple[Any, datetime | None]]) -> Any:
+        """
+        Return the client registered for the key, creating it if it does not exist or is about to expire.
+
+        :param key: Identifies the client, e.g. the location type and the Airflow connection ID
+        :param create_client: Build a new client, returning it along with the expiry time of its credentials
+            (None if they don't expire)
+        """
+        with self._lock:
+            self._forget_parent_process_clients()
+            client = self._get_valid_client(key)
+        if client is not None:
+            return client
+
+        # Resolving credentials may be slow, so clients are built without blocking the other connections
+        client, expiry = create_client()
+        if expiry is not None and expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        with self._lock:
+            # Another thread may have registered a client for the same key meanwhile
+            registered_client = self._get_valid_client(key)
+            if registered_client is not None:
+                return registered_client
+            self._clients[key] = (client, expiry)
+        return client
+
+    def _forget_parent_process_clients(self) -> None:
+        """Forget the clients created before a fork, since HTTP connections can't be shared with the parent process"""
+        if self._pid != os.getpid():
+            self._clients.clear()
+            self._connections.clear()
+            self._pid = os.getpid()
+
+    def _get_valid_client(self, key: Hashable) -> Any:
+        """Return the client registered for the key, or None if there is none or it is about to expire"""
+        client, expiry = self._clients.get(key, (None, None))
+        if expiry is not None and expiry - self.expiry_margin <= datetime.now(timezone.utc):
+            return None
+        return client
+
+    def clear(self) -> None:
+        """Forget all the registered clients and connections"""
+        with self._lock:
+            self._clients.clear()
+            self._connections.clear()
+
+
+client_registry = ClientRegistry()
 
 
 class BaseFileLocation(ABC):
@@ -42,11 +266,211 @@ class BaseFileLocation(ABC):
         """Resolve patterns in path"""
         raise NotImplementedError
 
+    def iter_files(self, suffix: str | None = None) -> Iterator[FileMetadata]:
+        """
+        Lazily list the files matching the path, along with the metadata returned by the listing.
+        Locations which can't list metadata only return the file paths.
+
+        :param suffix: Only list files whose path ends with this suffix (e.g. ``.csv``)
+        """
+        for path in self.paths:
+            if suffix is None or path.endswith(suffix):
+                yield FileMetadata(path=path)
+
+    @property
+    def supports_directory_listing(self) -> bool:  # skipcq: PYL-R0201
+        """Whether the location can list the direct children of a directory, allowing partitions to be pruned"""
+        return False
+
+    def list_directory(self, directory: str) -> tuple[list[str], list[FileMetadata]]:
+        """
+        List the direct children of a directory. Only available if ``supports_directory_listing`` is True.
+
+        :param directory: Path to the directory, ending with a slash
+        :return: The paths to the subdirectories, ending with a slash, and the metadata of the files
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support directory listing")
+
+    def iter_partitioned_files(
+        self, filters: Filters | None = None, suffix: str | None = None
+    ) -> Iterator[tuple[FileMetadata, dict[str, str | None]]]:
+        """
+        Lazily list the files of a Hive-partitioned dataset (e.g. ``<path>/dt=2024-01-01/region=eu/part-0.csv``),
+        along with the partition values encoded in their directories. Where the location supports it, partition
+        directories are listed level by level, and those whose values don't match the filters are skipped
+        without being listed. Files and directories whose name starts with ``_`` or ``.`` are ignored.
+
+        :param filters: Row filter, whose predicates on partition columns are used to prune partitions
+        :param suffix: Only list files whose path ends with this suffix (e.g. ``.csv``)
+        """
+        glob_position = min(
+            (self.path.index(char) for char in GLOB_SPECIAL_CHARS if char in self.path), default=-1
+        )
+        if not self.supports_directory_listing or glob_position >= 0:
+            # The partition values are parsed from the paths of all the files matching the path
+            root = self.path[:glob_position].rsplit("/", 1)[0] + "/" if glob_position >= 0 else self.path
+            yield from self._iter_partitioned_files_from_paths(root, filters, suffix)
+        else:
+            yield from self._walk_partition_directories(filters, suffix)
+
+    def _iter_partitioned_files_from_paths(
+        self, root: str, filters: Filters | None, suffix: str | None
+    ) -> Iterator[tuple[FileMetadata, dict[str, str | None]]]:
+        """
+        List all the files matching the path, and parse their partition values from their path relative to root.
+
+        :param root: Directory of the dataset
+        :param filters: Row filter, whose predicates on partition columns are used to skip files
+        :param suffix: Only list files whose path ends with this suffix (e.g. ``.csv``)
+        """
+        root = root if root.endswith("/") else root + "/"
+        for metadata in self.iter_files(suffix=suffix):
+            relative_path = metadata.path[len(root) :] if metadata.path.startswith(root) else metadata.path
+            if metadata.path.endswith("/") or any(map(_is_hidden, relative_path.split("/"))):
+                continue
+            partition_values = get_partition_values(metadata.path, root)
+            if match_partition_values(partition_values, filters):
+                yield metadata, partition_values
+
+    def _walk_partition_directories(
+        self, filters: Filters | None, suffix: str | None
+    ) -> Iterator[tuple[FileMetadata, dict[str, str | None]]]:
+        """
+        List the partition directories level by level, skipping those whose values don't match the filters.
+
+        :param filters: Row filter, whose predicates on partition columns are used to prune partitions
+        :param suffix: Only list files whose path ends with this suffix (e.g. ``.csv``)
+        """
+        root = self.path if self.path.endswith("/") else self.path + "/"
+        directories: list[tuple[str, dict[str, str | None]]] = [(root, {})]
+        while directories:
+            directory, partition_values = directories.pop()
+            subdirectories, files = self.list_directory(directory)
+            for metadata in files:
+                if not _is_hidden(metadata.path) and (suffix is None or metadata.path.endswith(suffix)):
+                    yield metadata, partition_values
+            # Subdirectories are pushed in reverse, so that they are walked in the order they were listed
+            directories.extend(
+                reversed(_get_matching_subdirectories(subdirectories, partition_values, filters))
+            )
+
     @property
     def transport_params(self) -> dict | None:  # skipcq: PYL-R0201
         """Get credentials required by smart open to access files"""
         return None
 
+    @property
+    def is_compressed(self) -> bool:
+        """Whether smart_open decompresses the file on the fly, based on its extension"""
+        return Path(urlparse(self.path).path).suffix.lower() in get_supported_extensions()
+
+    @property
+    def supports_memory_map(self) -> bool:  # skipcq: PYL-R0201
+        """Whether the file can be read through a zero-copy memory map instead of a buffered stream"""
+        return False
+
+    def open_memory_map(self) -> pa.NativeFile:
+        """
+        Open the file as a read-only memory map, so readers can access its content without copying it.
+        Only available if ``supports_memory_map`` is True.
+
+        :return: A pyarrow memory-mapped file
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support memory-mapped reads")
+
+    @property
+    def supports_ranged_reads(self) -> bool:  # skipcq: PYL-R0201
+        """Whether byte ranges of the file can be fetched independently, allowing parallel downloads"""
+        return False
+
+    def get_byte_range_reader(self, max_concurrency: int) -> Callable[[int, int], bytes]:
+        """
+        Return a thread-safe callable which fetches the bytes between two offsets (both inclusive) of the file.
+        The callable should share a single client, with a connection pool big enough for ``max_concurrency``
+        simultaneous requests. Only available if ``supports_ranged_reads`` is True.
+
+        :param max_concurrency: Maximum number of byte ranges which will be fetched at the same time
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support ranged reads")
+
+    def download_in_parallel(
+        self,
+        target: IO[bytes],
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+        size: int | None = None,
+    ) -> None:
+        """
+        Download the file by splitting it into byte ranges which are fetched concurrently and reassembled into
+        ``target``. At most ``max_concurrency`` parts are held in memory at any time.
+
+        :param target: Seekable binary buffer or file the content is written to. It is rewound at the end.
+        :param part_size: Size in bytes of each byte range. Defaults to ``settings.PARALLEL_DOWNLOAD_PART_SIZE``
+        :param max_concurrency: Number of parts fetched at the same time.
+            Defaults to ``settings.PARALLEL_DOWNLOAD_MAX_CONCURRENCY``
+        :param size: Size of the file in bytes, if already known
+        """
+        part_size = part_size or settings.PARALLEL_DOWNLOAD_PART_SIZE
+        max_concurrency = max_concurrency or settings.PARALLEL_DOWNLOAD_MAX_CONCURRENCY
+        size = self.size if size is None else size
+
+        read_byte_range = self.get_byte_range_reader(max_concurrency)
+        byte_ranges = ((start, min(start + part_size, size) - 1) for start in range(0, size, part_size))
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending = {
+                executor.submit(read_byte_range, start, end): start
+                for start, end in islice(byte_ranges, max_concurrency)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target.seek(pending.pop(future))
+                    target.write(future.result())
+                for start, end in islice(byte_ranges, len(done)):
+                    pending[executor.submit(read_byte_range, start, end)] = start
+        target.seek(0)
+
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete files of the location, e.g. the ones listed by ``iter_files``. Object stores delete them with batched
+        requests. Files which don't exist are ignored.
+
+        :param paths: Paths to the files to delete
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support deleting files")
+
+    @property
+    def supports_parallel_upload(self) -> bool:  # skipcq: PYL-R0201
+        """Whether the file can be written by uploading parts concurrently"""
+        return False
+
+    def create_multipart_upload(self, max_concurrency: int) -> MultipartUpload:
+        """
+        Create the upload engine used to write the file in parts.
+        Only available if ``supports_parallel_upload`` is True.
+
+        :param max_concurrency: Maximum number of parts which will be uploaded at the same time
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support parallel uploads")
+
+    def open_parallel_upload_stream(
+        self, part_size: int | None = None, max_concurrency: int | None = None
+    ) -> ParallelUploadStream:
+        """
+        Open a binary stream which uploads what is written to it in parts, sent concurrently.
+
+        :param part_size: Size in bytes of each part. Defaults to ``settings.PARALLEL_UPLOAD_PART_SIZE``
+        :param max_concurrency: Number of parts uploaded at the same time.
+            Defaults to ``settings.PARALLEL_UPLOAD_MAX_CONCURRENCY``
+        """
+        part_size = part_size or settings.PARALLEL_UPLOAD_PART_SIZE
+        max_concurrency = max_concurrency or settings.PARALLEL_UPLOAD_MAX_CONCURRENCY
+        return ParallelUploadStream(
+            upload=self.create_multipart_upload(max_concurrency),
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+        )
+
     @property
     @abstractmethod
     def size(self) -> int:
@@ -100,13 +524,10 @@ class BaseFileLocation(ABC):
 
     @staticmethod
     def check_non_existing_local_file_path(path: str) -> bool:
-        """Check if the path is valid by creating and temp file and then deleting it. Assumes the file don't exist"""
-        try:
-            Path(path).touch()
-            os.remove(path)
-        except OSError:
-            return False
-        return True
+        """Check if a file could be created at the path, i.e. its directory exists and is writable"""
+        file_path = Path(path)
+        directory = file_path.parent
+        return directory.is_dir() and os.access(directory, os.W_OK | os.X_OK) and not file_path.is_dir()
 
     @staticmethod
     def get_location_type(path: str) -> FileLocation:
@@ -124,13 +545,45 @@ class BaseFileLocation(ABC):
                 raise ValueError(f"Unsupported scheme '{file_scheme}' from path '{path}'")
         return location
 
-    def exists(self) -> bool:
-        """Check if the file exists or not"""
+    def get_metadata(self) -> FileMetadata | None:
+        """
+        Fetch the metadata of the file, using a single lightweight request where the location allows it.
+        Locations which don't have a dedicated probe open the file, without reading it.
+
+        :return: The file metadata, or None if the file does not exist
+        """
         try:
-            with smart_open.open(self.path, mode="r", transport_params=self.transport_params):
-                return True
+            with smart_open.open(self.path, mode="rb", transport_params=self.transport_params):
+                return FileMetadata(path=self.path)
         except OSError:
-            return False
+            return None
+
+    def stat(self, ttl: int | None = None) -> FileMetadata | None:
+        """
+        Return the metadata of the file, reusing the result of a previous probe made less than ``ttl`` seconds ago.
+
+        :param ttl: Number of seconds probe results are cached for. Defaults to ``settings.FILE_METADATA_CACHE_TTL``
+        :return: The file metadata, or None if the file does not exist
+        """
+        ttl = settings.FILE_METADATA_CACHE_TTL if ttl is None else ttl
+        if ttl <= 0:
+            return self.get_metadata()
+
+        key = (self.path, self.conn_id)
+        is_cached, metadata = _get_cached_metadata(key)
+        if not is_cached:
+            metadata = self.get_metadata()
+            _cache_metadata(key, metadata, ttl)
+        return metadata
+
+    def invalidate_metadata_cache(self) -> None:
+        """Forget the cached metadata of the file, e.g. once it has been written to"""
+        with _METADATA_CACHE_LOCK:
+            _METADATA_CACHE.pop((self.path, self.conn_id), None)
+
+    def exists(self) -> bool:
+        """Check if the file exists or not"""
+        return self.stat() is not None
 
     def databricks_settings(self) -> dict:
         """
@@ -154,3 +607,147 @@ class BaseFileLocation(ABC):
 
     def __hash__(self) -> int:
         return hash((self.path, self.conn_id))
+
+
+class MultipartUpload(ABC):
+    """
+    Upload engine which writes a single object out of parts, which can be uploaded concurrently and are
+    assembled once all of them were sent.
+    """
+
+    @abstractmethod
+    def upload_whole(self, data: bytes) -> None:
+        """
+        Upload the object in a single request. Used when the whole content fits in one part.
+
+        :param data: Content of the object
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Initiate the multipart upload, before any part is sent"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def upload_part(self, part_number: int, data: bytes) -> Any:
+        """
+        Upload one part of the object. Must be thread-safe.
+
+        :param part_number: Position of the part in the object, starting from 1
+        :param data: Content of the part
+        :return: Reference to the uploaded part, later given to ``complete`` or ``abort``
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, parts: list[Any]) -> None:
+        """
+        Assemble the uploaded parts into the final object.
+
+        :param parts: References to all the uploaded parts, ordered by part number
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def abort(self, parts: list[Any]) -> None:
+        """
+        Cancel the upload and discard the parts sent so far.
+
+        :param parts: References to the parts which were successfully uploaded
+        """
+        raise NotImplementedError
+
+
+class ParallelUploadStream(io.RawIOBase):
+    """
+    Writable binary stream which buffers data into parts and uploads them concurrently using a MultipartUpload.
+    At most ``max_concurrency`` parts are in flight, so memory usage is bounded to
+    ``(max_concurrency + 1) * part_size``.
+
+    :param upload: Upload engine of the target object
+    :param part_size: Size in bytes of each part
+    :param max_concurrency: Maximum number of parts uploaded at the same time
+    """
+
+    def __init__(self, upload: MultipartUpload, part_size: int, max_concurrency: int):
+        super().__init__()
+        self.upload = upload
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._futures: list[Future] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        if self.closed:
+            raise ValueError("I/O operation on closed stream.")
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._submit_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def _submit_part(self, data: bytes) -> None:
+        if self._executor is None:
+            self.upload.begin()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        # Blocks until one of the parts in flight is uploaded, bounding the memory used by pending parts
+        self._slots.acquire()
+        self._raise_failed_parts()
+        future = self._executor.submit(self.upload.upload_part, len(self._futures) + 1, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _raise_failed_parts(self) -> None:
+        for future in self._futures:
+            if future.done() and future.exception():
+                raise future.exception()  # type: ignore[misc]
+
+    def _uploaded_parts(self) -> list[Any]:
+        return [future.result() for future in self._futures if not future.exception()]
+
+    def close(self) -> None:
+        """Upload the remaining buffered data and assemble the parts into the final object"""
+        if self.closed:
+            return
+        try:
+            if self._executor is None:
+                self.upload.upload_whole(bytes(self._buffer))
+            else:
+                self._complete_multipart_upload()
+        finally:
+            self._buffer = bytearray()
+            super().close()
+
+    def _complete_multipart_upload(self) -> None:
+        try:
+            if self._buffer:
+                self._submit_part(bytes(self._buffer))
+            self._executor.shutdown(wait=True)  # type: ignore[union-attr]
+            self._raise_failed_parts()
+        except Exception:
+            self._executor.shutdown(wait=True)  # type: ignore[union-attr]
+            self.upload.abort(self._uploaded_parts())
+            raise
+        self.upload.complete([future.result() for future in self._futures])
+
+    def abort(self) -> None:
+        """Stop the upload, discarding the parts sent so far"""
+        if self.closed:
+            return
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self.upload.abort(self._uploaded_parts())
+        self._buffer = bytearray()
+        super().close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
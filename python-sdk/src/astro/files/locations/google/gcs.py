@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator
 from urllib.parse import urlparse, urlunparse
 
 from airflow.providers.google.cloud.hooks.gcs import GCSHook
+from google.api_core.exceptions import NotFound
+from requests.adapters import HTTPAdapter
 
+from astro import settings
 from astro.constants import FileLocation
-from astro.files.locations.base import BaseFileLocation
+from astro.files.locations.base import (
+    GLOB_SPECIAL_CHARS,
+    BaseFileLocation,
+    FileMetadata,
+    MultipartUpload,
+    client_registry,
+)
+
+# Maximum number of source objects accepted by a single GCS compose request
+MAX_COMPOSE_SOURCES = 32
+# Number of blobs deleted by each GCS batch request
+DELETE_BATCH_SIZE = 100
 
 
 class GCSLocation(BaseFileLocation):
@@ -20,9 +37,29 @@ class GCSLocation(BaseFileLocation):
     @property
     def transport_params(self) -> dict:
         """get GCS credentials for storage"""
-        client = self.hook.get_conn()
+        client = self.get_client()
         return {"client": client}
 
+    def get_client(self, max_pool_connections: int | None = None) -> Any:
+        """
+        Return the storage client shared by all the locations using the same connection.
+
+        :param max_pool_connections: Minimum size of the client HTTP connection pool.
+            Defaults to ``settings.OBJECT_STORE_MAX_POOL_CONNECTIONS``
+        """
+        pool_size = max(settings.OBJECT_STORE_MAX_POOL_CONNECTIONS, max_pool_connections or 0)
+        return client_registry.get_client(
+            (self.location_type, self.conn_id, pool_size), lambda: self._create_client(pool_size)
+        )
+
+    def _create_client(self, pool_size: int) -> tuple[Any, datetime | None]:
+        """Build a new storage client, along with the expiry time of its credentials"""
+        client = self.hook.get_conn()
+        client._http.mount(  # skipcq: PYL-W0212
+            "https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        )
+        return client, getattr(client._credentials, "expiry", None)  # skipcq: PYL-W0212
+
     @property
     def paths(self) -> list[str]:
         """Resolve GS file paths with prefix"""
@@ -33,15 +70,147 @@ class GCSLocation(BaseFileLocation):
         paths = [urlunparse((url.scheme, url.netloc, keys, "", "", "")) for keys in prefixes]
         return paths
 
+    def iter_files(self, suffix: str | None = None) -> Iterator[FileMetadata]:
+        """
+        Lazily list the blobs with the path as prefix, one page of results at a time, along with their size,
+        ETag and last modification time. The suffix is matched server-side when possible.
+
+        :param suffix: Only list blobs whose name ends with this suffix (e.g. ``.csv``)
+        """
+        url = urlparse(self.path)
+        for blob in self._list_blobs(url.netloc, url.path[1:], suffix):
+            if suffix is None or blob.name.endswith(suffix):
+                yield FileMetadata(
+                    path=urlunparse((url.scheme, url.netloc, blob.name, "", "", "")),
+                    size=blob.size,
+                    etag=blob.etag,
+                    mtime=blob.updated,
+                )
+
+    def _list_blobs(self, bucket_name: str, prefix: str, suffix: str | None) -> Iterable[Any]:
+        """
+        List the blobs with a prefix, matching the suffix server-side when the prefix and suffix hold no glob
+        special characters and the client supports it. Blobs are returned as the pages are fetched.
+        """
+        client = self.get_client()
+        blobs: Iterable[Any]
+        if suffix and not GLOB_SPECIAL_CHARS.intersection(prefix + suffix):
+            try:
+                blobs = client.list_blobs(bucket_name, prefix=prefix, match_glob=f"{prefix}**{suffix}")
+                return blobs
+            except TypeError:  # google-cloud-storage < 2.10 does not support match_glob
+                pass
+        blobs = client.list_blobs(bucket_name, prefix=prefix)
+        return blobs
+
+    @property
+    def supports_directory_listing(self) -> bool:
+        """GCS lists the blobs of a "directory" using the slash as delimiter"""
+        return True
+
+    def list_directory(self, directory: str) -> tuple[list[str], list[FileMetadata]]:
+        """
+        List the blobs and prefixes directly under a prefix ending with a slash.
+
+        :param directory: Path to the prefix, ending with a slash
+        :return: The paths to the prefixes, ending with a slash, and the metadata of the blobs
+        """
+        url = urlparse(directory)
+        blobs = self.get_client().list_blobs(url.netloc, prefix=url.path[1:], delimiter="/")
+        files = [
+            FileMetadata(
+                path=urlunparse((url.scheme, url.netloc, blob.name, "", "", "")),
+                size=blob.size,
+                etag=blob.etag,
+                mtime=blob.updated,
+            )
+            for blob in blobs
+            if not blob.name.endswith("/")
+        ]
+        # The prefixes are only known once all the pages of blobs were fetched
+        subdirectories = [
+            urlunparse((url.scheme, url.netloc, prefix, "", "", "")) for prefix in sorted(blobs.prefixes)
+        ]
+        return subdirectories, files
+
+    @property
+    def supports_ranged_reads(self) -> bool:
+        """GCS blobs can be downloaded in parts using ranged requests, unless they are compressed"""
+        return not self.is_compressed
+
+    def get_byte_range_reader(self, max_concurrency: int) -> Callable[[int, int], bytes]:
+        """
+        Return a callable which fetches a byte range of the blob. All the requests share the pooled storage client,
+        whose HTTP connection pool fits ``max_concurrency`` simultaneous downloads.
+
+        :param max_concurrency: Maximum number of byte ranges which will be fetched at the same time
+        """
+        url = urlparse(self.path)
+        client = self.get_client(max_concurrency)
+        blob = client.bucket(url.netloc).blob(url.path.lstrip("/"))
+
+        def read_byte_range(start: int, end: int) -> bytes:
+            content: bytes = blob.download_as_bytes(start=start, end=end)
+            return content
+
+        return read_byte_range
+
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete GCS blobs, sending the requests in batches of 100. Blobs which don't exist are ignored.
+
+        :param paths: Paths to the blobs to delete, in the bucket of the location
+        """
+        client = self.get_client()
+        bucket = client.bucket(urlparse(self.path).netloc)
+        blob_names = [urlparse(path).path.lstrip("/") for path in paths]
+        for start in range(0, len(blob_names), DELETE_BATCH_SIZE):
+            try:
+                with client.batch():
+                    for blob_name in blob_names[start : start + DELETE_BATCH_SIZE]:
+                        bucket.delete_blob(blob_name)
+            except NotFound:
+                # The other blobs of the batch were deleted
+                continue
+
+    @property
+    def supports_parallel_upload(self) -> bool:
+        """GCS blobs can be written using parallel composite uploads, unless smart_open has to compress them"""
+        return not self.is_compressed
+
+    def create_multipart_upload(self, max_concurrency: int) -> GCSCompositeUpload:
+        """
+        Create the parallel composite upload engine of the blob, using the pooled storage client whose HTTP
+        connection pool fits ``max_concurrency`` simultaneous part uploads.
+
+        :param max_concurrency: Maximum number of parts which will be uploaded at the same time
+        """
+        url = urlparse(self.path)
+        client = self.get_client(max_concurrency)
+        return GCSCompositeUpload(bucket=client.bucket(url.netloc), blob_name=url.path.lstrip("/"))
+
     @property
     def size(self) -> int:
         """Return file size for GCS location"""
+        metadata = self.stat()
+        if metadata is None:
+            raise FileNotFoundError(f"File {self.path} does not exist")
+        if metadata.size is not None:
+            return metadata.size
+        url = urlparse(self.path)
+        return int(self.hook.get_size(bucket_name=url.netloc, object_name=url.path.lstrip("/")))
+
+    def get_metadata(self) -> FileMetadata | None:
+        """Fetch the blob metadata with a single request, which also tells whether the blob exists"""
         url = urlparse(self.path)
         bucket_name = url.netloc
         object_name = url.path
         if object_name.startswith("/"):
             object_name = object_name[1:]
-        return int(self.hook.get_size(bucket_name=bucket_name, object_name=object_name))
+        blob = self.get_client().bucket(bucket_name).get_blob(object_name)
+        if blob is None:
+            return None
+        return FileMetadata(path=self.path, size=blob.size, etag=blob.etag, mtime=blob.updated)
 
     @property
     def openlineage_dataset_namespace(self) -> str:
@@ -59,3 +228,40 @@ class GCSLocation(BaseFileLocation):
         https://github.com/OpenLineage/OpenLineage/blob/main/spec/Naming.md
         """
         return urlparse(self.path).path
+
+
+class GCSCompositeUpload(MultipartUpload):
+    """
+    Write a GCS blob using a parallel composite upload: each part is uploaded as a temporary blob, and the parts
+    are then composed into the final blob and deleted.
+
+    :param bucket: Storage bucket the blob belongs to
+    :param blob_name: Name of the blob
+    """
+
+    def __init__(self, bucket: Any, blob_name: str):
+        self.bucket = bucket
+        self.blob_name = blob_name
+        self.parts_prefix = f"{blob_name}.parts-{uuid.uuid4().hex}/"
+
+    def upload_whole(self, data: bytes) -> None:
+        self.bucket.blob(self.blob_name).upload_from_string(data)
+
+    def begin(self) -> None:
+        """Parts are independent blobs, so there is nothing to initiate"""
+
+    def upload_part(self, part_number: int, data: bytes) -> Any:
+        part = self.bucket.blob(f"{self.parts_prefix}{part_number:05d}")
+        part.upload_from_string(data)
+        return part
+
+    def complete(self, parts: list[Any]) -> None:
+        target = self.bucket.blob(self.blob_name)
+        target.compose(parts[:MAX_COMPOSE_SOURCES])
+        # The blob composed so far counts as one of the sources of the following compose requests
+        for index in range(MAX_COMPOSE_SOURCES, len(parts), MAX_COMPOSE_SOURCES - 1):
+            target.compose([target] + parts[index : index + MAX_COMPOSE_SOURCES - 1])
+        self.bucket.delete_blobs(parts)
+
+    def abort(self, parts: list[Any]) -> None:
+        self.bucket.delete_blobs(parts)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from email.utils import parsedate_to_datetime
+from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
 from astro.constants import FileLocation
-from astro.files.locations.base import BaseFileLocation
+from astro.files.locations.base import BaseFileLocation, FileMetadata
 
 
 class HTTPLocation(BaseFileLocation):
@@ -20,9 +22,34 @@ class HTTPLocation(BaseFileLocation):
     @property
     def size(self) -> int:
         """Return file size for HTTP location"""
+        metadata = self.stat()
+        if metadata is not None and metadata.size is not None:
+            return metadata.size
         file = urlopen(self.path)  # skipcq BAN-B310
         return int(file.length)
 
+    def get_metadata(self) -> FileMetadata | None:
+        """Fetch the file metadata with a single HEAD request"""
+        try:
+            with urlopen(Request(self.path, method="HEAD")) as response:  # skipcq BAN-B310
+                headers = response.headers
+        except HTTPError as error:
+            if error.code in (404, 410):
+                return None
+            # Some servers don't allow HEAD requests
+            return super().get_metadata()
+        except URLError:
+            # The server can't be reached
+            return None
+        content_length = headers.get("Content-Length")
+        last_modified = headers.get("Last-Modified")
+        return FileMetadata(
+            path=self.path,
+            size=int(content_length) if content_length is not None else None,
+            etag=headers.get("ETag"),
+            mtime=parsedate_to_datetime(last_modified) if last_modified else None,
+        )
+
     @property
     def openlineage_dataset_namespace(self) -> str:
         """
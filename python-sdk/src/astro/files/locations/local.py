@@ -3,10 +3,15 @@ from __future__ import annotations
 import glob
 import os
 import pathlib
+import stat
+from datetime import datetime, timezone
+from typing import Callable, Iterator
 from urllib.parse import urlparse
 
+import pyarrow as pa
+
 from astro.constants import FileLocation
-from astro.files.locations.base import BaseFileLocation
+from astro.files.locations.base import BaseFileLocation, FileMetadata
 
 
 class LocalLocation(BaseFileLocation):
@@ -25,6 +30,111 @@ class LocalLocation(BaseFileLocation):
             paths = glob.glob(url.path)
         return paths
 
+    def iter_files(self, suffix: str | None = None) -> Iterator[FileMetadata]:
+        """
+        Lazily list the files matching the path, along with their size and last modification time.
+        Directories are skipped.
+
+        :param suffix: Only list files whose path ends with this suffix (e.g. ``.csv``)
+        """
+        url = urlparse(self.path)
+        path_object = pathlib.Path(url.path)
+        filepaths: Iterator[str]
+        if path_object.is_dir():
+            filepaths = (str(filepath) for filepath in path_object.rglob(f"*{suffix or ''}"))
+        else:
+            filepaths = glob.iglob(url.path)
+
+        for filepath in filepaths:
+            if suffix is not None and not filepath.endswith(suffix):
+                continue
+            file_stat = os.stat(filepath)
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+            yield FileMetadata(
+                path=filepath,
+                size=file_stat.st_size,
+                mtime=datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc),
+            )
+
+    @property
+    def supports_directory_listing(self) -> bool:
+        """Directories can be listed, unless the path is a glob pattern or a single file"""
+        return pathlib.Path(urlparse(self.path).path).is_dir()
+
+    def list_directory(self, directory: str) -> tuple[list[str], list[FileMetadata]]:
+        """
+        List the subdirectories and files directly under a local directory.
+
+        :param directory: Path to the directory, ending with a slash
+        :return: The paths to the subdirectories, ending with a slash, and the metadata of the files
+        """
+        subdirectories: list[str] = []
+        files: list[FileMetadata] = []
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.is_dir():
+                    subdirectories.append(entry.path + "/")
+                elif entry.is_file():
+                    file_stat = entry.stat()
+                    files.append(
+                        FileMetadata(
+                            path=entry.path,
+                            size=file_stat.st_size,
+                            mtime=datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc),
+                        )
+                    )
+        return subdirectories, files
+
+    @property
+    def supports_memory_map(self) -> bool:
+        """
+        Local files can be memory-mapped, unless they are empty or compressed (smart_open decompresses those
+        on the fly, based on their extension).
+        """
+        path = pathlib.Path(self.path)
+        return not self.is_compressed and path.is_file() and path.stat().st_size > 0
+
+    def open_memory_map(self) -> pa.NativeFile:
+        """Open the local file as a read-only memory map.
+
+        :return: A pyarrow memory-mapped file
+        """
+        return pa.memory_map(self.path, "r")
+
+    @property
+    def supports_ranged_reads(self) -> bool:
+        """Byte ranges of local files can be read independently, unless smart_open decompresses the file"""
+        return not self.is_compressed and pathlib.Path(self.path).is_file()
+
+    def get_byte_range_reader(self, max_concurrency: int) -> Callable[[int, int], bytes]:  # skipcq: PYL-W0613
+        """
+        Return a callable which reads a byte range of the file. Each call opens the file, so that the callable
+        can be used from several threads.
+
+        :param max_concurrency: Maximum number of byte ranges which will be read at the same time
+        """
+        path = self.path
+
+        def read_byte_range(start: int, end: int) -> bytes:
+            with open(path, "rb") as stream:
+                stream.seek(start)
+                return stream.read(end - start + 1)
+
+        return read_byte_range
+
+    def delete_files(self, paths: list[str]) -> None:
+        """
+        Delete local files. Files which don't exist are ignored.
+
+        :param paths: Paths to the files to delete
+        """
+        for path in paths:
+            try:
+                os.remove(urlparse(path).path)
+            except FileNotFoundError:
+                continue
+
     @property
     def size(self) -> int:
         """Return the size in bytes of the given file.
@@ -34,6 +144,20 @@ class LocalLocation(BaseFileLocation):
         path = pathlib.Path(self.path)
         return os.path.getsize(path)
 
+    def get_metadata(self) -> FileMetadata | None:
+        """Fetch the file metadata with a single stat call"""
+        try:
+            file_stat = os.stat(self.path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return FileMetadata(
+            path=self.path,
+            size=file_stat.st_size,
+            mtime=datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc),
+        )
+
     @property
     def openlineage_dataset_namespace(self) -> str:
         """
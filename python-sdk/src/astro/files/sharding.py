@@ -0,0 +1,242 @@
+"""
+Parse a single large file with a pool of processes, by splitting it into byte ranges aligned to record boundaries.
+
+Only file types whose records are separated by newlines (see ``FileType.supports_sharded_reads``) can be split
+this way, and only from locations supporting ranged reads. Each process fetches its own byte range, so that the
+content of the file isn't sent between processes.
+
+A newline inside a quoted CSV value can't be told apart from a record boundary without reading the file from the
+start. The processes also count the quote characters of their byte range: when the number of quotes preceding a
+boundary is odd, the boundary falls within a quoted value, and the byte ranges around it are parsed again as one.
+"""
+from __future__ import annotations
+
+import io
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+import pandas as pd
+
+from astro import settings
+
+if TYPE_CHECKING:  # pragma: no cover
+    from astro.files.base import File
+
+# Number of bytes fetched at a time when looking for the end of a line
+NEWLINE_PROBE_SIZE = 64 * 1024
+
+# Options of the file readers which are supported when parsing byte ranges separately
+SHARDED_READ_OPTIONS = {"columns", "filters", "columns_names_capitalization"}
+
+
+def find_line_end(read_byte_range: Callable[[int, int], bytes], offset: int, size: int) -> int | None:
+    """
+    Return the offset of the first newline at or after ``offset``, or None if the file doesn't have any.
+
+    :param read_byte_range: Callable returning the bytes between two offsets (both inclusive) of the file
+    :param offset: Offset the search starts from
+    :param size: Size of the file in bytes
+    """
+    while offset < size:
+        data = read_byte_range(offset, min(offset + NEWLINE_PROBE_SIZE, size) - 1)
+        position = data.find(b"\n")
+        if position != -1:
+            return offset + position
+        offset += len(data)
+    return None
+
+
+def find_record_boundaries(
+    read_byte_range: Callable[[int, int], bytes], start: int, size: int, shard_size: int
+) -> list[int]:
+    """
+    Split the bytes between ``start`` and the end of the file into ranges of about ``shard_size`` bytes, each
+    starting right after a newline. Return the offsets delimiting the ranges, including ``start`` and ``size``.
+
+    :param read_byte_range: Callable returning the bytes between two offsets (both inclusive) of the file
+    :param start: Offset of the first record
+    :param size: Size of the file in bytes
+    :param shard_size: Approximate size of each byte range
+    """
+    boundaries = [start]
+    offset = start + shard_size
+    while offset < size:
+        # A record starting exactly at the offset is kept whole, since the preceding byte is its newline
+        line_end = find_line_end(read_byte_range, offset - 1, size)
+        if line_end is None or line_end + 1 >= size:
+            break
+        boundaries.append(line_end + 1)
+        offset = line_end + 1 + shard_size
+    boundaries.append(size)
+    return boundaries
+
+
+def read_shard(file: File, start: int, end: int, header: bytes, **kwargs) -> tuple[pd.DataFrame | None, int]:
+    """
+    Fetch and parse the records between two offsets of a file. Run by the processes of the pool.
+
+    :param file: File being read
+    :param start: Offset of the first byte of the range
+    :param end: Offset following the last byte of the range
+    :param header: Header line of the file, parsed along with the records
+    :return: The dataframe, or None if the byte range couldn't be parsed, and the number of quote characters
+        found in the range
+    """
+    data = file.location.get_byte_range_reader(1)(start, end - 1)
+    quote_char = file.type.quote_char
+    quote_count = data.count(quote_char.encode()) if quote_char else 0
+    try:
+        if not data.strip():
+            return pd.DataFrame(), quote_count
+        stream = io.TextIOWrapper(io.BytesIO(header + data), encoding="utf-8")
+        df = file.type.export_to_dataframe(stream, **kwargs)
+    except Exception:  # skipcq: PYL-W0703
+        # The range may start or end within a quoted value, which the parent process finds out from the quotes.
+        # Genuine errors are raised when the parent process parses the range again.
+        return None, quote_count
+    return pd.DataFrame(df), quote_count
+
+
+class _PendingByteRanges:
+    """
+    Byte ranges submitted to the pool of processes, in the order of the file. Each range taken out of the queue is
+    replaced by the next one, so that at most ``max_pending`` ranges are parsed or held in memory at any time.
+
+    :param submit: Submit the parsing of the range between two offsets, returning its future
+    :param byte_ranges: Offsets of the first byte, and following the last byte, of each range
+    :param max_pending: Number of ranges submitted ahead
+    """
+
+    def __init__(
+        self, submit: Callable[[int, int], Future], byte_ranges: Iterable[tuple[int, int]], max_pending: int
+    ):
+        self._submit = submit
+        self._byte_ranges = iter(byte_ranges)
+        self._pending: deque[tuple[int, int, Future]] = deque()
+        for _ in range(max_pending):
+            self._submit_next()
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def pop(self) -> tuple[int, int, Future]:
+        """Take the first pending range out of the queue, and submit the next one"""
+        byte_range = self._pending.popleft()
+        self._submit_next()
+        return byte_range
+
+    def cancel(self) -> None:
+        """Cancel the ranges which weren't parsed yet"""
+        for _, _, future in self._pending:
+            future.cancel()
+
+    def _submit_next(self) -> None:
+        byte_range = next(self._byte_ranges, None)
+        if byte_range is not None:
+            self._pending.append((*byte_range, self._submit(*byte_range)))
+
+
+class ShardedFileReader:
+    """
+    Parse the byte ranges of a file in a pool of processes, returning their dataframes in the order of the file.
+    At most twice as many byte ranges as processes are parsed or held in memory at any time.
+
+    :param file: File to read, whose type supports sharded reads and whose location supports ranged reads
+    :param shard_size: Approximate size of each byte range. Defaults to ``settings.SHARDED_READ_SHARD_SIZE``
+    :param max_workers: Number of processes. Defaults to ``settings.SHARDED_READ_MAX_WORKERS``
+    """
+
+    def __init__(self, file: File, shard_size: int | None = None, max_workers: int | None = None):
+        self.file = file
+        self.shard_size = shard_size or settings.SHARDED_READ_SHARD_SIZE
+        self.max_workers = max_workers or settings.SHARDED_READ_MAX_WORKERS
+
+    def iter_dataframes(self, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Parse the file, yielding a dataframe per byte range.
+
+        :param kwargs: Options of the file type reader, see ``SHARDED_READ_OPTIONS``
+        """
+        size = self.file.size
+        read_byte_range = self.file.location.get_byte_range_reader(1)
+        header_and_start = self._read_header(read_byte_range, size)
+        if header_and_start is None:
+            # The file has no record, or its header spans several lines
+            yield self._read_in_process(b"", 0, size, **kwargs)
+            return
+
+        header, start = header_and_start
+        boundaries = find_record_boundaries(read_byte_range, start, size, self.shard_size)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from self._parse_byte_ranges(
+                executor, list(zip(boundaries, boundaries[1:])), header, **kwargs
+            )
+
+    def _read_header(
+        self, read_byte_range: Callable[[int, int], bytes], size: int
+    ) -> tuple[bytes, int] | None:
+        """
+        Return the header line of the file (empty if its type has none) and the offset of its first record, or None
+        if the file can't be split: it has no record, or its header spans several lines.
+
+        :param read_byte_range: Callable returning the bytes between two offsets (both inclusive) of the file
+        :param size: Size of the file in bytes
+        """
+        if not self.file.type.has_header_line:
+            return b"", 0
+        header_end = find_line_end(read_byte_range, 0, size)
+        if header_end is None:
+            return None
+        header = read_byte_range(0, header_end)
+        quote_char = self.file.type.quote_char
+        if quote_char and header.count(quote_char.encode()) % 2:
+            return None
+        return header, header_end + 1
+
+    def _parse_byte_ranges(
+        self, executor: ProcessPoolExecutor, byte_ranges: list[tuple[int, int]], header: bytes, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse the byte ranges in the pool of processes, yielding their dataframes in the order of the file.
+
+        :param executor: Pool of processes
+        :param byte_ranges: Offsets of the first byte, and following the last byte, of each range
+        :param header: Header line of the file, parsed along with the records
+        """
+        pending = _PendingByteRanges(
+            lambda start, end: executor.submit(read_shard, self.file, start, end, header, **kwargs),
+            byte_ranges,
+            max_pending=2 * self.max_workers,
+        )
+        try:
+            while pending:
+                byte_range_start, byte_range_end, future = pending.pop()
+                df, quote_count = future.result()
+                if df is None or quote_count % 2:
+                    # The end of the range is within a quoted value: it is merged with the following ranges, until
+                    # the number of quotes is even again. Ranges which failed to parse are also parsed again, so
+                    # that genuine errors are raised.
+                    while quote_count % 2 and pending:
+                        _, byte_range_end, future = pending.pop()
+                        quote_count += future.result()[1]
+                    df = self._parse_again(executor, header, byte_range_start, byte_range_end, **kwargs)
+                yield df
+        finally:
+            # The ranges which weren't parsed yet are dropped if the reading stops early
+            pending.cancel()
+
+    def _parse_again(
+        self, executor: ProcessPoolExecutor, header: bytes, start: int, end: int, **kwargs
+    ) -> pd.DataFrame:
+        """Parse merged byte ranges in the pool, or in the current process to raise the parsing error"""
+        df, _ = executor.submit(read_shard, self.file, start, end, header, **kwargs).result()
+        if df is None:
+            df = self._read_in_process(header, start, end, **kwargs)
+        return df
+
+    def _read_in_process(self, header: bytes, start: int, end: int, **kwargs) -> pd.DataFrame:
+        """Fetch and parse the records between two offsets of the file in the current process"""
+        data = self.file.location.get_byte_range_reader(1)(start, end - 1)
+        stream = io.TextIOWrapper(io.BytesIO(header + data), encoding="utf-8")
+        return pd.DataFrame(self.file.type.export_to_dataframe(stream, **kwargs))
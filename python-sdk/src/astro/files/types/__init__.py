@@ -3,10 +3,13 @@ from __future__ import annotations
 import pathlib
 
 from astro.constants import FileType as FileTypeConstants
+from astro.files.types.arrow import ArrowFileType, FeatherFileType
+from astro.files.types.avro import AvroFileType
 from astro.files.types.base import FileType
 from astro.files.types.csv import CSVFileType
 from astro.files.types.json import JSONFileType
 from astro.files.types.ndjson import NDJSONFileType
+from astro.files.types.orc import ORCFileType
 from astro.files.types.parquet import ParquetFileType
 
 
@@ -21,6 +24,10 @@ def create_file_type(
         FileTypeConstants.JSON: JSONFileType,
         FileTypeConstants.NDJSON: NDJSONFileType,
         FileTypeConstants.PARQUET: ParquetFileType,
+        FileTypeConstants.ARROW: ArrowFileType,
+        FileTypeConstants.FEATHER: FeatherFileType,
+        FileTypeConstants.ORC: ORCFileType,
+        FileTypeConstants.AVRO: AvroFileType,
     }
     if not filetype:
         filetype = get_filetype(path)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
+from astro.files.types.base import FileType, WritableStream
+from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe, get_columns_to_read
+
+
+class ArrowFileType(FileType):
+    """Concrete implementation to handle Arrow IPC files (Feather version 2)"""
+
+    def export_to_dataframe(self, stream, columns_names_capitalization="original", **kwargs):
+        """read Arrow IPC file from one of the supported locations and return dataframe
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframe
+        :param nrows: Only convert the first rows of the file
+        :param columns: Only read these columns (and the ones used by ``filters``)
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
+        """
+        nrows = kwargs.pop("nrows", None)
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+
+        table = feather.read_table(
+            self._convert_remote_file_to_byte_stream(stream),
+            columns=get_columns_to_read(columns, filters),
+            memory_map=False,
+        )
+        if nrows is not None:
+            table = table.slice(0, nrows)
+        df = filter_dataframe(table.to_pandas(**kwargs), columns=columns, filters=filters)
+        return convert_columns_names_capitalization(
+            df=df, columns_names_capitalization=columns_names_capitalization
+        )
+
+    def read_record_batches(
+        self, stream, batch_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the Arrow IPC file as record batches, decoding one batch of the file at a time
+
+        :param stream: file stream object
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        if kwargs:
+            yield from super().read_record_batches(stream, batch_size=batch_size, **kwargs)
+            return
+        reader = pa.ipc.open_file(self._convert_remote_file_to_byte_stream(stream))
+        for index in range(reader.num_record_batches):
+            yield from pa.Table.from_batches([reader.get_batch(index)]).to_batches(max_chunksize=batch_size)
+
+    def write_record_batches(self, batches: Iterable[pa.RecordBatch], stream) -> None:
+        """Write Arrow record batches to an Arrow IPC file, one batch at a time
+
+        :param batches: Record batches sharing the same schema
+        :param stream: file stream object
+        """
+        writer = None
+        for batch in batches:
+            if writer is None:
+                writer = pa.ipc.new_file(stream, batch.schema)
+            writer.write_batch(batch)
+        if writer is not None:
+            writer.close()
+
+    # We need skipcq because it's a method overloading so we don't want to make it a static method
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
+        """Write Arrow IPC file to one of the supported locations. The buffers aren't compressed, so that
+        readers can memory-map the file without copies.
+
+        :param df: pandas dataframe
+        :param stream: file stream object
+        """
+        feather.write_feather(df, stream, compression="uncompressed")
+
+    @property
+    def reads_whole_file(self) -> bool:
+        return True
+
+    @property
+    def is_binary(self) -> bool:
+        return True
+
+    @property
+    def name(self):
+        return FileTypeConstants.ARROW
+
+
+class FeatherFileType(ArrowFileType):
+    """Concrete implementation to handle Feather files, which are Arrow IPC files"""
+
+    @property
+    def name(self):
+        return FileTypeConstants.FEATHER
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterator
+
+import pandas as pd
+
+from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
+from astro.dataframes.pandas import PandasDataframe
+from astro.files.types.base import FileType, WritableStream
+from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe
+
+# Number of dataframe rows converted to Avro records at a time when writing a file
+AVRO_WRITE_CHUNK_SIZE = 10000
+
+
+def _import_fastavro():
+    """Import fastavro, which is an optional dependency of the SDK"""
+    try:
+        import fastavro
+    except ImportError:
+        raise ImportError(
+            "Reading and writing Avro files requires fastavro, which is installed by the avro extra: "
+            "pip install 'astro-sdk-python[avro]'"
+        )
+    return fastavro
+
+
+class AvroFileType(FileType):
+    """Concrete implementation to handle Avro file type"""
+
+    def export_to_dataframe(self, stream, columns_names_capitalization="original", **kwargs):
+        """read Avro file from one of the supported locations and return dataframe
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframe
+        :param nrows: Only decode the first records of the file
+        :param columns: Only keep these columns
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
+        """
+        chunks = self.export_to_dataframe_chunks(
+            stream, columns_names_capitalization=columns_names_capitalization, **kwargs
+        )
+        return PandasDataframe.from_pandas_df(pd.concat(list(chunks), ignore_index=True))
+
+    @property
+    def supports_chunked_reads(self) -> bool:
+        """Avro records are decoded one block of the file at a time"""
+        return True
+
+    def export_to_dataframe_chunks(
+        self, stream, chunk_size: int = DEFAULT_CHUNK_SIZE, columns_names_capitalization="original", **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Read Avro file from one of the supported locations as a sequence of dataframes, holding at most
+        ``chunk_size`` records in memory at a time.
+
+        :param stream: file stream object
+        :param chunk_size: Maximum number of rows in each dataframe
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframe
+        :param nrows: Only decode the first records of the file
+        :param columns: Only keep these columns
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
+        """
+        fastavro = _import_fastavro()
+        nrows = kwargs.pop("nrows", None)
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+
+        reader = fastavro.reader(stream)
+        field_names = [field["name"] for field in reader.writer_schema.get("fields", [])]
+        records = iter(reader) if nrows is None else islice(reader, nrows)
+        is_first_chunk = True
+        while True:
+            chunk = list(islice(records, chunk_size))
+            # The first chunk is returned even if the file has no records, so that the columns are known
+            if not chunk and not is_first_chunk:
+                break
+            is_first_chunk = False
+            df = pd.DataFrame.from_records(chunk, columns=field_names)
+            df = filter_dataframe(df, columns=columns, filters=filters)
+            yield convert_columns_names_capitalization(
+                df=df, columns_names_capitalization=columns_names_capitalization
+            )
+            if len(chunk) < chunk_size:
+                break
+
+    # We need skipcq because it's a method overloading so we don't want to make it a static method
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
+        """Write Avro file to one of the supported locations. The Avro schema is derived from the dataframe
+        dtypes, with every field nullable, and the records are converted a chunk of rows at a time. Timezone-aware
+        timestamps are written as ``timestamp-micros`` and naive ones as ``local-timestamp-micros``, so that both are
+        read back as they were written.
+
+        :param df: pandas dataframe
+        :param stream: file stream object
+        """
+        fastavro = _import_fastavro()
+        schema = {
+            "type": "record",
+            "name": "Row",
+            "fields": [
+                {"name": str(column), "type": ["null", self._get_avro_type(df[column])], "default": None}
+                for column in df.columns
+            ],
+        }
+        fastavro.writer(stream, fastavro.parse_schema(schema), self._iter_records(df), codec="deflate")
+
+    @staticmethod
+    def _get_avro_type(series: pd.Series) -> Any:
+        """Return the Avro type of the values of a dataframe column"""
+        if pd.api.types.is_bool_dtype(series):
+            return "boolean"
+        if pd.api.types.is_integer_dtype(series):
+            return "long"
+        if pd.api.types.is_float_dtype(series):
+            return "double"
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Naive timestamps are written as local ones, so that they are read back without a timezone
+            is_naive = not pd.api.types.is_datetime64tz_dtype(series)
+            return {
+                "type": "long",
+                "logicalType": "local-timestamp-micros" if is_naive else "timestamp-micros",
+            }
+        first_value = series.dropna().head(1)
+        if len(first_value) and isinstance(first_value.iloc[0], bytes):
+            return "bytes"
+        return "string"
+
+    @staticmethod
+    def _iter_records(df: pd.DataFrame) -> Iterator[dict]:
+        """Convert the rows of a dataframe to Avro records, replacing missing values by nulls"""
+        string_columns = [
+            column for column in df.columns if AvroFileType._get_avro_type(df[column]) == "string"
+        ]
+        for start in range(0, len(df), AVRO_WRITE_CHUNK_SIZE):
+            chunk = df.iloc[start : start + AVRO_WRITE_CHUNK_SIZE]
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            for column in string_columns:
+                chunk[column] = chunk[column].map(lambda value: value if value is None else str(value))
+            yield from chunk.to_dict("records")
+
+    @property
+    def is_binary(self) -> bool:
+        return True
+
+    @property
+    def name(self):
+        return FileTypeConstants.AVRO
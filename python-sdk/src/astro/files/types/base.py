@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import io
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator, Union
 
 import pandas as pd
+import pyarrow as pa
+
+from astro.constants import DEFAULT_CHUNK_SIZE
+
+# Binary streams files are written to: file objects, or streams uploading their content in parts
+WritableStream = Union[BinaryIO, io.RawIOBase]
 
 
 class FileType(ABC):
@@ -22,7 +29,7 @@ class FileType(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:
         """Write file to one of the supported locations
 
         :param df: pandas dataframe
@@ -30,6 +37,99 @@ class FileType(ABC):
         """
         raise NotImplementedError
 
+    @property
+    def is_binary(self) -> bool:  # skipcq: PYL-R0201
+        """Whether files of this type are read and written as bytes, instead of text"""
+        return False
+
+    @property
+    def supports_chunked_reads(self) -> bool:  # skipcq: PYL-R0201
+        """Whether ``export_to_dataframe_chunks`` parses the file incrementally, instead of reading it at once"""
+        return False
+
+    def export_to_dataframe_chunks(
+        self, stream, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Read file from one of the supported locations as a sequence of dataframes of at most ``chunk_size``
+        rows. File types which don't support chunked reads return a single dataframe.
+
+        :param stream: file stream object
+        :param chunk_size: Maximum number of rows in each dataframe
+        """
+        yield self.export_to_dataframe(stream, **kwargs)
+
+    @property
+    def reads_whole_file(self) -> bool:  # skipcq: PYL-R0201
+        """
+        Whether the reader needs the whole file in memory before parsing it (e.g. formats whose metadata is stored
+        in a footer), so that large objects may as well be downloaded in concurrent byte ranges
+        """
+        return False
+
+    @property
+    def supports_sharded_reads(self) -> bool:  # skipcq: PYL-R0201
+        """
+        Whether records are separated by newlines, so that byte ranges of the file starting after a newline can be
+        parsed independently (see ``astro.files.sharding``)
+        """
+        return False
+
+    @property
+    def has_header_line(self) -> bool:  # skipcq: PYL-R0201
+        """Whether the first line of the file names the columns, which is needed to parse any byte range"""
+        return False
+
+    @property
+    def quote_char(self) -> str | None:  # skipcq: PYL-R0201
+        """Character enclosing the values which may contain newlines, if any"""
+        return None
+
+    def read_record_batches(
+        self, stream, batch_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Read file from one of the supported locations as Arrow record batches.
+        File types without a native Arrow reader are read through a dataframe.
+
+        :param stream: file stream object
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        df = self.export_to_dataframe(stream, **kwargs)
+        yield from pa.Table.from_pandas(df, preserve_index=False).to_batches(max_chunksize=batch_size)
+
+    def write_record_batches(self, batches: Iterable[pa.RecordBatch], stream) -> None:
+        """Write Arrow record batches to a file in one of the supported locations.
+        File types without a native Arrow writer are written through a dataframe.
+
+        :param batches: Record batches sharing the same schema
+        :param stream: file stream object
+        """
+        batches = list(batches)
+        df = pa.Table.from_batches(batches).to_pandas() if batches else pd.DataFrame()
+        self.create_from_dataframe(df=df, stream=stream)
+
+    @staticmethod
+    def _convert_remote_file_to_byte_stream(stream) -> io.IOBase:
+        """
+        Convert file stream into a buffer that can be streamed into other data
+        structures.
+        Due to noted issues with using parquet files with smart_open+pandas (like
+        https://github.com/RaRe-Technologies/smart_open/issues/524), we create a BytesIO buffer
+        before exporting to a dataframe. We've found a sizable speed improvement with this optimization
+        Pyarrow files (e.g. memory-mapped local files) and in-memory buffers (e.g. objects downloaded in parallel)
+        are returned as they are, since they can already be read without copies.
+        Returns: an io object that can be streamed into a dataframe (or other object)
+        """
+        if isinstance(stream, pa.NativeFile):
+            # Pyarrow files implement io.IOBase
+            native_file: io.IOBase = stream
+            return native_file
+        if isinstance(stream, io.BytesIO):
+            return stream
+        remote_obj_buffer = io.BytesIO()
+        remote_obj_buffer.write(stream.read())
+        remote_obj_buffer.seek(0)
+        return remote_obj_buffer
+
     @property
     @abstractmethod
     def name(self):
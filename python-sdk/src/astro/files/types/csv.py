@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import io
+from typing import Iterable, Iterator
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
-from astro.constants import FileType as FileTypeConstants
-from astro.dataframes.pandas import PandasDataframe
-from astro.files.types.base import FileType
+from astro import settings
+from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
+from astro.files.types.base import FileType, WritableStream
 from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe, get_columns_to_read
+
+PANDAS_ENGINE = "pandas"
+PYARROW_ENGINE = "pyarrow"
 
 
 class CSVFileType(FileType):
@@ -22,22 +29,125 @@ class CSVFileType(FileType):
         :param stream: file stream object
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
+        :param engine: ``pyarrow`` parses the file with the multithreaded pyarrow CSV reader, into Arrow-backed
+            columns, while ``pandas`` uses the default parser of ``pd.read_csv``. Other values are passed to
+            ``pd.read_csv``. Defaults to ``settings.CSV_ENGINE``
+        :param columns: Only parse these columns (and the ones used by ``filters``)
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
         """
-        df = pd.read_csv(stream, **kwargs)
-        df = convert_columns_names_capitalization(
+        engine = kwargs.pop("engine", settings.CSV_ENGINE)
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+        columns_to_read = get_columns_to_read(columns, filters)
+        if engine == PYARROW_ENGINE and set(kwargs) <= {"nrows"}:
+            df = self._read_csv_with_pyarrow(stream, nrows=kwargs.get("nrows"), columns=columns_to_read)
+        else:
+            if engine not in (PANDAS_ENGINE, PYARROW_ENGINE):
+                kwargs["engine"] = engine
+            if columns_to_read is not None:
+                kwargs["usecols"] = columns_to_read
+            df = pd.read_csv(stream, **kwargs)
+        df = filter_dataframe(df, columns=columns, filters=filters)
+        return convert_columns_names_capitalization(
             df=df, columns_names_capitalization=columns_names_capitalization
         )
-        return PandasDataframe.from_pandas_df(df)
+
+    def read_record_batches(
+        self, stream, batch_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the csv file as Arrow record batches, parsed block by block by the pyarrow CSV reader
+
+        :param stream: binary or text file stream object
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        if kwargs:
+            yield from super().read_record_batches(stream, batch_size=batch_size, **kwargs)
+            return
+        reader = pa_csv.open_csv(
+            self._get_binary_stream(stream), read_options=pa_csv.ReadOptions(use_threads=True)
+        )
+        for batch in reader:
+            for offset in range(0, batch.num_rows, batch_size):
+                yield batch.slice(offset, batch_size)
+
+    def write_record_batches(self, batches: Iterable[pa.RecordBatch], stream) -> None:
+        """Write Arrow record batches to a csv file, one batch at a time
+
+        :param batches: Record batches sharing the same schema
+        :param stream: binary file stream object
+        """
+        writer = None
+        for batch in batches:
+            if writer is None:
+                writer = pa_csv.CSVWriter(stream, batch.schema)
+            writer.write_batch(batch)
+        if writer is not None:
+            writer.close()
+
+    @staticmethod
+    def _get_binary_stream(stream):
+        """Return the binary stream underlying a text stream, since the pyarrow CSV reader only reads bytes"""
+        if isinstance(stream, io.TextIOWrapper):
+            return stream.buffer
+        if isinstance(stream, io.StringIO):
+            return io.BytesIO(stream.getvalue().encode())
+        return stream
+
+    @classmethod
+    def _read_csv_with_pyarrow(
+        cls, stream, nrows: int | None = None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Parse the CSV content in blocks, using multiple threads, and convert it to a dataframe with the usual NumPy
+        dtypes, which the database loaders support. If ``nrows`` is given, only the blocks containing the first
+        rows are parsed.
+
+        :param stream: binary or text file stream object
+        :param nrows: Number of rows to read
+        :param columns: Only convert these columns
+        """
+        stream = cls._get_binary_stream(stream)
+        read_options = pa_csv.ReadOptions(use_threads=True)
+        convert_options = pa_csv.ConvertOptions(include_columns=columns) if columns is not None else None
+        if nrows is None:
+            table = pa_csv.read_csv(stream, read_options=read_options, convert_options=convert_options)
+        else:
+            reader = pa_csv.open_csv(stream, read_options=read_options, convert_options=convert_options)
+            batches = []
+            remaining_rows = nrows
+            while remaining_rows > 0:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    break
+                batches.append(batch.slice(0, remaining_rows))
+                remaining_rows -= batches[-1].num_rows
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+        return table.to_pandas()
 
     # We need skipcq because it's a method overloading so we don't want to make it a static method
-    def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
-        """Write csv file to one of the supported locations
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
+        """Write csv file to one of the supported locations. Files are always written by pandas, whatever the
+        engine used to read them, since the pyarrow writer quotes every string and writes booleans in lowercase.
 
         :param df: pandas dataframe
         :param stream: file stream object
         """
         df.to_csv(stream, index=False)
 
+    @property
+    def supports_sharded_reads(self) -> bool:
+        """CSV records are separated by newlines, except the ones within quoted values"""
+        return True
+
+    @property
+    def has_header_line(self) -> bool:
+        return True
+
+    @property
+    def quote_char(self) -> str | None:
+        return '"'
+
     @property
     def name(self):
         return FileTypeConstants.CSV
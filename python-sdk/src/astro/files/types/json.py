@@ -1,13 +1,182 @@
 from __future__ import annotations
 
 import io
+import json
+import re
+from itertools import islice
+from typing import Any, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
-from astro.constants import FileType as FileTypeConstants
+from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
 from astro.dataframes.pandas import PandasDataframe
-from astro.files.types.base import FileType
+from astro.files.types.base import FileType, WritableStream
 from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe
+
+# Number of characters read from the stream at a time when parsing a JSON array incrementally
+JSON_READ_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class JSONArrayReader:
+    """
+    Split a top-level JSON array into the JSON text of its items, reading the stream one block at a time. Only the
+    current block and the item being parsed are held in memory, whatever the size of the document.
+
+    :param stream: Text stream of the JSON document
+    """
+
+    def __init__(self, stream: io.TextIOBase):
+        self.stream = stream
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character of the document, without consuming it ("" at the end)"""
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more(JSON_READ_SIZE):
+                return ""
+
+    def read_remaining(self) -> str:
+        """Return the rest of the document, read at once"""
+        return self._buffer[self._position :] + self.stream.read()
+
+    def __iter__(self) -> Iterator[str]:
+        if self.peek() != "[":
+            raise ValueError("The JSON document is not an array")
+        self._position += 1
+        if self.peek() == "]":
+            return
+        while True:
+            self.peek()
+            yield self._read_item()
+            separator = self.peek()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expecting ',' or ']' after an item of the JSON array, found {separator!r}")
+            self._position += 1
+
+    def _read_item(self) -> str:
+        while True:
+            try:
+                _, end = _DECODER.raw_decode(self._buffer, self._position)
+                # An item ending with the buffer may be truncated (e.g. a number), unless the stream is exhausted
+                if end < len(self._buffer) or self._exhausted:
+                    item = self._buffer[self._position : end]
+                    self._position = end
+                    return item
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            # Items bigger than a block are read by doubling the buffer, so that they are parsed a few times only
+            self._read_more(max(JSON_READ_SIZE, len(self._buffer) - self._position))
+
+    def _read_more(self, size: int) -> bool:
+        """Append the next block of the stream to the buffer, discarding what was already consumed"""
+        data = self.stream.read(size)
+        if not data:
+            self._exhausted = True
+            return False
+        self._buffer = self._buffer[self._position :] + data
+        self._position = 0
+        return True
+
+
+class JSONColumnTypes:
+    """
+    Types of the columns of a JSON array parsed in chunks, reconciled across all the chunks the way pandas types the
+    columns of a whole document: integer columns holding nulls are read as floats, numeric columns holding both
+    integers and floats as floats, and the columns holding other mixes of values as objects.
+    """
+
+    def __init__(self):
+        # Dtype of each column, or None while only nulls were seen
+        self._dtypes: dict[str, Any] = {}
+        self._nullable_columns: set[str] = set()
+        # Arrow type of the values of the object columns, which can't be inferred from chunks holding only nulls
+        self._arrow_types: dict[str, pa.DataType] = {}
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Reconcile the types of the columns with the ones pandas inferred for a chunk
+
+        :param df: Chunk of the JSON array
+        """
+        for name, series in df.items():
+            if series.empty:
+                continue
+            nulls = series.isna()
+            if nulls.any():
+                self._nullable_columns.add(name)
+            if nulls.all():
+                self._dtypes.setdefault(name, None)
+                continue
+            self._dtypes[name] = _reconcile_dtypes(self._dtypes.get(name), series.dtype)
+            if series.dtype == object and name not in self._arrow_types:
+                self._arrow_types[name] = pa.array(series, from_pandas=True).type
+
+    @property
+    def dtypes(self) -> dict[str, Any]:
+        """Dtype of the columns holding values, promoted to hold nulls where the column has any"""
+        dtypes = {}
+        for name, dtype in self._dtypes.items():
+            if dtype is None:
+                continue
+            if name in self._nullable_columns and pd.api.types.is_integer_dtype(dtype):
+                dtype = np.dtype("float64")
+            elif name in self._nullable_columns and pd.api.types.is_bool_dtype(dtype):
+                dtype = np.dtype("object")
+            dtypes[name] = dtype
+        return dtypes
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the columns of a chunk to the reconciled types
+
+        :param df: Chunk of the JSON array
+        """
+        dtypes = {
+            name: dtype
+            for name, dtype in self.dtypes.items()
+            if name in df.columns and df[name].dtype != dtype
+        }
+        return df.astype(dtypes) if dtypes else df
+
+    def get_schema(self, df: pd.DataFrame) -> pa.Schema:
+        """
+        Return the Arrow schema of a chunk converted to the reconciled types, typing the object columns after the
+        values they hold in the other chunks
+
+        :param df: Chunk of the JSON array, converted by ``apply``
+        """
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        for index, field in enumerate(schema):
+            arrow_type = self._arrow_types.get(field.name)
+            if arrow_type is not None and df[field.name].dtype == object:
+                schema = schema.set(index, field.with_type(arrow_type))
+        return schema
+
+
+def _reconcile_dtypes(dtype: Any, other_dtype: Any) -> Any:
+    """Return the dtype pandas gives to a column holding values of both dtypes (None standing for no values)"""
+    if dtype is None or dtype == other_dtype:
+        return other_dtype
+    if all(
+        pd.api.types.is_numeric_dtype(value) and not pd.api.types.is_bool_dtype(value)
+        for value in (dtype, other_dtype)
+    ):
+        return np.dtype("float64")
+    return np.dtype("object")
 
 
 class JSONFileType(FileType):
@@ -25,18 +194,148 @@ class JSONFileType(FileType):
         :param stream: file stream object
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
+        :param nrows: Only parse the first items of the top-level array
+        :param columns: Only keep these columns
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
         """
+        if kwargs.get("nrows") is not None:
+            chunks = self.export_to_dataframe_chunks(
+                stream,
+                chunk_size=max(kwargs["nrows"], 1),
+                columns_names_capitalization=columns_names_capitalization,
+                **kwargs,
+            )
+            return PandasDataframe.from_pandas_df(pd.concat(list(chunks), ignore_index=True))
+
         kwargs_copy = dict(kwargs)
-        # Pandas `read_json` does not support the `nrows` parameter unless we're using NDJSON
         kwargs_copy.pop("nrows", None)
+        columns = kwargs_copy.pop("columns", None)
+        filters = kwargs_copy.pop("filters", None)
         df = pd.read_json(stream, **kwargs_copy)
-        df = convert_columns_names_capitalization(
+        return self._select(df, columns, filters, columns_names_capitalization)
+
+    @property
+    def supports_chunked_reads(self) -> bool:
+        """Top-level JSON arrays are parsed incrementally"""
+        return True
+
+    def export_to_dataframe_chunks(
+        self,
+        stream: io.TextIOWrapper,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        columns_names_capitalization="original",
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """Read json file from one of the supported locations as a sequence of dataframes. Top-level arrays are
+        parsed incrementally, so that at most ``chunk_size`` items are held in memory at a time. Other documents
+        are read as a single dataframe.
+        Arrays of seekable streams are parsed twice: the types pandas infers for each chunk are first reconciled
+        over the whole array (see ``JSONColumnTypes``), so that all the chunks share the types a whole document
+        would have.
+
+        :param stream: file stream object
+        :param chunk_size: Maximum number of rows in each dataframe
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframe
+        :param nrows: Only parse the first items of the top-level array
+        :param columns: Only keep these columns
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
+        """
+        for df, _ in self._iter_typed_chunks(stream, chunk_size, columns_names_capitalization, **kwargs):
+            yield df
+
+    def read_record_batches(
+        self, stream, batch_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Read json file from one of the supported locations as Arrow record batches, parsing top-level arrays
+        incrementally. The batches share the schema of the types reconciled over the whole array, or of the first
+        chunk if the stream can't be parsed twice.
+
+        :param stream: file stream object
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        schema = None
+        for df, column_types in self._iter_typed_chunks(stream, batch_size, **kwargs):
+            if column_types is not None:
+                schema = column_types.get_schema(df)
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            schema = schema or table.schema
+            yield from table.to_batches(max_chunksize=batch_size)
+
+    def _iter_typed_chunks(
+        self, stream: io.TextIOWrapper, chunk_size: int, columns_names_capitalization="original", **kwargs
+    ) -> Iterator[tuple[pd.DataFrame, JSONColumnTypes | None]]:
+        """
+        Read the json file as a sequence of dataframes, along with the column types reconciled across them, if the
+        file is an array which was parsed twice
+
+        :param stream: file stream object
+        :param chunk_size: Maximum number of rows in each dataframe
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframe
+        """
+        nrows = kwargs.pop("nrows", None)
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+
+        start = stream.tell() if stream.seekable() else None
+        reader = JSONArrayReader(stream)
+        if reader.peek() != "[":
+            df = pd.read_json(io.StringIO(reader.read_remaining()), **kwargs)
+            yield self._select(
+                df if nrows is None else df.head(nrows), columns, filters, columns_names_capitalization
+            ), None
+            return
+
+        column_types = None
+        # A single chunk has consistent types already
+        if start is not None and (nrows is None or nrows > chunk_size):
+            column_types = JSONColumnTypes()
+            for df in self._parse_chunks(reader, chunk_size, nrows, kwargs):
+                column_types.update(self._select(df, columns, filters, columns_names_capitalization))
+            stream.seek(start)
+            reader = JSONArrayReader(stream)
+
+        is_empty = True
+        for df in self._parse_chunks(reader, chunk_size, nrows, kwargs):
+            df = self._select(df, columns, filters, columns_names_capitalization)
+            yield (df if column_types is None else column_types.apply(df)), column_types
+            is_empty = False
+        if is_empty:
+            yield PandasDataframe(), column_types
+
+    @staticmethod
+    def _parse_chunks(
+        reader: JSONArrayReader, chunk_size: int, nrows: int | None, read_kwargs: dict
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse the items of a JSON array in chunks of at most ``chunk_size`` items
+
+        :param reader: Reader of the JSON array
+        :param chunk_size: Maximum number of items in each chunk
+        :param nrows: Only parse the first items of the array
+        :param read_kwargs: Options passed to ``pd.read_json``
+        """
+        items = iter(reader) if nrows is None else islice(reader, nrows)
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                return
+            # Pandas parses the chunk as a document, so that types are inferred the same way as for whole files
+            yield pd.read_json(io.StringIO("[" + ",".join(chunk) + "]"), **read_kwargs)
+
+    @staticmethod
+    def _select(
+        df: pd.DataFrame, columns: list[str] | None, filters, columns_names_capitalization
+    ) -> pd.DataFrame:
+        """Apply the projection, the row filter and the column names capitalization to a parsed dataframe"""
+        df = filter_dataframe(df, columns=columns, filters=filters)
+        return convert_columns_names_capitalization(
             df=df, columns_names_capitalization=columns_names_capitalization
         )
-        return PandasDataframe.from_pandas_df(df)
 
     # We need skipcq because it's a method overloading so we don't want to make it a static method
-    def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
         """Write json file to one of the supported locations
 
         :param df: pandas dataframe
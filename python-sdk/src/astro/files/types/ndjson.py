@@ -6,9 +6,9 @@ import json
 import pandas as pd
 
 from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
-from astro.dataframes.pandas import PandasDataframe
-from astro.files.types.base import FileType
+from astro.files.types.base import FileType, WritableStream
 from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe
 
 
 class NDJSONFileType(FileType):
@@ -20,15 +20,19 @@ class NDJSONFileType(FileType):
         :param stream: file stream object
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
+        :param columns: Only keep these (flattened) columns
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
         """
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
         df = NDJSONFileType.flatten(self.normalize_config, stream, **kwargs)
-        df = convert_columns_names_capitalization(
+        df = filter_dataframe(df, columns=columns, filters=filters)
+        return convert_columns_names_capitalization(
             df=df, columns_names_capitalization=columns_names_capitalization
         )
-        return PandasDataframe.from_pandas_df(df)
 
     # We need skipcq because it's a method overloading so we don't want to make it a static method
-    def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
         """Write ndjson file to one of the supported locations
 
         :param df: pandas dataframe
@@ -36,6 +40,11 @@ class NDJSONFileType(FileType):
         """
         df.to_json(stream, orient="records", lines=True)
 
+    @property
+    def supports_sharded_reads(self) -> bool:
+        """Each line holds a JSON document, whose strings can't contain raw newlines"""
+        return True
+
     @property
     def name(self):
         return FileTypeConstants.NDJSON
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.orc as orc
+
+from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
+from astro.files.types.base import FileType, WritableStream
+from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe, get_columns_to_read
+
+
+class ORCFileType(FileType):
+    """Concrete implementation to handle ORC file type"""
+
+    def export_to_dataframe(self, stream, columns_names_capitalization="original", **kwargs):
+        """read ORC file from one of the supported locations and return dataframe
+
+        :param stream: file stream object
+        :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
+            in the resulting dataframe
+        :param nrows: Only decode the stripes holding the first rows of the file
+        :param columns: Only decode these columns (and the ones used by ``filters``)
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates
+        """
+        nrows = kwargs.pop("nrows", None)
+        columns = kwargs.pop("columns", None)
+        filters = kwargs.pop("filters", None)
+        columns_to_read = get_columns_to_read(columns, filters)
+
+        orc_file = orc.ORCFile(self._convert_remote_file_to_byte_stream(stream))
+        if nrows is None:
+            table = orc_file.read(columns=columns_to_read)
+        else:
+            stripes = []
+            row_count = 0
+            for index in range(orc_file.nstripes):
+                if row_count >= nrows:
+                    break
+                stripe = orc_file.read_stripe(index, columns=columns_to_read)
+                stripes.append(stripe)
+                row_count += stripe.num_rows
+            table = (
+                pa.Table.from_batches(stripes, schema=orc_file.schema)
+                if stripes
+                else orc_file.schema.empty_table()
+            )
+            table = table.slice(0, nrows)
+        df = filter_dataframe(table.to_pandas(**kwargs), columns=columns, filters=filters)
+        return convert_columns_names_capitalization(
+            df=df, columns_names_capitalization=columns_names_capitalization
+        )
+
+    def read_record_batches(
+        self, stream, batch_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the ORC file as Arrow record batches, decoding one stripe at a time
+
+        :param stream: file stream object
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        if kwargs:
+            yield from super().read_record_batches(stream, batch_size=batch_size, **kwargs)
+            return
+        orc_file = orc.ORCFile(self._convert_remote_file_to_byte_stream(stream))
+        for index in range(orc_file.nstripes):
+            yield from pa.Table.from_batches([orc_file.read_stripe(index)]).to_batches(
+                max_chunksize=batch_size
+            )
+
+    def write_record_batches(self, batches: Iterable[pa.RecordBatch], stream) -> None:
+        """Write Arrow record batches to an ORC file, one batch at a time
+
+        :param batches: Record batches sharing the same schema
+        :param stream: file stream object
+        """
+        writer = None
+        for batch in batches:
+            if writer is None:
+                writer = orc.ORCWriter(stream)
+            writer.write(pa.Table.from_batches([batch]))
+        if writer is not None:
+            writer.close()
+
+    # We need skipcq because it's a method overloading so we don't want to make it a static method
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
+        """Write ORC file to one of the supported locations
+
+        :param df: pandas dataframe
+        :param stream: file stream object
+        """
+        orc.write_table(pa.Table.from_pandas(df, preserve_index=False), stream)
+
+    @property
+    def reads_whole_file(self) -> bool:
+        return True
+
+    @property
+    def is_binary(self) -> bool:
+        return True
+
+    @property
+    def name(self):
+        return FileTypeConstants.ORC
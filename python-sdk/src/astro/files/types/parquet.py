@@ -1,13 +1,111 @@
 from __future__ import annotations
 
-import io
+from typing import Iterable, Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from astro.constants import FileType as FileTypeConstants
-from astro.dataframes.pandas import PandasDataframe
-from astro.files.types.base import FileType
+from astro import settings
+from astro.constants import DEFAULT_CHUNK_SIZE, FileType as FileTypeConstants
+from astro.files.types.base import FileType, WritableStream
 from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.filters import filter_dataframe, get_columns_to_read
+
+
+class ParquetRowGroupWriter:
+    """
+    Write a parquet file incrementally, appending row groups as data arrives. Rows are buffered until a full row
+    group of ``row_group_size`` rows can be written, so that small chunks don't produce small row groups.
+
+    :param stream: Binary stream the file is written to
+    :param schema: Schema of the file. Defaults to the schema of the first data written
+    :param row_group_size: Maximum number of rows in each row group. Defaults to ``settings.PARQUET_ROW_GROUP_SIZE``
+    :param writer_options: Options of ``pyarrow.parquet.ParquetWriter``, overriding the ones configured in the
+        settings (see ``ParquetFileType.get_writer_options``)
+    """
+
+    def __init__(
+        self,
+        stream,
+        schema: pa.Schema | None = None,
+        row_group_size: int | None = None,
+        **writer_options,
+    ):
+        self.stream = stream
+        self.schema = schema
+        self.row_group_size = row_group_size or settings.PARQUET_ROW_GROUP_SIZE
+        self.writer_options = {**ParquetFileType.get_writer_options(), **writer_options}
+        self._writer: pq.ParquetWriter | None = None
+        self._pending_batches: list[pa.RecordBatch] = []
+        self._pending_rows = 0
+        self._preserve_index: bool | None = None
+
+    def write_dataframe(self, df: pd.DataFrame) -> None:
+        """
+        Append the rows of a dataframe, converting them to Arrow one row group at a time. Non-default indexes
+        are stored as columns, so that pandas restores them.
+
+        :param df: pandas dataframe, with the same columns as the data previously written
+        """
+        if self._preserve_index is None:
+            self._preserve_index = not df.index.equals(pd.RangeIndex(len(df)))
+        if self.schema is None:
+            self.schema = pa.Schema.from_pandas(df, preserve_index=self._preserve_index)
+        self._open()
+        for start in range(0, len(df), self.row_group_size):
+            table = pa.Table.from_pandas(
+                df.iloc[start : start + self.row_group_size],
+                schema=self.schema,
+                preserve_index=self._preserve_index,
+            )
+            self.write_batches(table.to_batches())
+
+    def write_batches(self, batches: Iterable[pa.RecordBatch]) -> None:
+        """
+        Append Arrow record batches, writing a row group whenever enough rows are buffered.
+
+        :param batches: Record batches with the schema of the file
+        """
+        for batch in batches:
+            if self.schema is None:
+                self.schema = batch.schema
+            self._open()
+            self._pending_batches.append(batch)
+            self._pending_rows += batch.num_rows
+            while self._pending_rows >= self.row_group_size:
+                table = pa.Table.from_batches(self._pending_batches, schema=self.schema)
+                self._writer.write_table(  # type: ignore[union-attr]
+                    table.slice(0, self.row_group_size), row_group_size=self.row_group_size
+                )
+                remaining_rows = table.slice(self.row_group_size)
+                self._pending_batches = remaining_rows.to_batches()
+                self._pending_rows = remaining_rows.num_rows
+
+    def _open(self) -> None:
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.stream, self.schema, **self.writer_options)
+
+    def close(self) -> None:
+        """Write the buffered rows as the last row group, and the footer of the file"""
+        if self.schema is None:
+            return
+        self._open()
+        if self._pending_rows:
+            table = pa.Table.from_batches(self._pending_batches, schema=self.schema)
+            self._writer.write_table(table, row_group_size=self.row_group_size)  # type: ignore[union-attr]
+        self._pending_batches = []
+        self._pending_rows = 0
+        self._writer.close()  # type: ignore[union-attr]
+
+    def __enter__(self) -> ParquetRowGroupWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._writer is not None:
+            self._writer.close()
 
 
 class ParquetFileType(FileType):
@@ -19,42 +117,92 @@ class ParquetFileType(FileType):
         :param stream: file stream object
         :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
+        :param columns: Only decode these columns (and the ones used by ``filters``)
+        :param filters: Only keep the rows matching these ``(column, operator, value)`` predicates. They are
+            pushed down to pyarrow, which skips the row groups whose statistics rule out any match
         """
         kwargs_copy = dict(kwargs)
         # Pandas `read_parquet` does not support the `nrows` parameter
         kwargs_copy.pop("nrows", None)
+        columns = kwargs_copy.pop("columns", None)
+        filters = kwargs_copy.pop("filters", None)
+        if filters:
+            kwargs_copy["filters"] = filters
 
         byte_io_buffer = self._convert_remote_file_to_byte_stream(stream)
 
-        df = pd.read_parquet(byte_io_buffer, **kwargs_copy)
-        df = convert_columns_names_capitalization(
+        df = pd.read_parquet(byte_io_buffer, columns=get_columns_to_read(columns, filters), **kwargs_copy)
+        # pyarrow versions using the legacy dataset implementation only filter out row groups, not rows
+        df = filter_dataframe(df, columns=columns, filters=filters)
+        return convert_columns_names_capitalization(
             df=df, columns_names_capitalization=columns_names_capitalization
         )
-        return PandasDataframe.from_pandas_df(df)
+
+    def read_record_batches(
+        self, stream, batch_size: int = DEFAULT_CHUNK_SIZE, **kwargs
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the parquet file as Arrow record batches, decoding one row group at a time
+
+        :param stream: file stream object
+        :param batch_size: Maximum number of rows in each record batch
+        """
+        if kwargs:
+            yield from super().read_record_batches(stream, batch_size=batch_size, **kwargs)
+            return
+        parquet_file = pq.ParquetFile(self._convert_remote_file_to_byte_stream(stream))
+        yield from parquet_file.iter_batches(batch_size=batch_size)
+
+    def write_record_batches(self, batches: Iterable[pa.RecordBatch], stream) -> None:
+        """Write Arrow record batches to a parquet file, appending a row group whenever enough rows arrived
+
+        :param batches: Record batches sharing the same schema
+        :param stream: file stream object
+        """
+        with ParquetRowGroupWriter(stream) as writer:
+            writer.write_batches(batches)
 
     @staticmethod
-    def _convert_remote_file_to_byte_stream(stream) -> io.IOBase:
+    def get_writer_options() -> dict:
+        """
+        Return the options of the Parquet writer configured in the settings: compression codec and level,
+        dictionary encoding and column statistics.
         """
-        Convert file stream into a buffer that can be streamed into other data
-        structures.
-        Due to noted issues with using parquet files with smart_open+pandas (like
-        https://github.com/RaRe-Technologies/smart_open/issues/524), we create a BytesIO buffer
-        before exporting to a dataframe. We've found a sizable speed improvement with this optimization
-        Returns: an io object that can be streamed into a dataframe (or other object)
+        return {
+            "compression": settings.PARQUET_COMPRESSION,
+            "compression_level": settings.PARQUET_COMPRESSION_LEVEL,
+            "use_dictionary": settings.PARQUET_USE_DICTIONARY,
+            "write_statistics": settings.PARQUET_WRITE_STATISTICS,
+        }
+
+    def open_writer(self, stream, schema: pa.Schema | None = None, **writer_options) -> ParquetRowGroupWriter:
+        """
+        Open a writer appending row groups to a parquet file as data arrives, e.g. chunks of a large export.
+
+        :param stream: file stream object
+        :param schema: Schema of the file. Defaults to the schema of the first data written
+        :param writer_options: ``row_group_size`` and options of ``pyarrow.parquet.ParquetWriter``, overriding the
+            ones configured in the settings
         """
-        remote_obj_buffer = io.BytesIO()
-        remote_obj_buffer.write(stream.read())
-        remote_obj_buffer.seek(0)
-        return remote_obj_buffer
+        return ParquetRowGroupWriter(stream, schema=schema, **writer_options)
 
     # We need skipcq because it's a method overloading so we don't want to make it a static method
-    def create_from_dataframe(self, df: pd.DataFrame, stream: io.TextIOWrapper) -> None:  # skipcq PYL-R0201
-        """Write parquet file to one of the supported locations
+    def create_from_dataframe(self, df: pd.DataFrame, stream: WritableStream) -> None:  # skipcq PYL-R0201
+        """Write parquet file to one of the supported locations, converting and writing one row group at a time
+        using the writer options configured in the settings
 
         :param df: pandas dataframe
         :param stream: file stream object
         """
-        df.to_parquet(stream)
+        with self.open_writer(stream) as writer:
+            writer.write_dataframe(df)
+
+    @property
+    def reads_whole_file(self) -> bool:
+        return True
+
+    @property
+    def is_binary(self) -> bool:
+        return True
 
     @property
     def name(self):
@@ -1,3 +1,4 @@
+import os
 import tempfile
 
 from airflow.configuration import conf
@@ -30,6 +31,73 @@ STORE_DATA_LOCAL_DEV = conf.get(SECTION_KEY, "store_data_local_dev", fallback=Fa
 # DATAFRAME_STORAGE_CONN_ID & DATAFRAME_STORAGE_URL above
 MAX_DATAFRAME_MEMORY_FOR_XCOM_DB = conf.getint(SECTION_KEY, "max_dataframe_mem_for_xcom_db", fallback=100)
 
+#: Whether identical dataframes stored by the tasks of a DAG run (e.g. a lookup table returned by every mapped task)
+#: share a single file, named after the hash of its Parquet content and only written if absent
+DATAFRAME_STORAGE_DEDUPLICATION = conf.getboolean(SECTION_KEY, "xcom_storage_deduplication", fallback=False)
+
+#: Maximum number of dataframe arguments of a SQL function (e.g. ``transform``) loaded to temporary tables
+#: concurrently
+DATAFRAME_STAGING_MAX_WORKERS = conf.getint(SECTION_KEY, "dataframe_staging_max_workers", fallback=4)
+
+#: Size (in bytes) of each byte range fetched when downloading objects from S3/GCS concurrently. Objects larger
+#: than a single part are downloaded in parallel.
+PARALLEL_DOWNLOAD_PART_SIZE = conf.getint(
+    SECTION_KEY, "parallel_download_part_size", fallback=16 * 1024 * 1024
+)
+#: Maximum number of byte ranges fetched at the same time when downloading a single object
+PARALLEL_DOWNLOAD_MAX_CONCURRENCY = conf.getint(SECTION_KEY, "parallel_download_max_concurrency", fallback=8)
+
+#: Size (in bytes) of each part uploaded when writing objects to S3/GCS concurrently. S3 requires at least 5 MB.
+PARALLEL_UPLOAD_PART_SIZE = conf.getint(SECTION_KEY, "parallel_upload_part_size", fallback=16 * 1024 * 1024)
+#: Maximum number of parts uploaded at the same time when writing a single object
+PARALLEL_UPLOAD_MAX_CONCURRENCY = conf.getint(SECTION_KEY, "parallel_upload_max_concurrency", fallback=8)
+
+#: Parser used to read CSV files into dataframes and writer used to create them: "pandas" or "pyarrow"
+CSV_ENGINE = conf.get(SECTION_KEY, "csv_engine", fallback="pandas")
+
+#: Size (in bytes) above which CSV and NDJSON files are split into byte ranges parsed in parallel by a pool of
+#: processes, when their location supports ranged reads. Disabled by default (0): files are parsed with a single
+#: process.
+SHARDED_READ_MIN_SIZE = conf.getint(SECTION_KEY, "sharded_read_min_size", fallback=0)
+#: Approximate size (in bytes) of the byte ranges parsed by each process. Ranges are aligned to record boundaries.
+SHARDED_READ_SHARD_SIZE = conf.getint(SECTION_KEY, "sharded_read_shard_size", fallback=64 * 1024 * 1024)
+#: Number of processes parsing the byte ranges of a single file
+SHARDED_READ_MAX_WORKERS = conf.getint(SECTION_KEY, "sharded_read_max_workers", fallback=os.cpu_count() or 1)
+
+#: Start method of the processes calling dataframe functions with ``parallelism``: "spawn", "forkserver" or "fork".
+#: Forking a process whose threads hold locks (e.g. the ones of a database driver) can deadlock it.
+DATAFRAME_PARALLELISM_START_METHOD = conf.get(
+    SECTION_KEY, "dataframe_parallelism_start_method", fallback="spawn"
+)
+
+#: Compression codec of the Parquet files written by the SDK: "snappy", "zstd", "gzip", "brotli", "lz4" or "none"
+PARQUET_COMPRESSION = conf.get(SECTION_KEY, "parquet_compression", fallback="snappy")
+#: Compression level of the Parquet codec (e.g. 1-22 for zstd). Uses the default level of the codec if unset.
+PARQUET_COMPRESSION_LEVEL = (
+    conf.getint(SECTION_KEY, "parquet_compression_level")
+    if conf.has_option(SECTION_KEY, "parquet_compression_level")
+    else None
+)
+#: Maximum number of rows in each row group of the Parquet files written by the SDK. Smaller row groups let
+#: readers skip more data using the column statistics, bigger ones compress better.
+PARQUET_ROW_GROUP_SIZE = conf.getint(SECTION_KEY, "parquet_row_group_size", fallback=128 * 1024)
+#: Whether Parquet columns are dictionary encoded, which shrinks columns with few distinct values
+PARQUET_USE_DICTIONARY = conf.getboolean(SECTION_KEY, "parquet_use_dictionary", fallback=True)
+#: Whether min/max statistics are written for each Parquet column chunk, allowing readers to skip row groups
+PARQUET_WRITE_STATISTICS = conf.getboolean(SECTION_KEY, "parquet_write_statistics", fallback=True)
+
+#: Size of the HTTP connection pool of the S3/GCS clients shared by all the files using the same connection
+OBJECT_STORE_MAX_POOL_CONNECTIONS = conf.getint(SECTION_KEY, "object_store_max_pool_connections", fallback=32)
+#: Number of seconds the Airflow connection of the shared S3 clients is cached for, before being looked up again
+OBJECT_STORE_CONNECTION_CACHE_TTL = conf.getint(
+    SECTION_KEY, "object_store_connection_cache_ttl", fallback=300
+)
+
+#: Number of seconds the result of a file existence/size check is cached for. Disabled by default.
+FILE_METADATA_CACHE_TTL = conf.getint(SECTION_KEY, "file_metadata_cache_ttl", fallback=0)
+#: Maximum number of files whose metadata is cached, the least recently used ones being evicted first
+FILE_METADATA_CACHE_MAX_SIZE = conf.getint(SECTION_KEY, "file_metadata_cache_max_size", fallback=1024)
+
 OPENLINEAGE_EMIT_TEMP_TABLE_EVENT = conf.getboolean(
     SECTION_KEY, "openlineage_emit_temp_table_event", fallback=True
 )
@@ -3,7 +3,7 @@ from airflow.decorators.base import get_unique_task_id
 from airflow.models.xcom_arg import XComArg
 
 from astro.sql.operators.append import AppendOperator, append
-from astro.sql.operators.cleanup import CleanupOperator, cleanup
+from astro.sql.operators.cleanup import CleanupOperator, DataframeStorageCleanupOperator, cleanup
 from astro.sql.operators.dataframe import DataframeOperator, dataframe
 from astro.sql.operators.drop import DropTableOperator, drop_table
 from astro.sql.operators.export_file import ExportFileOperator, export_file
@@ -20,6 +20,7 @@ __all__ = [
     "CleanupOperator",
     "cleanup",
     "DataframeOperator",
+    "DataframeStorageCleanupOperator",
     "dataframe",
     "DropTableOperator",
     "drop_table",
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Sequence, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
 
 import pandas as pd
 from airflow.decorators.base import DecoratedOperator
 from airflow.exceptions import AirflowException
 from sqlalchemy.sql.functions import Function
 
+from astro import settings
 from astro.airflow.datasets import kwargs_with_datasets
 from astro.databases import create_database
 from astro.databases.base import BaseDatabase
@@ -87,13 +89,9 @@ class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
 
         # Find and load dataframes from op_arg and op_kwarg into Table
         self.create_output_table_if_needed()
-        self.op_args = load_op_arg_dataframes_into_sql(  # type: ignore
-            conn_id=self.conn_id,
+        self.op_args, self.op_kwargs = load_dataframes_into_sql(  # type: ignore
+            database=self.database_impl,
             op_args=self.op_args,  # type: ignore
-            target_table=self.output_table.create_similar_table(),
-        )
-        self.op_kwargs = load_op_kwarg_dataframes_into_sql(
-            conn_id=self.conn_id,
             op_kwargs=self.op_kwargs,
             target_table=self.output_table.create_similar_table(),
         )
@@ -270,6 +268,64 @@ class BaseSQLDecoratedOperator(UpstreamTaskMixin, DecoratedOperator):
         )
 
 
+def stage_dataframes(
+    database: BaseDatabase,
+    dataframes: list[tuple[pd.DataFrame, BaseTable]],
+    max_workers: int = settings.DATAFRAME_STAGING_MAX_WORKERS,
+) -> None:
+    """
+    Load dataframes to their tables concurrently, with a bounded pool of threads sharing the same database.
+
+    :param database: Database where the tables are created
+    :param dataframes: Dataframes and the tables they are loaded to
+    :param max_workers: Maximum number of dataframes loaded at the same time. It is also bounded by the
+        ``MAX_CONCURRENT_DATAFRAME_LOADS`` of the database.
+    """
+    max_workers = min(max_workers, database.MAX_CONCURRENT_DATAFRAME_LOADS or max_workers, len(dataframes))
+    if max_workers <= 1:
+        for df, table in dataframes:
+            database.load_pandas_dataframe_to_table(source_dataframe=df, target_table=table)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(database.load_pandas_dataframe_to_table, source_dataframe=df, target_table=table)
+            for df, table in dataframes
+        ]
+        for future in futures:
+            future.result()
+
+
+def load_dataframes_into_sql(
+    database: BaseDatabase, op_args: tuple, op_kwargs: dict, target_table: BaseTable
+) -> tuple[tuple, dict]:
+    """
+    Identify dataframes in op_args and op_kwargs and load them to temporary tables, all at once
+    (see ``stage_dataframes``).
+
+    :param database: Database used to load content to the tables
+    :param op_args: user-defined decorator's args
+    :param op_kwargs: user-defined decorator's kwargs
+    :param target_table: Table where the first dataframe of op_args is written to. The other dataframes are written
+        to similar tables.
+    :return: New op_args and op_kwargs, in which dataframes are replaced by tables
+    """
+    dataframes: list[tuple[pd.DataFrame, BaseTable]] = []
+
+    def replace_value(value: Any) -> Any:
+        if isinstance(value, pd.DataFrame):
+            df_table = target_table if not dataframes else target_table.create_similar_table()
+            dataframes.append((value, df_table))
+            return df_table
+        if isinstance(value, BaseTable):
+            return database.populate_table_metadata(value)
+        return value
+
+    final_args = tuple(replace_value(arg) for arg in op_args)
+    final_kwargs = {key: replace_value(value) for key, value in op_kwargs.items()}
+    stage_dataframes(database, dataframes)
+    return final_args, final_kwargs
+
+
 def load_op_arg_dataframes_into_sql(conn_id: str, op_args: tuple, target_table: BaseTable) -> tuple:
     """
     Identify dataframes in op_args and load them to the table.
@@ -279,18 +335,8 @@ def load_op_arg_dataframes_into_sql(conn_id: str, op_args: tuple, target_table:
     :param target_table: Table where the dataframe content will be written to
     :return: New op_args, in which dataframes are replaced by tables
     """
-    final_args = []
     database = create_database(conn_id=conn_id)
-    for arg in op_args:
-        if isinstance(arg, pd.DataFrame):
-            database.load_pandas_dataframe_to_table(source_dataframe=arg, target_table=target_table)
-            final_args.append(target_table)
-        elif isinstance(arg, BaseTable):
-            arg = database.populate_table_metadata(arg)
-            final_args.append(arg)
-        else:
-            final_args.append(arg)
-    return tuple(final_args)
+    return load_dataframes_into_sql(database, op_args, {}, target_table)[0]
 
 
 def load_op_kwarg_dataframes_into_sql(conn_id: str, op_kwargs: dict, target_table: BaseTable) -> dict:
@@ -302,16 +348,5 @@ def load_op_kwarg_dataframes_into_sql(conn_id: str, op_kwargs: dict, target_tabl
     :param target_table: Table where the dataframe content will be written to
     :return: New op_kwargs, in which dataframes are replaced by tables
     """
-    final_kwargs = {}
     database = create_database(conn_id=conn_id, table=target_table)
-    for key, value in op_kwargs.items():
-        if isinstance(value, pd.DataFrame):
-            df_table = cast(BaseTable, target_table.create_similar_table())
-            database.load_pandas_dataframe_to_table(source_dataframe=value, target_table=df_table)
-            final_kwargs[key] = df_table
-        elif isinstance(value, BaseTable):
-            value = database.populate_table_metadata(value)
-            final_kwargs[key] = value
-        else:
-            final_kwargs[key] = value
-    return final_kwargs
+    return load_dataframes_into_sql(database, (), op_kwargs, target_table.create_similar_table())[1]
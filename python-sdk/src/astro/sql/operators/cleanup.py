@@ -21,6 +21,7 @@ from airflow.models.taskinstance import TaskInstance
 from airflow.utils.state import State
 
 from astro.databases import create_database
+from astro.dataframes.storage import DataframeStorage
 from astro.sql.operators.base_decorator import BaseSQLDecoratedOperator
 from astro.sql.operators.base_operator import AstroSQLBaseOperator
 from astro.sql.operators.dataframe import DataframeOperator
@@ -251,6 +252,47 @@ class CleanupOperator(AstroSQLBaseOperator):
         return res
 
 
+class DataframeStorageCleanupOperator(BaseOperator):
+    """
+    Delete the dataframes stored in ``xcom_storage_url`` by DAG runs which no longer need them: the finished runs,
+    and optionally the ones older than ``max_age`` (see ``astro.dataframes.storage``). Meant to be scheduled in a
+    maintenance DAG.
+
+    :param dag_id_to_cleanup: Only clean up the runs of this DAG
+    :param delete_finished: Delete the dataframes of the succeeded and failed DAG runs
+    :param max_age: Also delete the dataframes of the DAG runs which stored their last dataframe before that
+    :param storage_url: Directory holding the dataframes. Defaults to ``xcom_storage_url``
+    :param storage_conn_id: Airflow connection of the directory. Defaults to ``xcom_storage_conn_id``
+    """
+
+    template_fields = ("dag_id_to_cleanup",)
+
+    def __init__(
+        self,
+        *,
+        dag_id_to_cleanup: str | None = None,
+        delete_finished: bool = True,
+        max_age: timedelta | None = None,
+        storage_url: str | None = None,
+        storage_conn_id: str | None = None,
+        **kwargs,
+    ):
+        self.dag_id_to_cleanup = dag_id_to_cleanup
+        self.delete_finished = delete_finished
+        self.max_age = max_age
+        self.storage_url = storage_url
+        self.storage_conn_id = storage_conn_id
+        super().__init__(**kwargs)
+
+    def execute(self, context: Context) -> list[str]:
+        storage = DataframeStorage(url=self.storage_url, conn_id=self.storage_conn_id)
+        runs = storage.cleanup(
+            dag_id=self.dag_id_to_cleanup, delete_finished=self.delete_finished, max_age=self.max_age
+        )
+        self.log.info("Deleted the dataframes stored by %s DAG runs", len(runs))
+        return [run.path for run in runs]
+
+
 def cleanup(tables_to_cleanup: list[BaseTable] | None = None, **kwargs) -> CleanupOperator:
     """
     Clean up temporary tables once either the DAG or upstream tasks are done
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
-from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar, cast
 
 import pandas as pd
 from airflow.decorators.base import DecoratedOperator
 
 from astro.airflow.datasets import kwargs_with_datasets
 from astro.dataframes.pandas import PandasDataframe
+from astro.dataframes.parallel import map_partitions, partition_by_key
 
 try:
     from airflow.decorators.base import TaskDecorator, task_decorator_factory
@@ -16,18 +20,23 @@ except ImportError:  # pragma: no cover
     from airflow.decorators import _TaskDecorator as TaskDecorator
     from airflow.decorators.base import task_decorator_factory
 
-from astro.constants import ColumnCapitalization, LoadExistStrategy
+from astro.constants import DEFAULT_CHUNK_SIZE, ColumnCapitalization, LoadExistStrategy
 from astro.databases import create_database
 from astro.files import File
 from astro.sql.operators.base_operator import AstroSQLBaseOperator
 from astro.sql.table import BaseTable, Table
 from astro.utils.dataframe import convert_columns_names_capitalization
+from astro.utils.dataframe import optimize_dtypes as convert_to_compact_dtypes
 from astro.utils.table import find_first_table
 from astro.utils.typing_compat import Context
 
+T = TypeVar("T")
+
 
 def _get_dataframe(
-    table: BaseTable, columns_names_capitalization: ColumnCapitalization = "original"
+    table: BaseTable,
+    columns_names_capitalization: ColumnCapitalization = "original",
+    optimize_dtypes: bool = False,
 ) -> pd.DataFrame:
     """
     Exports records from a SQL table and converts it into a pandas dataframe
@@ -37,6 +46,8 @@ def _get_dataframe(
     df = convert_columns_names_capitalization(
         df=df, columns_names_capitalization=columns_names_capitalization
     )
+    if optimize_dtypes:
+        df = convert_to_compact_dtypes(df)
     return PandasDataframe.from_pandas_df(df)
 
 
@@ -45,6 +56,7 @@ def load_op_arg_table_into_dataframe(
     python_callable: Callable,
     columns_names_capitalization: ColumnCapitalization,
     log: logging.Logger,
+    optimize_dtypes: bool = False,
 ) -> tuple:
     """For dataframe based functions, takes any Table objects from the op_args
     and converts them into local dataframes that can be handled in the python context"""
@@ -59,12 +71,19 @@ def load_op_arg_table_into_dataframe(
         current_arg = full_spec.args.pop(0)
         if full_spec.annotations.get(current_arg) == pd.DataFrame and isinstance(arg, BaseTable):
             log.debug("Found SQL table, retrieving dataframe from table %s", arg.name)
-            ret_args.append(_get_dataframe(arg, columns_names_capitalization=columns_names_capitalization))
+            ret_args.append(
+                _get_dataframe(
+                    arg,
+                    columns_names_capitalization=columns_names_capitalization,
+                    optimize_dtypes=optimize_dtypes,
+                )
+            )
         elif isinstance(arg, File) and (
             full_spec.annotations.get(current_arg) == pd.DataFrame or arg.is_dataframe
         ):
             log.debug("Found dataframe file, retrieving dataframe from file %s", arg.path)
-            ret_args.append(arg.export_to_dataframe())
+            df = arg.export_to_dataframe()
+            ret_args.append(convert_to_compact_dtypes(df) if optimize_dtypes else df)
         else:
             ret_args.append(arg)
     return tuple(ret_args)
@@ -75,6 +94,7 @@ def load_op_kwarg_table_into_dataframe(
     python_callable: Callable,
     columns_names_capitalization: ColumnCapitalization,
     log: logging.Logger,
+    optimize_dtypes: bool = False,
 ) -> dict:
     """For dataframe based functions, takes any Table objects from the op_kwargs
     and converts them into local dataframes that can be handled in the python context"""
@@ -87,15 +107,98 @@ def load_op_kwarg_table_into_dataframe(
     for k, v in op_kwargs.items():
         if param_types.get(k).annotation is pd.DataFrame and isinstance(v, BaseTable):  # type: ignore
             log.debug("Found SQL table, retrieving dataframe from table %s", v.name)
-            out_dict[k] = _get_dataframe(v, columns_names_capitalization=columns_names_capitalization)
+            out_dict[k] = _get_dataframe(
+                v,
+                columns_names_capitalization=columns_names_capitalization,
+                optimize_dtypes=optimize_dtypes,
+            )
         elif isinstance(v, File) and (param_types.get(k).annotation is pd.DataFrame or v.is_dataframe):  # type: ignore
             log.debug("Found dataframe file, retrieving dataframe from file %s", v.path)
-            out_dict[k] = v.export_to_dataframe()
+            df = v.export_to_dataframe()
+            out_dict[k] = convert_to_compact_dtypes(df) if optimize_dtypes else df
         else:
             out_dict[k] = v
     return out_dict
 
 
+def _iter_dataframe_chunks(
+    source: BaseTable | File,
+    chunk_size: int,
+    columns_names_capitalization: ColumnCapitalization = "original",
+    optimize_dtypes: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the records of a SQL table, or of a file, as dataframes of at most ``chunk_size`` rows. Files which can't
+    be read a chunk at a time are read as a single dataframe.
+    """
+    if isinstance(source, File):
+        chunks = source.export_to_dataframe_chunks(chunk_size=chunk_size)
+    else:
+        # File derives from untyped Airflow classes, so the union isn't narrowed by isinstance
+        table = cast(BaseTable, source)
+        database = create_database(table.conn_id)
+        chunks = (
+            batch.to_pandas()
+            for batch in database.export_table_to_record_batches(source_table=table, batch_size=chunk_size)
+        )
+    for df in chunks:
+        df = convert_columns_names_capitalization(
+            df=df, columns_names_capitalization=columns_names_capitalization
+        )
+        if optimize_dtypes:
+            df = convert_to_compact_dtypes(df)
+        yield PandasDataframe.from_pandas_df(df)
+
+
+def _iter_prefetched(iterator: Iterator[T]) -> Iterator[T]:
+    """
+    Yield the items of an iterator, fetching the next item in a background thread while the current one is
+    processed, so that reading a chunk overlaps transforming and writing the previous one.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Items are fetched in lists of at most one item, so that the end of the iterator is an empty list
+        future = executor.submit(list, islice(iterator, 1))
+        while True:
+            items = future.result()
+            if not items:
+                return
+            future = executor.submit(list, islice(iterator, 1))
+            yield items[0]
+
+
+def _call_with_partition(
+    python_callable: Callable, op_args: list, op_kwargs: dict, key: int | str, partition: pd.DataFrame
+) -> Any:
+    """Call a dataframe function with a partition of its chunked argument"""
+    partition = PandasDataframe.from_pandas_df(partition)
+    if isinstance(key, int):
+        op_args = [*op_args[:key], partition, *op_args[key + 1 :]]
+    else:
+        op_kwargs = {**op_kwargs, key: partition}
+    return python_callable(*op_args, **op_kwargs)
+
+
+def find_chunked_argument(op_args: tuple, op_kwargs: dict, python_callable: Callable) -> int | str | None:
+    """
+    Find the argument streamed a chunk at a time by a chunked dataframe function: the first ``Table`` or
+    dataframe ``File`` passed to a parameter annotated as ``pd.DataFrame``.
+
+    :return: Position of the argument in ``op_args``, name of the argument in ``op_kwargs``, or None
+    """
+    param_types = inspect.signature(python_callable).parameters
+    arguments: list[tuple[int | str, Any, Any]] = [
+        (position, arg, parameter.annotation)
+        for (position, arg), parameter in zip(enumerate(op_args), param_types.values())
+    ]
+    arguments += [(k, v, param_types[k].annotation) for k, v in op_kwargs.items() if k in param_types]
+    for key, arg, annotation in arguments:
+        if annotation is pd.DataFrame and isinstance(arg, BaseTable):
+            return key
+        if isinstance(arg, File) and (annotation is pd.DataFrame or arg.is_dataframe):
+            return key
+    return None
+
+
 class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
     """
     Converts a SQL table into a dataframe. Users can then give a python function that takes a dataframe as
@@ -109,6 +212,18 @@ class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
     :param warehouse: (Snowflake) Which warehouse to use for the input table
     :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
         in the resulting dataframe
+    :param chunked: Call the function once per chunk of the first table (or dataframe file) it takes as a
+        dataframe, instead of once with the whole table. Each call must return a dataframe, which is appended
+        to ``output_table`` as soon as it is produced, so that tables larger than the memory of the worker can be
+        transformed. Without ``output_table``, the dataframes returned for all chunks are concatenated.
+    :param chunk_size: Maximum number of rows in each chunk, when ``chunked`` is set
+    :param parallelism: Call the function on the chunks in this number of processes, as with ``chunked``. Meant for
+        CPU-bound functions, which pandas runs on a single core.
+    :param partition_by: Split the table in ``parallelism`` partitions by the hash of these columns instead of in
+        chunks of rows, so that the rows sharing the same values of these columns are passed to the same call
+        (e.g. to aggregate them). The whole table is then read first.
+    :param optimize_dtypes: Convert the columns of the dataframes read from tables and files to more compact
+        dtypes (see ``astro.utils.dataframe.optimize_dtypes``)
     :param kwargs: Any keyword arguments supported by the BaseOperator is supported (e.g ``queue``, ``owner``)
     :return: If ``raw_sql`` is true, we return the result of the handler function, otherwise we will return the
         generated output_table.
@@ -121,6 +236,11 @@ class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
         schema: str | None = None,
         columns_names_capitalization: ColumnCapitalization = "original",
         if_exists: LoadExistStrategy = "replace",
+        chunked: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        parallelism: int = 1,
+        partition_by: str | list[str] | None = None,
+        optimize_dtypes: bool = False,
         **kwargs,
     ):
         self.conn_id: str = conn_id or ""
@@ -136,6 +256,11 @@ class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
         self.op_args = self.kwargs.get("op_args", ())  # type: ignore
         self.columns_names_capitalization = columns_names_capitalization
         self.if_exists = if_exists
+        self.chunked = chunked
+        self.chunk_size = chunk_size
+        self.parallelism = parallelism
+        self.partition_by = [partition_by] if isinstance(partition_by, str) else partition_by
+        self.optimize_dtypes = optimize_dtypes
 
         # We purposely do NOT render upstream_tasks otherwise we could have a case where a user
         # has 10 dataframes as upstream tasks and it crashes the worker
@@ -145,7 +270,7 @@ class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
             **kwargs_with_datasets(kwargs=kwargs, output_datasets=self.output_table),
         )
 
-    def execute(self, context: Context) -> Table | pd.DataFrame | list:
+    def execute(self, context: Context) -> Table | pd.DataFrame | list | None:
         first_table = find_first_table(
             op_args=self.op_args,  # type: ignore
             op_kwargs=self.op_kwargs,
@@ -157,17 +282,21 @@ class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
             self.conn_id = self.conn_id or first_table.conn_id  # type: ignore
             self.database = self.database or first_table.metadata.database  # type: ignore
             self.schema = self.schema or first_table.metadata.schema  # type: ignore
+        if self.chunked or self.parallelism > 1 or self.partition_by:
+            return self._execute_partitioned()
         self.op_args = load_op_arg_table_into_dataframe(
             self.op_args,
             self.python_callable,
             self.columns_names_capitalization,
             self.log,
+            optimize_dtypes=self.optimize_dtypes,
         )
         self.op_kwargs = load_op_kwarg_table_into_dataframe(
             self.op_kwargs,
             self.python_callable,
             self.columns_names_capitalization,
             self.log,
+            optimize_dtypes=self.optimize_dtypes,
         )
 
         function_output = self.python_callable(*self.op_args, **self.op_kwargs)
@@ -194,6 +323,140 @@ class DataframeOperator(AstroSQLBaseOperator, DecoratedOperator):
         else:
             return function_output
 
+    def _execute_partitioned(self) -> Table | pd.DataFrame | None:
+        """
+        Call the function once per chunk, or partition, of its chunked argument (see ``find_chunked_argument``), the
+        other arguments being passed whole, and append the returned dataframes to the output table as they are
+        produced. With ``parallelism``, the calls are run in a pool of processes.
+
+        :return: The output table, or the concatenated dataframes without output table. None if the argument had no
+            partition, the function not being called.
+        """
+        key = find_chunked_argument(self.op_args, self.op_kwargs, self.python_callable)  # type: ignore
+        if key is None:
+            raise ValueError(
+                "A chunked dataframe function needs a Table or dataframe File argument annotated as pd.DataFrame."
+            )
+        source, op_args, op_kwargs = self._load_arguments_except(key)
+        partitions = self._iter_partitions(source)
+        call = functools.partial(_call_with_partition, self.python_callable, op_args, op_kwargs, key)
+        if self.parallelism > 1:
+            self.log.info("Calling the function on partitions of the table in %s processes", self.parallelism)
+            function_outputs = map_partitions(call, partitions, max_workers=self.parallelism)
+        else:
+            function_outputs = map(call, _iter_prefetched(partitions))
+        dataframes = (
+            self._convert_partition_output(index, function_output)
+            for index, function_output in enumerate(function_outputs)
+        )
+
+        if not self.output_table:
+            outputs = list(dataframes)
+            return PandasDataframe.from_pandas_df(pd.concat(outputs, ignore_index=True)) if outputs else None
+        self.output_table = self._load_partition_outputs(self.output_table, dataframes)
+        return self.output_table
+
+    def _load_arguments_except(self, key: int | str) -> tuple[Any, list, dict]:
+        """
+        Load the tables and dataframe files passed to the function, except its chunked argument, which is replaced
+        by None so that it isn't read whole with the other arguments.
+
+        :param key: Position or name of the chunked argument
+        :return: The chunked argument, and the other positional and keyword arguments
+        """
+        op_args = list(self.op_args)  # type: ignore
+        source = op_args[key] if isinstance(key, int) else self.op_kwargs[key]
+        if isinstance(key, int):
+            op_args[key] = None
+            op_kwargs = self.op_kwargs
+        else:
+            op_kwargs = {**self.op_kwargs, key: None}
+        op_args = list(
+            load_op_arg_table_into_dataframe(
+                tuple(op_args),
+                self.python_callable,
+                self.columns_names_capitalization,
+                self.log,
+                optimize_dtypes=self.optimize_dtypes,
+            )
+        )
+        op_kwargs = load_op_kwarg_table_into_dataframe(
+            op_kwargs,
+            self.python_callable,
+            self.columns_names_capitalization,
+            self.log,
+            optimize_dtypes=self.optimize_dtypes,
+        )
+        return source, op_args, op_kwargs
+
+    def _iter_partitions(self, source: BaseTable | File) -> Iterator[pd.DataFrame]:
+        """
+        Split the chunked argument in partitions by the hash of ``partition_by`` after reading it whole, or stream
+        it in chunks of ``chunk_size`` rows.
+
+        :param source: Table or dataframe file passed as the chunked argument
+        """
+        if not self.partition_by:
+            return _iter_dataframe_chunks(
+                source, self.chunk_size, self.columns_names_capitalization, self.optimize_dtypes
+            )
+        if isinstance(source, File):
+            df = convert_columns_names_capitalization(
+                df=source.export_to_dataframe(),
+                columns_names_capitalization=self.columns_names_capitalization,
+            )
+            if self.optimize_dtypes:
+                df = convert_to_compact_dtypes(df)
+        else:
+            df = _get_dataframe(
+                cast(BaseTable, source),
+                columns_names_capitalization=self.columns_names_capitalization,
+                optimize_dtypes=self.optimize_dtypes,
+            )
+        return partition_by_key(df, self.partition_by, self.parallelism)
+
+    def _convert_partition_output(self, index: int, function_output: Any) -> pd.DataFrame:
+        """Check the function returned a dataframe for a partition, and convert the case of its columns"""
+        if not isinstance(function_output, pd.DataFrame):
+            raise ValueError("A chunked dataframe function must return a dataframe for each chunk.")
+        function_output = convert_columns_names_capitalization(
+            df=function_output, columns_names_capitalization=self.columns_names_capitalization
+        )
+        self.log.debug("Chunk %s returned %s rows", index, len(function_output))
+        return function_output
+
+    def _load_partition_outputs(
+        self, output_table: BaseTable, dataframes: Iterable[pd.DataFrame]
+    ) -> BaseTable:
+        """
+        Load the dataframes returned for the partitions to the output table as they are produced, skipping the
+        empty ones. The table is created or replaced by the first dataframe holding rows, depending on
+        ``if_exists``.
+
+        :param output_table: Table the dataframes are appended to
+        :param dataframes: Dataframes returned by the function
+        :return: The output table, with its metadata populated
+        """
+        output_table.conn_id = output_table.conn_id or self.conn_id
+        db = create_database(output_table.conn_id, table=output_table)
+        output_table = db.populate_table_metadata(output_table)
+        if_exists = self.if_exists
+        loaded_rows = 0
+        for df in dataframes:
+            if df.empty:
+                continue
+            db.load_pandas_dataframe_to_table(
+                source_dataframe=df,
+                target_table=output_table,
+                if_exists=if_exists,
+                chunk_size=self.chunk_size,
+            )
+            if_exists = "append"
+            loaded_rows += len(df)
+        if not loaded_rows:
+            raise ValueError("Can't load empty dataframe")
+        return output_table
+
     @staticmethod
     def _convert_column_capitalization_for_output(function_output, columns_names_capitalization):
         """Handles column capitalization for single outputs, lists, and dictionaries"""
@@ -275,6 +538,11 @@ def dataframe(
     schema: str | None = None,
     columns_names_capitalization: ColumnCapitalization = "original",
     if_exists: LoadExistStrategy = "replace",
+    chunked: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallelism: int = 1,
+    partition_by: str | list[str] | None = None,
+    optimize_dtypes: bool = False,
     **kwargs: Any,
 ) -> TaskDecorator:
     """
@@ -300,6 +568,14 @@ def dataframe(
     :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
         in the resulting dataframe
     :param if_exists: Overwrite when set to "replace" else "append"
+    :param chunked: Call the function once per chunk of the first table it takes as a dataframe, appending the
+        returned dataframes to ``output_table`` as they are produced, so that memory use stays bounded
+    :param chunk_size: Maximum number of rows in each chunk, when ``chunked`` is set
+    :param parallelism: Call the function on the chunks in this number of processes, for CPU-bound functions
+    :param partition_by: Split the table in ``parallelism`` partitions by the hash of these columns instead of in
+        chunks of rows, so that the rows sharing the same values are passed to the same call
+    :param optimize_dtypes: Convert the columns of the dataframes read from tables and files to more compact dtypes,
+        e.g. strings with few unique values to categoricals and integers to the smallest integer type
     :param kwargs: Any keyword arguments supported by the BaseOperator is supported (e.g ``queue``, ``owner``)
     """
     kwargs.update(
@@ -309,6 +585,11 @@ def dataframe(
             "schema": schema,
             "columns_names_capitalization": columns_names_capitalization,
             "if_exists": if_exists,
+            "chunked": chunked,
+            "chunk_size": chunk_size,
+            "parallelism": parallelism,
+            "partition_by": partition_by,
+            "optimize_dtypes": optimize_dtypes,
         }
     )
     decorated_function = task_decorator_factory(
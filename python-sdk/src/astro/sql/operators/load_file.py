@@ -12,11 +12,13 @@ from astro.constants import DEFAULT_CHUNK_SIZE, ColumnCapitalization, LoadExistS
 from astro.databases import create_database
 from astro.databases.base import BaseDatabase
 from astro.dataframes.pandas import PandasDataframe
-from astro.files import File, resolve_file_path_pattern
+from astro.files import File, iter_file_path_pattern, resolve_file_path_pattern
 from astro.options import LoadOptions
 from astro.settings import LOAD_FILE_ENABLE_NATIVE_FALLBACK
 from astro.sql.operators.base_operator import AstroSQLBaseOperator
 from astro.table import BaseTable
+from astro.utils.dataframe import concat_dataframes, optimize_dtypes
+from astro.utils.filters import Filters, validate_filters
 from astro.utils.typing_compat import Context
 
 
@@ -33,6 +35,13 @@ class LoadFileOperator(AstroSQLBaseOperator):
     :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
             in the resulting dataframe
     :param enable_native_fallback: Use enable_native_fallback=True to fall back to default transfer
+    :param columns: Only load these columns of the file. They are pushed down to the file readers and to the
+        native load commands, so the other columns aren't parsed
+    :param filters: Only load the rows matching all these ``(column, operator, value)`` predicates, where the
+        operator is one of ``=``, ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and ``not in``. Parquet
+        files skip the row groups whose statistics rule out any match
+    :param optimize_dtypes: When no ``output_table`` is passed, convert the columns of the dataframe to more compact
+        dtypes (see ``astro.utils.dataframe.optimize_dtypes``)
 
     :return: If ``output_table`` is passed this operator returns a Table object. If not
         passed, returns a dataframe.
@@ -52,6 +61,9 @@ class LoadFileOperator(AstroSQLBaseOperator):
         load_options: LoadOptions | None = None,
         columns_names_capitalization: ColumnCapitalization = "original",
         enable_native_fallback: bool | None = LOAD_FILE_ENABLE_NATIVE_FALLBACK,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+        optimize_dtypes: bool = False,
         **kwargs,
     ) -> None:
         kwargs.setdefault("task_id", get_unique_task_id("load_file"))
@@ -74,6 +86,9 @@ class LoadFileOperator(AstroSQLBaseOperator):
         self.columns_names_capitalization = columns_names_capitalization
         self.enable_native_fallback = enable_native_fallback
         self.load_options = load_options
+        self.columns = list(columns) if columns else None
+        self.filters = validate_filters(filters)
+        self.optimize_dtypes = optimize_dtypes
 
     def execute(self, context: Context) -> BaseTable | File:  # skipcq: PYL-W0613
         """
@@ -88,7 +103,6 @@ class LoadFileOperator(AstroSQLBaseOperator):
         return self.load_data(input_file=self.input_file, context=context)
 
     def load_data(self, input_file: File, context: Context) -> BaseTable | pd.DataFrame:
-
         self.log.info("Loading %s into %s ...", self.input_file.path, self.output_table)
         if self.output_table:
             return self.load_data_to_table(input_file, context)
@@ -120,6 +134,8 @@ class LoadFileOperator(AstroSQLBaseOperator):
             enable_native_fallback=self.enable_native_fallback,
             databricks_job_name=f"Load data {self.dag_id}_{self.task_id}",
             load_options=self.load_options,
+            columns=self.columns,
+            filters=self.filters,
         )
         self.log.info("Completed loading the data into %s.", self.output_table)
         return self.output_table
@@ -129,25 +145,25 @@ class LoadFileOperator(AstroSQLBaseOperator):
         Loads csv/parquet file from local/S3/GCS with Pandas. Returns dataframe as no
         SQL table was specified
         """
-        df = None
-        for file in resolve_file_path_pattern(
+        dfs = []
+        for file in iter_file_path_pattern(
             input_file.path,
             input_file.conn_id,
             normalize_config=self.normalize_config,
             filetype=input_file.type.name,
+            hive_partitioning=input_file.hive_partitioning,
+            filters=self.filters,
         ):
-            if isinstance(df, pd.DataFrame):
-                df = pd.concat(
-                    [
-                        df,
-                        file.export_to_dataframe(
-                            columns_names_capitalization=self.columns_names_capitalization
-                        ),
-                    ],
-                    ignore_index=True,
-                )
-            else:
-                df = file.export_to_dataframe(columns_names_capitalization=self.columns_names_capitalization)
+            file_df = file.export_to_dataframe(
+                columns_names_capitalization=self.columns_names_capitalization,
+                columns=self.columns,
+                filters=self.filters,
+            )
+            if self.optimize_dtypes:
+                # Each file is converted as it is read, so that at most one file is held with the default dtypes
+                file_df = optimize_dtypes(file_df)
+            dfs.append(file_df)
+        df = concat_dataframes(dfs)
 
         if not isinstance(df, PandasDataframe):
             df = PandasDataframe.from_pandas_df(df)
@@ -300,6 +316,9 @@ def load_file(
     native_support_kwargs: dict | None = None,
     columns_names_capitalization: ColumnCapitalization = "original",
     enable_native_fallback: bool | None = True,
+    columns: list[str] | None = None,
+    filters: Filters | None = None,
+    optimize_dtypes: bool = False,
     **kwargs: Any,
 ) -> XComArg:
     """Load a file or bucket into either a SQL table or a pandas dataframe.
@@ -315,6 +334,11 @@ def load_file(
     :param columns_names_capitalization: determines whether to convert all columns to lowercase/uppercase
         in the resulting dataframe
     :param enable_native_fallback: Use enable_native_fallback=True to fall back to default transfer
+    :param columns: Only load these columns of the file
+    :param filters: Only load the rows matching all these ``(column, operator, value)`` predicates,
+        e.g. ``[("year", ">=", 2020), ("country", "in", ["FR", "DE"])]``
+    :param optimize_dtypes: When no ``output_table`` is passed, convert the columns of the dataframe to more compact
+        dtypes, e.g. strings with few unique values to categoricals and integers to the smallest integer type
     """
 
     # Note - using path for task id is causing issues as it's a pattern and
@@ -331,6 +355,9 @@ def load_file(
         native_support_kwargs=native_support_kwargs,
         columns_names_capitalization=columns_names_capitalization,
         enable_native_fallback=enable_native_fallback,
+        columns=columns,
+        filters=filters,
+        optimize_dtypes=optimize_dtypes,
         **kwargs,
     ).output
 
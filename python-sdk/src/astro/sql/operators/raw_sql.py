@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Mapping
-from typing import Any, Callable
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+import pyarrow as pa
 
 try:
     from airflow.decorators.base import TaskDecorator, task_decorator_factory
@@ -13,15 +15,29 @@ except ImportError:
 import airflow
 
 if airflow.__version__ >= "2.3":
+    from sqlalchemy.engine.row import KEY_OBJECTS_NO_WARN
     from sqlalchemy.engine.row import LegacyRow as SQLAlcRow
 else:
     from sqlalchemy.engine.result import RowProxy as SQLAlcRow
 
+    KEY_OBJECTS_NO_WARN = None
+
 from astro import settings
+from astro.dataframes.pandas import ARROW_FORMAT, decode_arrow_table, encode_arrow_table
 from astro.exceptions import IllegalLoadToDatabaseException
 from astro.sql.operators.base_decorator import BaseSQLDecoratedOperator
 from astro.utils.typing_compat import Context
 
+if TYPE_CHECKING:  # pragma: no cover
+    from astro.files import File
+
+logger = logging.getLogger(__name__)
+
+# Index of the position of a column in the records of the keymap of SQLAlchemy rows
+KEYMAP_INDEX = 0
+# Format of the rows stored in a file
+FILE_FORMAT = "file"
+
 
 class RawSQLOperator(BaseSQLDecoratedOperator):
     """
@@ -61,9 +77,15 @@ class RawSQLOperator(BaseSQLDecoratedOperator):
     @staticmethod
     def make_row_serializable(rows: Any) -> Any:
         """
-        Convert rows to a serializable format
+        Convert rows to a serializable format. Lists of SQLAlchemy rows are stored by column, in ``ColumnarRows``.
         """
+        if isinstance(rows, ColumnarRows):
+            return rows
         if isinstance(rows, Iterable):
+            rows = list(rows)
+            columnar_rows = ColumnarRows.from_rows(rows)
+            if columnar_rows is not None:
+                return columnar_rows
             return [SdkLegacyRow.from_legacy_row(r) if isinstance(r, SQLAlcRow) else r for r in rows]
         return rows
 
@@ -83,6 +105,192 @@ class SdkLegacyRow(SQLAlcRow):
         return SdkLegacyRow(None, None, obj._keymap, obj._key_style, obj._data)  # skipcq: PYL-W0212
 
 
+def _get_column_names(row: SQLAlcRow) -> list[str] | None:
+    """Return the names of the columns of a SQLAlchemy row, or None if some of them are ambiguous"""
+    names: list[str | None] = [None] * len(row._data)  # skipcq: PYL-W0212
+    for key, record in row._keymap.items():  # skipcq: PYL-W0212
+        index = record[KEYMAP_INDEX]
+        if isinstance(key, str) and index is not None and names[index] is None:
+            names[index] = key
+    if None in names or len(set(names)) < len(names):
+        return None
+    return names  # type: ignore[return-value]
+
+
+def _to_lossless_arrow_array(values: tuple) -> pa.Array | None:
+    """
+    Convert the values of a column to an Arrow array, or return None if they wouldn't be decoded back as the same
+    Python values. The values must share the same type, and time zone, since Arrow converts mixed values to a
+    common type (e.g. integers mixed with floats are decoded as floats). Nested values, such as dicts converted to
+    structs, and integers out of the range of int64 are not converted either.
+
+    :param values: Values of the column, in the order of the rows
+    """
+    value_types = {(type(value), getattr(value, "tzinfo", None)) for value in values if value is not None}
+    if len(value_types) > 1:
+        return None
+    try:
+        array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError):
+        return None
+    if pa.types.is_nested(array.type):
+        return None
+    return array
+
+
+class ColumnarRows(Sequence):
+    """
+    Rows returned by a ``run_raw_sql`` handler, stored by column: the names of the columns are kept once, and the
+    values of each column in a typed Arrow array. In XCom, the rows are stored as a compressed Arrow IPC stream, or in
+    ``xcom_storage_url`` when they are larger than ``max_dataframe_mem_for_xcom_db``, like dataframes.
+
+    Rows are only decoded when they are accessed, as ``SdkLegacyRow`` which, like SQLAlchemy rows, can be accessed
+    by position (``row[0]``), by name (``row["id"]``) or by attribute (``row.id``). Rows stored in a file are only
+    read when they are first accessed, and are passed on as a reference to the file until then.
+
+    :param table: Arrow table holding the rows
+    :param file: Parquet file holding the rows, read when they are first accessed
+    :param key_style: How the keys of the rows are looked up, copied from the SQLAlchemy rows. By default, they can
+        be looked up by position, name or attribute
+    """
+
+    version: ClassVar[int] = 1
+
+    def __init__(
+        self,
+        table: pa.Table | None = None,
+        file: File | None = None,
+        key_style: int | None = KEY_OBJECTS_NO_WARN,
+    ):
+        if table is None and file is None:
+            raise ValueError("Either a table or a file holding the rows is required")
+        self._table = table
+        self._file = file
+        self._key_style = key_style
+        self._columns: list[list] | None = None
+        self._key_map: dict | None = None
+
+    @classmethod
+    def from_rows(cls, rows: list) -> ColumnarRows | None:
+        """
+        Store SQLAlchemy rows by column. Returns None unless all the rows are SQLAlchemy rows with the same uniquely
+        named columns, whose values Arrow can represent without loss (see ``_to_lossless_arrow_array``).
+
+        :param rows: Rows returned by a handler
+        """
+        if not rows or airflow.__version__ < "2.3" or not all(isinstance(row, SQLAlcRow) for row in rows):
+            return None
+        key_map = rows[0]._keymap  # skipcq: PYL-W0212
+        if any(row._keymap is not key_map and row._keymap != key_map for row in rows):  # skipcq: PYL-W0212
+            return None
+        names = _get_column_names(rows[0])
+        if names is None:
+            return None
+        arrays = []
+        for values in zip(*(row._data for row in rows)):  # skipcq: PYL-W0212
+            array = _to_lossless_arrow_array(values)
+            if array is None:
+                return None
+            arrays.append(array)
+        return cls(table=pa.table(arrays, names=names), key_style=rows[0]._key_style)  # skipcq: PYL-W0212
+
+    @property
+    def table(self) -> pa.Table:
+        """Arrow table holding the rows, read from their file on first access"""
+        if self._table is None and self._file is not None:
+            logger.info("Retrieving rows from %s using %s conn_id", self._file.path, self._file.conn_id)
+            self._table = pa.Table.from_batches(list(self._file.export_to_record_batches()))
+        return self._table
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the columns of the rows"""
+        column_names: list[str] = self.table.column_names
+        return column_names
+
+    def _make_row(self, values: tuple) -> SdkLegacyRow:
+        if self._key_map is None:
+            self._key_map = {
+                name: (index, None, None, name, name, None, None)
+                for index, name in enumerate(self.column_names)
+            }
+        return SdkLegacyRow(None, None, self._key_map, self._key_style, values)
+
+    def _get_columns(self) -> list[list]:
+        """Decode the values of the columns into Python objects, once"""
+        if self._columns is None:
+            self._columns = [column.to_pylist() for column in self.table.columns]
+        return self._columns
+
+    def __len__(self) -> int:
+        num_rows: int = self.table.num_rows
+        return num_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                table = self.table.slice(start, max(stop - start, 0))
+            else:
+                table = self.table.take(pa.array(range(start, stop, step), type=pa.int64()))
+            return ColumnarRows(table=table, key_style=self._key_style)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return self._make_row(tuple(column[index] for column in self._get_columns()))
+
+    def __iter__(self) -> Iterator[SdkLegacyRow]:
+        for values in zip(*self._get_columns()):
+            yield self._make_row(values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnarRows(rows={len(self)}, columns={self.column_names})"
+
+    def serialize(self) -> dict:
+        if self._table is None and self._file is not None:
+            # The rows are forwarded without being read, so the reference to their file is kept
+            return {"format": FILE_FORMAT, "file": self._file.to_json(), "key_style": self._key_style}
+        table = self.table
+        size = table.nbytes
+        if size < settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB * 1024:
+            logger.info("Rows size: %s bytes. Storing them in Airflow's metadata DB", size)
+            return {
+                "format": ARROW_FORMAT,
+                "data": encode_arrow_table(table),
+                "key_style": self._key_style,
+            }
+        # Avoid cyclic dependency
+        from astro.dataframes.storage import DataframeStorage
+
+        logger.info(
+            "Rows size: %s bytes. Storing them in Remote Storage (conn_id: %s | URL: %s)",
+            size,
+            settings.DATAFRAME_STORAGE_CONN_ID,
+            settings.DATAFRAME_STORAGE_URL,
+        )
+        file = DataframeStorage().store_arrow_table(table)
+        return {"format": FILE_FORMAT, "file": file.to_json(), "key_style": self._key_style}
+
+    @staticmethod
+    def deserialize(data: dict, version: int) -> ColumnarRows:
+        if version > ColumnarRows.version:
+            raise TypeError(f"version > {ColumnarRows.version}")
+        if data["format"] == FILE_FORMAT:
+            # Avoid cyclic dependency
+            from astro.files import File
+
+            return ColumnarRows(file=File.from_json(data["file"]), key_style=data["key_style"])
+        return ColumnarRows(table=decode_arrow_table(data["data"]), key_style=data["key_style"])
+
+
 def run_raw_sql(
     python_callable: Callable | None = None,
     conn_id: str = "",
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-import random
-import string
+import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from astro import settings
-from astro.constants import ColumnCapitalization, FileType
-from astro.dataframes.pandas import PandasDataframe
+from astro.constants import ColumnCapitalization
+from astro.dataframes.pandas import PandasDataframe, estimate_memory_usage
 
 if TYPE_CHECKING:
     from astro.files import File
 
+logger = logging.getLogger(__name__)
+
+# Maximum ratio of unique values to rows of a column of strings converted to a categorical
+MAX_CATEGORY_UNIQUE_RATIO = 0.5
+# Smallest int64, whose opposite is the first float above the range of int64
+INT64_MIN = float(np.iinfo(np.int64).min)
+
 
 def convert_columns_names_capitalization(
     df: pd.DataFrame, columns_names_capitalization: ColumnCapitalization
@@ -20,15 +28,23 @@ def convert_columns_names_capitalization(
     """
     Convert cols of a dataframe to required case. Options - lower/Upper
 
+    The dataframe is wrapped in a ``PandasDataframe`` without copying its data. Columns are relabeled on a shallow
+    copy, which shares the blocks of ``df`` but not its labels, so that ``df`` is left unchanged.
+
     :param df: dataframe whose cols will be altered
     :param columns_names_capitalization: String Literal with possible values - lower/Upper
     """
     if isinstance(df, pd.DataFrame):
-        df = PandasDataframe.from_pandas_df(df)
         if columns_names_capitalization == "lower":
-            df.columns = [col_label.lower() for col_label in df.columns]
+            columns = [col_label.lower() for col_label in df.columns]
         elif columns_names_capitalization == "upper":
-            df.columns = [col_label.upper() for col_label in df.columns]
+            columns = [col_label.upper() for col_label in df.columns]
+        else:
+            columns = None
+        if columns is not None and columns != list(df.columns):
+            df = df.copy(deep=False)
+            df.columns = columns
+        df = PandasDataframe.from_pandas_df(df)
 
     return df
 
@@ -42,21 +58,136 @@ def convert_dataframe_to_file(df: pd.DataFrame) -> File:
     [astro]
     dataframe_storage_conn_id=...
     dataframe_storage_url=///
+
+    Files stored by a task are laid out by DAG run, so that they can be cleaned up (see
+    ``astro.dataframes.storage``).
+
     :param df: Dataframe to convert to file
     :return: File object with reference to stored dataframe file
     """
-    unique_id = random.choice(string.ascii_lowercase) + "".join(
-        random.choice(string.ascii_lowercase + string.digits) for _ in range(64)
+    # importing here to prevent circular imports
+    from astro.dataframes.storage import DataframeStorage
+
+    storage = DataframeStorage(url=settings.DATAFRAME_STORAGE_URL, conn_id=settings.DATAFRAME_STORAGE_CONN_ID)
+    return storage.store_dataframe(df)
+
+
+def _get_nullable_integer_dtype(dtype: np.dtype) -> str:
+    """Return the pandas nullable integer dtype matching a numpy integer dtype, e.g. ``UInt8`` for ``uint8``"""
+    name: str = dtype.name
+    if dtype.kind == "u":
+        return "UInt" + name[len("uint") :]
+    return name.capitalize()
+
+
+def _holds_int64_values(values: pd.Series) -> bool:
+    """
+    Whether a float column without missing values only holds integers within the range of int64, which
+    ``astype(np.int64)`` would otherwise overflow silently
+    """
+    return (
+        not values.empty
+        and bool((values % 1 == 0).all())
+        and values.min() >= INT64_MIN
+        and values.max() < -INT64_MIN
     )
 
-    # importing here to prevent circular imports
-    from astro.files import File
 
-    file = File(
-        path=settings.DATAFRAME_STORAGE_URL + "/" + unique_id + ".parquet",
-        conn_id=settings.DATAFRAME_STORAGE_CONN_ID,
-        filetype=FileType.PARQUET,
-        is_dataframe=True,
+def _optimize_float_series(series: pd.Series) -> pd.Series:
+    """Convert integers parsed as floats because of missing values to nullable integers, or floats to float32"""
+    values = series.dropna()
+    if series.hasnans and _holds_int64_values(values):
+        downcast = pd.to_numeric(
+            values.astype(np.int64), downcast="unsigned" if values.min() >= 0 else "integer"
+        )
+        return series.astype(_get_nullable_integer_dtype(downcast.dtype))
+    float32_series = series.astype(np.float32)
+    if np.array_equal(float32_series.to_numpy(np.float64), series.to_numpy(np.float64), equal_nan=True):
+        return float32_series
+    return series
+
+
+def _optimize_object_series(series: pd.Series, max_category_unique_ratio: float) -> pd.Series:
+    """Convert a column of strings to a categorical or to Arrow-backed strings, and booleans to nullable booleans"""
+    inferred_dtype = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred_dtype == "string":
+        if series.nunique(dropna=True) <= max_category_unique_ratio * len(series):
+            return series.astype("category")
+        return series.astype(pd.StringDtype("pyarrow"))
+    if inferred_dtype == "boolean":
+        return series.astype("boolean")
+    return series
+
+
+def _optimize_series_dtype(series: pd.Series, max_category_unique_ratio: float) -> pd.Series:
+    """Convert a column to the most compact dtype holding the same values, or return it as it is"""
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype) or series.empty:
+        # Extension dtypes (e.g. categoricals, nullable and Arrow-backed types) are already compact
+        return series
+    if dtype.kind in "iu":
+        return pd.to_numeric(series, downcast="unsigned" if series.min() >= 0 else "integer")
+    if dtype.kind == "f":
+        return _optimize_float_series(series)
+    if dtype == object:
+        return _optimize_object_series(series, max_category_unique_ratio)
+    return series
+
+
+def optimize_dtypes(
+    df: pd.DataFrame, max_category_unique_ratio: float = MAX_CATEGORY_UNIQUE_RATIO
+) -> pd.DataFrame:
+    """
+    Convert the columns of a dataframe to more compact dtypes holding the same values: strings to categoricals
+    when they have few unique values or to Arrow-backed strings otherwise, integers and floats to the smallest
+    numeric type which doesn't lose precision, and integers parsed as floats because of missing values to nullable
+    integers. The memory used before and after the conversion is logged.
+
+    :param df: Dataframe to convert
+    :param max_category_unique_ratio: Maximum ratio of unique values to rows of a column of strings converted to a
+        categorical
+    """
+    if df.columns.empty:
+        return df
+    memory_usage = estimate_memory_usage(df)
+    optimized_df = pd.concat(
+        [_optimize_series_dtype(series, max_category_unique_ratio) for _, series in df.items()], axis=1
     )
-    file.create_from_dataframe(df)
-    return file
+    optimized_df.columns = df.columns
+    logger.info(
+        "Optimized the dtypes of the dataframe from %s bytes to %s bytes",
+        memory_usage,
+        estimate_memory_usage(optimized_df),
+    )
+    return PandasDataframe.from_pandas_df(optimized_df) if isinstance(df, PandasDataframe) else optimized_df
+
+
+def concat_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate dataframes at once. The columns which are categoricals in all the dataframes are converted to the
+    union of their categories first, as pandas concatenates categoricals with different categories as objects.
+
+    :param dfs: Dataframes to concatenate, whose categorical columns are converted in place
+    """
+    if len(dfs) == 1:
+        return dfs[0]
+    for column in dfs[0].columns:
+        categories = _union_categories([df[column] for df in dfs if column in df.columns], len(dfs))
+        if categories is not None:
+            for df in dfs:
+                df[column] = df[column].cat.set_categories(categories)
+    return pd.concat(dfs, ignore_index=True)
+
+
+def _union_categories(columns: list[pd.Series], df_count: int) -> pd.Index | None:
+    """Return the union of the categories of a column, or None if it isn't a categorical in every dataframe"""
+    if len(columns) < df_count or not all(
+        isinstance(series.dtype, pd.CategoricalDtype) for series in columns
+    ):
+        return None
+    try:
+        # Only the categories are combined, not the values
+        return union_categoricals([pd.Categorical([], dtype=series.dtype) for series in columns]).categories
+    except TypeError:
+        # Ordered categoricals with different categories, or categories of different types
+        return None
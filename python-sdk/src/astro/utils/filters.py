@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import datetime
+import math
+import numbers
+import operator as python_operator
+from typing import Any, Callable, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+#: A row filter: a list of ``(column, operator, value)`` predicates which must all be true for a row to be kept,
+#: e.g. ``[("year", ">=", 2020), ("country", "in", ["FR", "DE"])]``. This is the conjunctive form of the
+#: ``filters`` accepted by pyarrow, so it can be pushed down to the Parquet reader as it is.
+Filters = List[Tuple[str, str, Any]]
+
+SQL_OPERATORS = {
+    "=": "=",
+    "==": "=",
+    "!=": "!=",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+    "in": "IN",
+    "not in": "NOT IN",
+}
+
+PYTHON_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": python_operator.eq,
+    "==": python_operator.eq,
+    "!=": python_operator.ne,
+    "<": python_operator.lt,
+    "<=": python_operator.le,
+    ">": python_operator.gt,
+    ">=": python_operator.ge,
+}
+
+
+def validate_filters(filters: Iterable[tuple[str, str, Any]] | None) -> Filters | None:
+    """
+    Check that the filters are a list of ``(column, operator, value)`` predicates using supported operators.
+
+    :param filters: Row filter to validate
+    :return: The filter as a list of tuples, or None if there are no predicates
+    """
+    if not filters:
+        return None
+    validated_filters = []
+    for predicate in filters:
+        if not isinstance(predicate, (list, tuple)) or len(predicate) != 3:
+            raise ValueError(f"Invalid filter {predicate!r}, expected a (column, operator, value) tuple")
+        column, operator, value = predicate
+        if operator not in SQL_OPERATORS:
+            raise ValueError(
+                f"Invalid filter operator {operator!r}, supported operators: {', '.join(SQL_OPERATORS)}"
+            )
+        if operator in ("in", "not in") and (
+            isinstance(value, (str, bytes)) or not isinstance(value, Iterable)
+        ):
+            raise ValueError(f"The value of the {operator!r} filter on {column!r} must be a list of values")
+        validated_filters.append((column, operator, value))
+    return validated_filters
+
+
+def get_columns_to_read(columns: list[str] | None, filters: Filters | None) -> list[str] | None:
+    """
+    Return the columns which have to be read from a file to project ``columns`` and evaluate ``filters``.
+
+    :param columns: Columns to keep, or None to keep all of them
+    :param filters: Row filter
+    """
+    if columns is None:
+        return None
+    filter_columns = [column for column, _, _ in filters or [] if column not in columns]
+    return list(columns) + list(dict.fromkeys(filter_columns))
+
+
+def filter_dataframe(
+    df: pd.DataFrame, columns: list[str] | None = None, filters: Filters | None = None
+) -> pd.DataFrame:
+    """
+    Keep the rows of a dataframe matching the filters, and project its columns. As in SQL and pyarrow,
+    a predicate evaluated on a missing value is not true, so the row is dropped.
+
+    :param df: Dataframe to filter
+    :param columns: Columns to keep, or None to keep all of them
+    :param filters: Row filter
+    """
+    if filters:
+        mask = np.ones(len(df), dtype=bool)
+        for column, operator, value in filters:
+            mask &= _evaluate_predicate(df[column], operator, value)
+        df = df[mask].reset_index(drop=True)
+    if columns is not None and list(df.columns) != list(columns):
+        df = df[list(columns)]
+    return df
+
+
+def _evaluate_predicate(series: pd.Series, operator: str, value: Any) -> np.ndarray:
+    """Evaluate a single predicate on a column, as a boolean mask without missing values"""
+    if operator in ("in", "not in"):
+        result = series.isin(list(value))
+        if operator == "not in":
+            result = ~result
+    else:
+        result = PYTHON_OPERATORS[operator](series, value)
+    mask: np.ndarray = result.fillna(False).to_numpy(dtype=bool) & series.notna().to_numpy()
+    return mask
+
+
+def render_filters_as_sql(filters: Filters, quote_identifier: Callable[[str], str]) -> str:
+    """
+    Render the filters as the condition of a SQL ``WHERE`` clause.
+
+    :param filters: Row filter
+    :param quote_identifier: Function quoting a column name as an identifier of the target database
+    """
+    conditions = []
+    for column, operator, value in filters:
+        if operator in ("in", "not in"):
+            rendered_value = "(" + ", ".join(render_sql_literal(item) for item in value) + ")"
+        else:
+            rendered_value = render_sql_literal(value)
+        conditions.append(f"{quote_identifier(column)} {SQL_OPERATORS[operator]} {rendered_value}")
+    return " AND ".join(conditions)
+
+
+def render_sql_literal(value: Any) -> str:
+    """
+    Render a Python value as a SQL literal. Quotes are escaped with backslashes, which Snowflake, BigQuery and
+    Databricks all understand.
+
+    :param value: A string, number, boolean, date or datetime
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, numbers.Integral) or (isinstance(value, numbers.Real) and math.isfinite(value)):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.datetime, pd.Timestamp)):
+        value = value.isoformat()
+    if isinstance(value, str):
+        escaped_value = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{escaped_value}'"
+    raise ValueError(f"Unsupported filter value {value!r}")
+
+
+def match_partition_values(partition_values: dict[str, str | None], filters: Filters | None) -> bool:
+    """
+    Check whether the partition values parsed from a path (e.g. ``dt=2024-01-01/region=eu/``) may match the
+    filters. Predicates on columns which aren't partition columns can't rule out the partition. Partition values
+    are strings, which are converted to the type of the value they are compared to.
+
+    :param partition_values: Partition columns and their values, None for null partitions
+    :param filters: Row filter
+    """
+    for column, operator, value in filters or []:
+        if column not in partition_values:
+            continue
+        raw_value = partition_values[column]
+        if raw_value is None or not _match_partition_predicate(raw_value, operator, value):
+            return False
+    return True
+
+
+def _match_partition_predicate(raw_value: str, operator: str, value: Any) -> bool:
+    """Evaluate a single predicate on a partition value, converted to the type of the filter value"""
+    if operator in ("in", "not in"):
+        found = any(_convert_partition_value(raw_value, item) == item for item in value)
+        return found if operator == "in" else not found
+    try:
+        return PYTHON_OPERATORS[operator](_convert_partition_value(raw_value, value), value)
+    except TypeError:
+        return False
+
+
+#: Conversions of the partition values to the types of the values they are compared to. Booleans are integers
+#: and datetimes are dates, so they are checked first.
+_PARTITION_VALUE_CONVERTERS: list[tuple[type, Callable[[str], Any]]] = [
+    (bool, lambda raw_value: raw_value.lower() == "true"),
+    (numbers.Integral, int),
+    (numbers.Real, float),
+    (datetime.datetime, datetime.datetime.fromisoformat),
+    (datetime.date, datetime.date.fromisoformat),
+]
+
+
+def _convert_partition_value(raw_value: str, like: Any) -> Any:
+    """Convert a partition value to the type of ``like``, keeping the string if it can't be converted"""
+    for value_type, convert in _PARTITION_VALUE_CONVERTERS:
+        if isinstance(like, value_type):
+            try:
+                return convert(raw_value)
+            except ValueError:
+                return raw_value
+    return raw_value
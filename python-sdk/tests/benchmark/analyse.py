@@ -18,6 +18,7 @@ from astro.table import Metadata, Table
 SUMMARY_FIELDS = [
     "database",
     "dataset",
+    "csv_engine",
     "total_time",
     "memory_rss",
     "cpu_time_user",
@@ -131,8 +132,10 @@ def analyse_results_from_database(bq_git_sha: str, output_filepath: str):
 
 
 def analyse_results(df: pd.DataFrame, output_filepath: str = None):
+    # results published before the CSV engine was configurable used the pandas parser
+    df["csv_engine"] = df["csv_engine"].fillna("pandas") if "csv_engine" in df else "pandas"
     # calculate total CPU from process & children
-    mean_by_dag = df.groupby("dag_id", as_index=False).mean()
+    mean_by_dag = df.groupby(["dag_id", "csv_engine"], as_index=False).mean()
 
     # format data
     mean_by_dag["database"] = mean_by_dag.dag_id.apply(lambda text: text.split("into_")[-1])
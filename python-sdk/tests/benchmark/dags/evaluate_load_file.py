@@ -10,6 +10,7 @@ import settings as benchmark_settings
 from airflow import DAG
 from run import export_profile_data_to_bq
 
+from astro import settings as astro_settings
 from astro import sql as aql
 from astro.constants import DEFAULT_CHUNK_SIZE, FileType
 from astro.files import File
@@ -158,6 +159,7 @@ def create_dag(database_name, table_args, dataset, global_db_kwargs):
             "filetype": dataset_filetype,
             "path": dataset_path,
             "dataset": dataset_name,
+            "csv_engine": astro_settings.CSV_ENGINE,
             "error": "True",
             "error_context": exc_string,
             "revision": get_git_sha(),
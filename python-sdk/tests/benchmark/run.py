@@ -85,6 +85,7 @@ def profile(func, *args, **kwargs):  # noqa: C901
             "path": kwargs.get("path"),
             "revision": kwargs.get("revision"),
             "dataset": kwargs.get("dataset"),
+            "csv_engine": kwargs.get("csv_engine"),
             "error": "False",
             "error_context": "Skipped",
         }
@@ -187,6 +188,12 @@ if __name__ == "__main__":
         type=int,
         help="Chunk size used for loading from file to database. Default: [1,000,000]",
     )
+    parser.add_argument(
+        "--csv-engine",
+        type=str,
+        default="pandas",
+        help="Engine used to parse CSV files {pandas, pyarrow}. Default: pandas",
+    )
     args = parser.parse_args()
     location = get_location(args.path)
     dag_id = build_dag_id(args.dataset, args.database, args.filetype, location)
@@ -195,6 +202,7 @@ if __name__ == "__main__":
         execution_date=timezone.utcnow(),
         revision=args.revision,
         chunk_size=args.chunk_size,
+        csv_engine=args.csv_engine,
         database=args.database,
         filetype=args.filetype,
         dataset=args.dataset,
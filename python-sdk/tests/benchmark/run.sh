@@ -24,6 +24,7 @@ echo $git_revision
 results_file=/tmp/results-`date -u +%FT%T`.ndjson
 
 chunk_sizes_array=( 1000000 )
+csv_engines_array=( pandas pyarrow )
 
 export AIRFLOW__CORE__LOGGING_LEVEL=ERROR
 export AIRFLOW__SCHEDULER__USE_JOB_SCHEDULE=False
@@ -74,10 +75,17 @@ echo - Output: $(get_abs_filename $results_file)
         dataset_path=$(echo $dataset | cut -d " " -f3)
         dataset_skip=$(echo $dataset | cut -d " " -f4)
 
+        if [ "$dataset_type" == "csv" ]; then
+          csv_engines=( "${csv_engines_array[@]}" )
+        else
+          csv_engines=( pandas )
+        fi
+
         for chunk_size in "${chunk_sizes_array[@]}"; do
-          echo "$i $dataset $database $chunk_size"
+        for csv_engine in "${csv_engines[@]}"; do
+          echo "$i $dataset $database $chunk_size $csv_engine"
           set +e  # allow us to see the content of $results_file regardless of the run being successful or not
-          ASTRO_CHUNKSIZE=$chunk_size python3 -W ignore $runner_path --dataset="$dataset_name" --database="$database" --filetype="$dataset_type" --path="$dataset_path" --skip="$dataset_skip" --revision $git_revision --chunk-size=$chunk_size 1>> $results_file
+          AIRFLOW__ASTRO_SDK__CSV_ENGINE=$csv_engine ASTRO_CHUNKSIZE=$chunk_size python3 -W ignore $runner_path --dataset="$dataset_name" --database="$database" --filetype="$dataset_type" --path="$dataset_path" --skip="$dataset_skip" --revision $git_revision --chunk-size=$chunk_size --csv-engine=$csv_engine 1>> $results_file
           cat $results_file
           if [[ -z "${GOOGLE_APPLICATION_CREDENTIALS}" ]]; then
             echo "$GOOGLE_APPLICATION_CREDENTIALS is not defined"
@@ -88,9 +96,10 @@ echo - Output: $(get_abs_filename $results_file)
           gsutil cp $results_file gs://${GCP_BUCKET}/benchmark/results/
           if command -v peekprof &> /dev/null; then
              # https://github.com/exapsy/peekprof
-             peekprof -html "/tmp/$dataset-$database-$chunk_size.html" -refresh 1000ms -pid $! > /tmp/$dataset-$database-$chunk_size.csv
+             peekprof -html "/tmp/$dataset-$database-$chunk_size-$csv_engine.html" -refresh 1000ms -pid $! > /tmp/$dataset-$database-$chunk_size-$csv_engine.csv
           fi
         done
+        done
       done
     done
   done
@@ -2,10 +2,12 @@ from collections import deque
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
-from astro.custom_backend.serializer import serialize
+from astro.custom_backend.serializer import deserialize, serialize
 from astro.files import File
+from astro.sql.operators.raw_sql import ColumnarRows
 from astro.table import Table
 
 
@@ -50,3 +52,16 @@ def test_serialize(req_param, expected):
         assert actual["is_dataframe"] is True
     else:
         assert actual == expected
+
+
+def test_serialize_deserialize_columnar_rows():
+    """Test rows stored by column are serialized once, rather than row by row"""
+    rows = ColumnarRows(table=pa.table({"id": [1, 2], "name": ["a", "b"]}))
+
+    serialized_rows = serialize(rows)
+
+    assert serialized_rows["class"] == "ColumnarRows"
+    assert serialized_rows["format"] == "arrow"
+    deserialized_rows = deserialize(serialized_rows)
+    assert deserialized_rows == [(1, "a"), (2, "b")]
+    assert deserialized_rows[1]["name"] == "b"
@@ -1,5 +1,6 @@
 """Tests specific to the Sqlite Database implementation."""
 import pathlib
+from unittest import mock
 
 from google.cloud.bigquery_datatransfer_v1.types import (
     StartManualTransferRunsResponse,
@@ -9,6 +10,7 @@ from google.cloud.bigquery_datatransfer_v1.types import (
 
 from astro.databases.google.bigquery import BigqueryDatabase, S3ToBigqueryDataTransfer
 from astro.files import File
+from astro.table import Metadata, Table
 
 DEFAULT_CONN_ID = "google_cloud_default"
 CUSTOM_CONN_ID = "gcp_conn"
@@ -41,3 +43,36 @@ def test_get_run_id():
     )
     config.runs.append(run)
     assert S3ToBigqueryDataTransfer.get_run_id(config) == "62d6a4df-0000-2fad-8752-d4f547e68ef4"
+
+
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.table_exists", return_value=True)
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.drop_table")
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.run_sql")
+@mock.patch("astro.databases.google.bigquery.BigqueryDatabase.load_gs_file_to_table")
+def test_load_file_to_table_natively_with_columns_and_filters(load_gs_file_to_table, run_sql, drop_table, _):
+    """The file is loaded natively to a staging table, from which the selection is inserted"""
+    database = BigqueryDatabase(conn_id="fake_conn_id")
+    target_table = Table(name="target", metadata=Metadata(schema="dataset"))
+    database.load_file_to_table_natively(
+        File("gs://bucket/sample.parquet"),
+        target_table,
+        if_exists="append",
+        columns=["name"],
+        filters=[("id", ">", 1)],
+    )
+
+    staging_table = load_gs_file_to_table.call_args.kwargs["target_table"]
+    assert staging_table.name != target_table.name
+    assert load_gs_file_to_table.call_args.kwargs["if_exists"] == "replace"
+    run_sql.assert_called_once_with(
+        f"INSERT INTO dataset.target (`name`) SELECT `name` FROM dataset.{staging_table.name} WHERE `id` > 1"
+    )
+    drop_table.assert_called_once_with(staging_table)
+
+
+def test_native_load_selection_is_not_available_for_s3():
+    """S3 data transfers need an existing destination table, so they can't go through a staging table"""
+    database = BigqueryDatabase(conn_id="fake_conn_id")
+    assert database.is_native_load_selection_available(File("gs://bucket/key.csv"), columns=["id"]) is True
+    assert database.is_native_load_selection_available(File("s3://bucket/key.csv"), columns=["id"]) is False
+    assert database.is_native_load_selection_available(File("s3://bucket/key.csv")) is True
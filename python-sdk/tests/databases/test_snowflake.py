@@ -2,11 +2,13 @@
 import pathlib
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
 from astro.databases.snowflake import SnowflakeDatabase, SnowflakeFileFormat, SnowflakeStage
 from astro.files import File
 from astro.settings import SNOWFLAKE_STORAGE_INTEGRATION_AMAZON, SNOWFLAKE_STORAGE_INTEGRATION_GOOGLE
+from astro.table import Metadata, Table
 
 DEFAULT_CONN_ID = "snowflake_default"
 CUSTOM_CONN_ID = "snowflake_conn"
@@ -74,3 +76,50 @@ def test_use_quotes(cols_eval):
     Verify the quotes addition only in case where we are having mixed case col names
     """
     assert SnowflakeDatabase.use_quotes(cols_eval["cols"]) == cols_eval["expected_result"]
+
+
+@pytest.mark.parametrize(
+    "path,expected_select",
+    [
+        ("s3://bucket/sample.parquet", 'SELECT $1:"name", $1:"id" FROM'),
+        ("s3://bucket/sample.csv", "SELECT $2, $1 FROM"),
+    ],
+    ids=["parquet", "csv"],
+)
+@patch("astro.databases.snowflake.SnowflakeDatabase.drop_stage")
+@patch("astro.databases.snowflake.SnowflakeDatabase.create_stage")
+@patch("astro.databases.snowflake.SnowflakeDatabase.hook")
+def test_load_file_to_table_natively_with_columns(hook, create_stage, drop_stage, path, expected_select):
+    """Columns are projected natively with a COPY INTO column list and transformation"""
+    create_stage.return_value = SnowflakeStage(name="stage", metadata=Metadata(schema="S", database="D"))
+    hook.run.return_value = []
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    header = pd.DataFrame(columns=["id", "name"])
+    with patch("astro.databases.snowflake.iter_file_path_pattern", return_value=iter([File(path)])), patch(
+        "astro.files.File.export_to_dataframe", return_value=header
+    ):
+        database.load_file_to_table_natively(
+            File(path),
+            Table(name="target", metadata=Metadata(schema="S", database="D")),
+            columns=["name", "id"],
+        )
+    statement = hook.run.call_args.args[0]
+    assert statement.startswith("COPY INTO D.S.target (name, id) FROM (")
+    assert expected_select in statement
+    assert statement.endswith("MATCH_BY_COLUMN_NAME=NONE")
+
+
+def test_native_load_selection_is_not_available_with_filters():
+    """COPY INTO transformations can't filter rows"""
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    source_file = File("s3://bucket/sample.parquet")
+    assert database.is_native_load_selection_available(source_file, columns=["id"]) is True
+    assert database.is_native_load_selection_available(source_file, filters=[("id", ">", 1)]) is False
+
+
+@pytest.mark.parametrize("path", ["s3://bucket/sample.avro", "gs://bucket/sample.orc"])
+def test_native_load_and_autodetect_are_available_for_avro_and_orc(path):
+    database = SnowflakeDatabase(conn_id="fake-conn")
+    source_file = File(path)
+    assert database.is_native_load_file_available(source_file, Table(name="target")) is True
+    assert database.is_native_autodetect_schema_available(source_file) is True
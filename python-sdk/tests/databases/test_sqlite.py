@@ -1,10 +1,14 @@
 """Tests specific to the Sqlite Database implementation."""
 
 import pathlib
+from unittest import mock
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 from astro.constants import Database
+from astro.dataframes.pandas import LazyPandasDataframe
 from astro.files import File
 
 DEFAULT_CONN_ID = "sqlite_default"
@@ -31,3 +35,185 @@ def test_export_table_to_file_file_already_exists_raises_exception(
         database.export_table_to_file(source_table, File(str(filepath)))
     err_msg = exception_info.value.args[0]
     assert err_msg.endswith(f"The file {filepath} already exists.")
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_record_batches_round_trip(database_table_fixture):
+    """Load Arrow record batches to a table, and stream them back from the table"""
+    database, target_table = database_table_fixture
+    table = pa.table({"id": [1, 2, 3], "name": ["First", "Second", "Third"]})
+    empty_batch = table.schema.empty_table().to_batches()
+    database.load_record_batches_to_table(empty_batch + table.to_batches(max_chunksize=2), target_table)
+
+    batches = list(database.export_table_to_record_batches(target_table, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).to_pydict() == table.to_pydict()
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_export_table_to_record_batches_keeps_the_schema_of_the_first_batch(database_table_fixture):
+    """The batches share the same schema, even when pandas infers another dtype for a chunk"""
+    database, target_table = database_table_fixture
+    database.load_pandas_dataframe_to_table(pd.DataFrame({"id": [1, 2, None]}, dtype="Int64"), target_table)
+
+    batches = list(database.export_table_to_record_batches(target_table, batch_size=2))
+    assert [batch.schema.field("id").type for batch in batches] == [pa.int64(), pa.int64()]
+    assert pa.Table.from_batches(batches).to_pydict() == {"id": [1, 2, None]}
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_export_table_to_record_batches_types_null_columns_after_their_sql_type(database_table_fixture):
+    """Columns holding only nulls in the first batch get the type of their values in the following ones"""
+    database, target_table = database_table_fixture
+    database.load_pandas_dataframe_to_table(
+        pd.DataFrame({"id": [1, 2, 3], "name": [None, None, "x"], "score": [None, None, 1.5]}), target_table
+    )
+
+    batches = list(database.export_table_to_record_batches(target_table, batch_size=2))
+    assert [batch.schema for batch in batches] == [batches[0].schema] * 2
+    assert pa.Table.from_batches(batches).to_pydict() == {
+        "id": [1, 2, 3],
+        "name": [None, None, "x"],
+        "score": [None, None, 1.5],
+    }
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_file_to_table_with_columns_and_filters(database_table_fixture):
+    """Load only the selected columns and the matching rows of a file"""
+    database, target_table = database_table_fixture
+    filepath = str(pathlib.Path(CWD.parent, "data/sample.csv"))
+    database.load_file_to_table(File(filepath), target_table, columns=["name"], filters=[("id", ">=", 2)])
+
+    df = database.export_table_to_pandas_dataframe(target_table)
+    assert df.to_dict("list") == {"name": ["Second", "Third with unicode पांचाल"]}
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_json_file_to_table_in_chunks(database_table_fixture):
+    """Load a JSON array to a table one chunk of rows at a time"""
+    database, target_table = database_table_fixture
+    filepath = str(pathlib.Path(CWD.parent, "data/sample.json"))
+    database.load_file_to_table(File(filepath), target_table, chunk_size=2)
+
+    df = database.export_table_to_pandas_dataframe(target_table)
+    assert df.shape == (3, 2)
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_file_to_table_in_chunks_skips_empty_chunks(database_table_fixture, tmp_path):
+    """Chunks whose rows are all filtered out are skipped, even the first ones"""
+    database, target_table = database_table_fixture
+    path = tmp_path / "sample.json"
+    pd.DataFrame({"id": range(1, 11), "name": [f"name_{index}" for index in range(1, 11)]}).to_json(
+        path, orient="records"
+    )
+
+    database.load_file_to_table(File(str(path)), target_table, chunk_size=3, filters=[("id", ">", 5)])
+
+    df = database.export_table_to_pandas_dataframe(target_table)
+    assert df["id"].tolist() == [6, 7, 8, 9, 10]
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_file_to_table_without_matching_rows(database_table_fixture):
+    """Loading a file whose rows are all filtered out fails"""
+    database, target_table = database_table_fixture
+    filepath = str(pathlib.Path(CWD.parent, "data/sample.json"))
+    with pytest.raises(ValueError, match="Can't load empty dataframe"):
+        database.load_file_to_table(File(filepath), target_table, chunk_size=2, filters=[("id", ">", 5)])
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_lazy_dataframe_to_table(database_table_fixture, tmp_path):
+    """A dataframe pulled from XCom is read from its file when it is loaded to a table"""
+    database, target_table = database_table_fixture
+    path = str(tmp_path / "sample.parquet")
+    pd.DataFrame({"id": [1, 2], "name": ["First", "Second"]}).to_parquet(path)
+
+    database.load_pandas_dataframe_to_table(
+        LazyPandasDataframe.from_file(File(path, is_dataframe=True)), target_table
+    )
+
+    df = database.export_table_to_pandas_dataframe(target_table)
+    assert df.to_dict("list") == {"id": [1, 2], "name": ["First", "Second"]}
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [
+        {"database": Database.SQLITE},
+    ],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_load_csv_file_with_dates_using_pyarrow_engine(database_table_fixture, tmp_path):
+    """Columns parsed by the pyarrow CSV engine, such as dates, can be loaded to a table"""
+    database, target_table = database_table_fixture
+    path = tmp_path / "dates.csv"
+    path.write_text("id,created_at\n1,2022-01-01 10:00:00\n2,2022-02-01 11:30:00\n")
+
+    with mock.patch("astro.settings.CSV_ENGINE", "pyarrow"):
+        database.load_file_to_table(File(str(path)), target_table)
+
+    df = database.export_table_to_pandas_dataframe(target_table)
+    assert df.to_dict("list") == {
+        "id": [1, 2],
+        "created_at": [pd.Timestamp("2022-01-01 10:00:00"), pd.Timestamp("2022-02-01 11:30:00")],
+    }
@@ -80,3 +80,33 @@ def test_generate_file_without_secrets():
         with open(output_file) as file:
             file_string = file.read()
             assert secret_gen_string not in file_string
+
+
+def test_copy_into_selects_columns_and_filters_rows():
+    with tempfile.NamedTemporaryFile() as tfile:
+        options = DeltaLoadOptions(existing_cluster_id="cluster", copy_into_format_options={"header": "true"})
+        output_file = generate_file(
+            data_source_path="foobar",
+            table_name="baz",
+            source_type="s3",
+            output_file_path=Path(tfile.name),
+            load_options=options,
+            file_type="CSV",
+            columns=["name"],
+            filters=[("id", "in", [1, 3]), ("name", "!=", "it's")],
+        )
+        with open(output_file) as file:
+            file_string = file.read()
+    namespace: dict = {}
+    variables = [
+        line for line in file_string.splitlines() if line.startswith(("select_", "where_", "output_"))
+    ]
+    exec("\n".join(variables), namespace)  # skipcq: PYL-W0122
+    assert namespace["select_columns"] == "`name`, `id`"
+    assert namespace["where_condition"] == "`id` IN (1, 3) AND `name` != 'it\\'s'"
+    assert namespace["output_columns"] == ["name"]
+    assert (
+        "COPY INTO {table_name} FROM (SELECT {select_columns} FROM '{src_data_path}') FILEFORMAT=CSV"
+        in file_string
+    )
+    assert "spark.table(table_name).where(where_condition).select(output_columns)" in file_string
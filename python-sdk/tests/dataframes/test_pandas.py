@@ -1,9 +1,13 @@
 from unittest import mock
 
 import pandas as pd
+import pytest
 
 from astro import settings
-from astro.dataframes.pandas import PandasDataframe
+from astro.constants import FileType
+from astro.custom_backend.serializer import serialize
+from astro.dataframes.pandas import LazyPandasDataframe, PandasDataframe, estimate_memory_usage
+from astro.files import File
 
 
 def test_from_pandas_df():
@@ -64,9 +68,91 @@ def test_serialize_deserialize_with_smaller_df():
     # Assert that size of DF < MAX_DATAFRAME_MEMORY_FOR_XCOM_DB
     assert df.memory_usage(deep=True).sum() < (settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB * 1024)
 
-    # Test that the serialize method will not serialize all the dataframe records to string
-    # and instead create a file object and store the records in a file
+    # Test that the serialize method stores the records as an Arrow IPC stream in the DB,
+    # instead of creating a file object
     s_df = df.serialize()
-    assert s_df == {"data": '{"id":{"0":1},"name":{"0":"xyz"}}'}
+    assert s_df == {"format": "arrow", "data": mock.ANY}
 
-    assert df.equals(PandasDataframe.deserialize(s_df, version=1))
+    assert df.equals(PandasDataframe.deserialize(s_df, version=PandasDataframe.version))
+
+
+def test_deserialize_json_from_version_1():
+    """Test that dataframes stored as JSON by the previous version can still be deserialized"""
+    s_df = {"data": '{"id":{"0":1},"name":{"0":"xyz"}}'}
+
+    df = PandasDataframe.deserialize(s_df, version=1)
+
+    assert df.equals(pd.DataFrame([{"id": 1, "name": "xyz"}]))
+
+
+def test_serialize_deserialize_keeps_dtypes_and_index():
+    """Test that the Arrow encoding restores the dtypes and the index which JSON loses"""
+    df = PandasDataframe(
+        {
+            "created_at": pd.date_range("2024-01-01", periods=3, tz="Europe/Paris"),
+            "category": pd.Categorical(["a", "b", "a"]),
+            "count": pd.array([1, None, 3], dtype="Int64"),
+            "name": ["x", "y", None],
+        },
+        index=pd.Index([5, 6, 7], name="key"),
+    )
+
+    s_df = df.serialize()
+
+    pd.testing.assert_frame_equal(PandasDataframe.deserialize(s_df, version=PandasDataframe.version), df)
+
+
+def test_serialize_falls_back_to_json_for_mixed_objects():
+    """Test that columns which Arrow can't represent are stored as JSON"""
+    df = PandasDataframe({"value": [1, "a"]})
+
+    s_df = df.serialize()
+
+    assert s_df == {"format": "json", "data": '{"value":{"0":1,"1":"a"}}'}
+    assert df.equals(PandasDataframe.deserialize(s_df, version=PandasDataframe.version))
+
+
+def test_estimate_memory_usage_extrapolates_objects():
+    df = pd.DataFrame({"id": range(1000), "name": ["xyz"] * 1000})
+
+    assert estimate_memory_usage(df, sample_size=10) == df.memory_usage(deep=True).sum()
+
+
+def test_lazy_dataframe_is_read_on_first_access(tmp_path):
+    """Test that a dataframe pulled from a file is only read when its content is used"""
+    path = str(tmp_path / "sample.parquet")
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_parquet(path)
+    file = File(path, filetype=FileType.PARQUET, is_dataframe=True)
+
+    df = PandasDataframe.deserialize(file.to_json(), version=PandasDataframe.version)
+
+    assert isinstance(df, LazyPandasDataframe)
+    assert not df.is_materialized
+    # Forwarding the dataframe keeps the reference to its file
+    assert df.serialize() == file.to_json()
+    assert serialize(df) == file.to_json()
+    # Selecting columns only reads these columns
+    with mock.patch.object(
+        File, "export_to_dataframe", wraps=file.export_to_dataframe
+    ) as export_to_dataframe:
+        assert df["name"].tolist() == ["a", "b"]
+        export_to_dataframe.assert_called_once_with(columns=["name"])
+        # Columns are only read once, along with the ones which weren't read yet
+        assert df[["id", "name"]].to_dict("list") == {"id": [1, 2], "name": ["a", "b"]}
+        assert df["name"].tolist() == ["a", "b"]
+        assert export_to_dataframe.call_args_list == [mock.call(columns=["name"]), mock.call(columns=["id"])]
+    assert isinstance(df, PandasDataframe)
+    assert not df.is_materialized
+
+    assert len(df) == 2
+    assert df.is_materialized
+    assert df.equals(pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}))
+
+
+def test_lazy_dataframe_reports_missing_columns(tmp_path):
+    path = str(tmp_path / "sample.parquet")
+    pd.DataFrame({"id": [1, 2]}).to_parquet(path)
+    df = LazyPandasDataframe.from_file(File(path, is_dataframe=True))
+
+    with pytest.raises(KeyError):
+        df["missing"]
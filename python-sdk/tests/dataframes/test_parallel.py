@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from astro.dataframes.parallel import (
+    _get_multiprocessing_context,
+    decode_dataframe,
+    encode_dataframe,
+    map_partitions,
+    partition_by_key,
+)
+
+
+def test_encode_decode_dataframe_keeps_dtypes_and_index():
+    df = pd.DataFrame(
+        {
+            "created_at": pd.date_range("2024-01-01", periods=2, tz="UTC"),
+            "count": pd.array([1, None], "Int64"),
+        },
+        index=pd.Index([3, 4], name="key"),
+    )
+
+    assert isinstance(encode_dataframe(df), bytes)
+    pd.testing.assert_frame_equal(decode_dataframe(encode_dataframe(df)), df)
+
+
+def test_encode_dataframe_falls_back_to_pickling_mixed_objects():
+    df = pd.DataFrame({"value": [1, "a"]})
+
+    assert encode_dataframe(df) is df
+
+
+def test_partition_by_key_keeps_groups_together():
+    df = pd.DataFrame({"key": ["a", "b", "c", "a", "b", "c"] * 10, "value": range(60)})
+
+    partitions = list(partition_by_key(df, ["key"], 4))
+
+    assert sum(len(partition) for partition in partitions) == len(df)
+    assert sorted(key for partition in partitions for key in partition["key"].unique()) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "forkserver", "fork"])
+def test_map_partitions_yields_results_in_order(start_method):
+    """Test partitions are processed in a pool of processes, which are sent functions that can't be pickled"""
+    offset = 10
+    partitions = (pd.DataFrame({"id": range(start, start + 3)}) for start in range(0, 30, 3))
+
+    with mock.patch("astro.settings.DATAFRAME_PARALLELISM_START_METHOD", start_method):
+        assert _get_multiprocessing_context().get_start_method() == start_method
+        results = list(map_partitions(lambda df: df.assign(id=df["id"] + offset), partitions, max_workers=2))
+        assert list(map_partitions(len, [pd.DataFrame({"id": [1, 2]})], max_workers=2)) == [2]
+    assert pd.concat(results)["id"].tolist() == list(range(10, 40))
@@ -0,0 +1,109 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pandas as pd
+import pytest
+from airflow.utils.state import DagRunState
+
+from astro.dataframes.storage import MANIFEST_NAME, DataframeStorage, StoredRun, main
+from astro.files import File
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return DataframeStorage(url=str(tmp_path))
+
+
+def store(storage, dag_id="dag", run_id="run", task_id="task", map_index=-1):
+    ti = mock.Mock(dag_id=dag_id, run_id=run_id, task_id=task_id, map_index=map_index)
+    return storage.store_dataframe(pd.DataFrame({"id": [1, 2]}), context={"ti": ti})
+
+
+def test_store_dataframe_lays_out_files_by_dag_run(storage, tmp_path):
+    file = store(storage)
+    mapped_file = store(storage, task_id="mapped", map_index=3)
+
+    assert file.path.startswith(f"{tmp_path}/dag/run/task/")
+    assert mapped_file.path.startswith(f"{tmp_path}/dag/run/mapped__3/")
+    assert file.export_to_dataframe().equals(pd.DataFrame({"id": [1, 2]}))
+    manifest = json.loads((tmp_path / "dag" / "run" / "task" / MANIFEST_NAME).read_text())
+    assert manifest["task_id"] == "task"
+    assert [entry["path"] for entry in manifest["files"]] == [file.path]
+
+
+def test_store_dataframe_outside_of_a_task(storage, tmp_path):
+    with mock.patch("astro.dataframes.storage._get_current_context", return_value=None):
+        file = storage.store_dataframe(pd.DataFrame({"id": [1]}))
+
+    assert file.path.rsplit("/", 1)[0] == str(tmp_path)
+    assert list(storage.iter_runs()) == []
+
+
+def test_iter_runs_skips_directories_without_manifest(storage, tmp_path):
+    store(storage)
+    (tmp_path / "unrelated" / "directory" / "content").mkdir(parents=True)
+
+    assert list(storage.iter_runs()) == [StoredRun(dag_id="dag", run_id="run", path=f"{tmp_path}/dag/run/")]
+    assert list(storage.iter_runs(dag_id="other")) == []
+
+
+@mock.patch("astro.dataframes.storage.DagRun.find")
+def test_cleanup_deletes_finished_and_missing_runs(find, storage, tmp_path):
+    store(storage, run_id="running")
+    store(storage, run_id="succeeded")
+    store(storage, run_id="deleted")
+    states = {"running": DagRunState.RUNNING, "succeeded": DagRunState.SUCCESS}
+    find.side_effect = lambda dag_id, run_id: ([mock.Mock(state=states[run_id])] if run_id in states else [])
+
+    assert sorted(run.run_id for run in storage.cleanup(dry_run=True)) == ["deleted", "succeeded"]
+    assert sorted(path.name for path in (tmp_path / "dag").iterdir()) == ["deleted", "running", "succeeded"]
+
+    assert sorted(run.run_id for run in storage.cleanup()) == ["deleted", "succeeded"]
+    assert [path.name for path in (tmp_path / "dag").iterdir()] == ["running"]
+    assert storage.cleanup(delete_finished=False) == []
+
+
+@mock.patch("astro.dataframes.storage.DagRun.find")
+def test_cleanup_deletes_runs_older_than_max_age(find, storage, tmp_path):
+    store(storage)
+    find.return_value = [mock.Mock(state=DagRunState.RUNNING)]
+
+    assert storage.cleanup(max_age=timedelta(days=1)) == []
+    now = datetime.now(timezone.utc) + timedelta(days=2)
+    with mock.patch("astro.dataframes.storage.datetime", wraps=datetime) as mock_datetime:
+        mock_datetime.now.return_value = now
+        assert [run.run_id for run in storage.cleanup(max_age=timedelta(days=1))] == ["run"]
+    assert not (tmp_path / "dag" / "run").exists()
+
+
+@mock.patch("astro.dataframes.storage.DagRun.find", return_value=[])
+def test_main_dry_run(find, storage, tmp_path, capsys):
+    store(storage)
+
+    main(["--url", str(tmp_path), "--dry-run"])
+
+    assert capsys.readouterr().out == f"Would delete {tmp_path}/dag/run/\n"
+    assert (tmp_path / "dag" / "run").exists()
+
+
+def test_store_dataframe_deduplicates_identical_dataframes(storage, tmp_path):
+    """Test identical dataframes stored by the tasks of a DAG run share a single file, written once"""
+    ti = mock.Mock(dag_id="dag", run_id="run", task_id="mapped")
+    files = [
+        storage.store_dataframe(pd.DataFrame({"id": [1, 2]}), context={"ti": ti}, deduplicate=True)
+        for ti.map_index in range(3)
+    ]
+    with mock.patch.object(File, "create_from_stream") as create_from_stream:
+        other_file = storage.store_dataframe(
+            pd.DataFrame({"id": [1, 3]}), context={"ti": ti}, deduplicate=True
+        )
+        create_from_stream.assert_called_once()
+
+    assert len({file.path for file in files}) == 1
+    assert files[0].path.startswith(f"{tmp_path}/dag/run/_content/")
+    assert other_file.path != files[0].path
+    assert files[0].export_to_dataframe().equals(pd.DataFrame({"id": [1, 2]}))
+    manifest = json.loads((tmp_path / "dag" / "run" / "mapped__0" / MANIFEST_NAME).read_text())
+    assert [entry["path"] for entry in manifest["files"]] == [files[0].path]
+    assert [run.run_id for run in storage.iter_runs()] == ["run"]
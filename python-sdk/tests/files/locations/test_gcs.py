@@ -1,6 +1,18 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from astro.files.locations import create_file_location
+from astro.files.locations.base import FileMetadata, client_registry
+from astro.files.locations.google.gcs import GCSCompositeUpload, GCSLocation
+
+
+@pytest.fixture(autouse=True)
+def clear_client_registry():
+    """Don't share the pooled clients across tests"""
+    client_registry.clear()
+    yield
+    client_registry.clear()
 
 
 @patch(
@@ -11,3 +23,76 @@ def test_remote_object_store_prefix(remote_file):
     """with remote filepath having prefix"""
     location = create_file_location("gs://tmp/house")
     assert sorted(location.paths) == sorted(["gs://tmp/house1.csv", "gs://tmp/house2.csv"])
+
+
+@pytest.mark.parametrize(
+    "path,suffix,expected_kwargs",
+    [
+        ("gs://tmp/house", ".csv", {"prefix": "house", "match_glob": "house**.csv"}),
+        ("gs://tmp/house", None, {"prefix": "house"}),
+        ("gs://tmp/house[1]", ".csv", {"prefix": "house[1]"}),
+    ],
+    ids=["server-side-suffix", "without-suffix", "prefix-with-glob-characters"],
+)
+@patch("astro.files.locations.google.gcs.GCSLocation.get_client")
+def test_iter_files_lists_metadata(get_client, path, suffix, expected_kwargs):
+    """Test blobs are listed with their metadata, filtering by suffix server-side when possible"""
+    blob = MagicMock(size=10, etag="abc", updated=None)
+    blob.name = "house1.csv"
+    client = get_client.return_value
+    client.list_blobs.return_value = iter([blob])
+
+    assert list(GCSLocation(path).iter_files(suffix=suffix)) == [
+        FileMetadata(path="gs://tmp/house1.csv", size=10, etag="abc")
+    ]
+    client.list_blobs.assert_called_once_with("tmp", **expected_kwargs)
+
+
+@patch("astro.files.locations.google.gcs.GCSLocation.get_client")
+def test_exists_and_size_use_a_single_metadata_request(get_client):
+    """Test existence and size checks fetch the blob metadata instead of opening the blob"""
+    bucket = get_client.return_value.bucket.return_value
+    bucket.get_blob.return_value = MagicMock(size=65, etag="abc", updated=None)
+    location = GCSLocation("gs://tmp/house1.csv")
+    assert location.exists() is True
+    assert location.size == 65
+    bucket.get_blob.assert_called_with("house1.csv")
+
+    bucket.get_blob.return_value = None
+    assert location.exists() is False
+
+
+@patch("astro.files.locations.google.gcs.GCSHook.get_size", return_value=65)
+@patch("astro.files.locations.google.gcs.GCSLocation.get_client")
+def test_size_without_size_in_metadata(get_client, get_size):
+    """Test the size is requested separately when the blob metadata doesn't hold it"""
+    get_client.return_value.bucket.return_value.get_blob.return_value = MagicMock(size=None)
+    assert GCSLocation("gs://tmp/house1.csv").size == 65
+    get_size.assert_called_once_with(bucket_name="tmp", object_name="house1.csv")
+
+
+@patch("astro.files.locations.google.gcs.GCSHook.get_conn")
+def test_transport_params_share_a_pooled_client_per_connection(get_conn):
+    """Test the files using the same connection share a single client, with a tuned connection pool"""
+    get_conn.side_effect = lambda: MagicMock(_credentials=MagicMock(expiry=None))
+    clients = [GCSLocation(f"gs://bucket/file_{index}.csv").transport_params for index in range(10)]
+
+    assert all(params["client"] is clients[0]["client"] for params in clients)
+    get_conn.assert_called_once()
+    adapter = clients[0]["client"]._http.mount.call_args.args[1]
+    assert adapter._pool_maxsize == 32
+
+
+def test_composite_upload_composes_parts_in_batches():
+    """Test parts are composed at most 32 at a time into the final blob and deleted afterwards"""
+    bucket = MagicMock()
+    upload = GCSCompositeUpload(bucket=bucket, blob_name="some/file.parquet")
+    parts = [upload.upload_part(part_number, b"data") for part_number in range(1, 71)]
+
+    upload.complete(parts)
+
+    target = bucket.blob.return_value
+    compose_sources = [call.args[0] for call in target.compose.call_args_list]
+    assert [len(sources) for sources in compose_sources] == [32, 32, 8]
+    assert compose_sources[1][0] is target and compose_sources[2][0] is target
+    bucket.delete_blobs.assert_called_once_with(parts)
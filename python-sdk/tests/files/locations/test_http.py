@@ -1,4 +1,6 @@
 import pathlib
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError, URLError
 
 import pytest
 
@@ -44,3 +46,23 @@ def test_describe_get_paths(path):  # skipcq: PYL-W0612, PTC-W0065
     """test get_paths with API endpoint"""
     location = create_file_location(path)
     assert location.paths == [path]
+
+
+@patch("astro.files.locations.http.urlopen")
+def test_exists_and_size_use_head_requests(urlopen):
+    """Test existence and size checks are answered by HEAD requests"""
+    response = urlopen.return_value.__enter__.return_value
+    response.headers = {"Content-Length": "65", "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    location = create_file_location("https://domain/some-file.csv")
+    assert location.exists() is True
+    assert location.size == 65
+    assert all(call.args[0].get_method() == "HEAD" for call in urlopen.call_args_list)
+
+    urlopen.side_effect = HTTPError("https://domain/some-file.csv", 404, "Not Found", MagicMock(), None)
+    assert location.exists() is False
+
+
+@patch("astro.files.locations.http.urlopen", side_effect=URLError("Name or service not known"))
+def test_exists_with_unreachable_server(urlopen):
+    """Test a file on a server which can't be reached doesn't exist"""
+    assert create_file_location("https://unreachable-domain/some-file.csv").exists() is False
@@ -6,7 +6,7 @@ import uuid
 import pytest
 
 from astro.constants import FileLocation
-from astro.files.locations.base import BaseFileLocation
+from astro.files.locations.base import BaseFileLocation, FileMetadata
 from astro.files.locations.local import LocalLocation
 
 CWD = pathlib.Path(__file__).parent
@@ -60,6 +60,85 @@ def test_get_paths_with_local_dir(local_dir, path):  # skipcq: PYL-W0612
     assert sorted(location.paths) == [LOCAL_DIR_FILE_1, LOCAL_DIR_FILE_2]
 
 
+def test_iter_files_with_local_dir(local_dir):
+    """Test local files are listed with their size, skipping directories"""
+    os.mkdir(pathlib.Path(LOCAL_DIR, "sub_dir"))
+    files = sorted(LocalLocation(LOCAL_DIR).iter_files(), key=lambda metadata: metadata.path)
+    assert [(metadata.path, metadata.size) for metadata in files] == [
+        (LOCAL_DIR_FILE_1, 0),
+        (LOCAL_DIR_FILE_2, 0),
+    ]
+    assert all(isinstance(metadata, FileMetadata) and metadata.mtime is not None for metadata in files)
+    assert list(LocalLocation(LOCAL_DIR).iter_files(suffix=".csv")) == []
+
+
 def test_size():
     """Test get_size() of for local file."""
     assert LocalLocation(str(sample_file.absolute())).size == 65
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        (str(sample_file.absolute()), True),
+        ("/tmp/sample.csv.gz", False),
+        ("/tmp/non-existent-file.csv", False),
+    ],
+    ids=["plain-file", "compressed-file", "missing-file"],
+)
+def test_supports_memory_map(path, expected):
+    """Only existing, uncompressed local files are memory-mapped"""
+    assert LocalLocation(path).supports_memory_map is expected
+
+
+def test_open_memory_map():
+    """Test the memory-mapped file exposes the whole content of the local file"""
+    with LocalLocation(str(sample_file.absolute())).open_memory_map() as memory_map:
+        assert memory_map.size() == 65
+        assert memory_map.read().startswith(b"id,name")
+
+
+def test_iter_partitioned_files_prunes_partitions(tmp_path):
+    """Test partition directories not matching the filters are skipped, along with hidden files"""
+    for partition in ["dt=2024-01-01/region=eu", "dt=2024-01-01/region=us", "dt=2024-01-02/region=eu"]:
+        (tmp_path / partition).mkdir(parents=True)
+        (tmp_path / partition / "part-0.csv").write_text("id\n1\n")
+    (tmp_path / "_SUCCESS").write_text("")
+    (tmp_path / "dt=2024-01-01" / "region=eu" / ".part-0.csv.crc").write_text("")
+    (tmp_path / "dt=2024-01-01" / "region=%5F%5FHIVE_DEFAULT_PARTITION%5F%5F").mkdir()
+
+    location = LocalLocation(str(tmp_path))
+    listed_directories = []
+    list_directory = location.list_directory
+
+    def spy_list_directory(directory):
+        listed_directories.append(directory)
+        return list_directory(directory)
+
+    location.list_directory = spy_list_directory
+    files = list(location.iter_partitioned_files(filters=[("dt", "=", "2024-01-01"), ("region", "!=", "us")]))
+
+    assert [(metadata.path, partition_values) for metadata, partition_values in files] == [
+        (f"{tmp_path}/dt=2024-01-01/region=eu/part-0.csv", {"dt": "2024-01-01", "region": "eu"})
+    ]
+    assert not any("2024-01-02" in directory or "region=us" in directory for directory in listed_directories)
+
+
+def test_iter_partitioned_files_parses_glob_matches(tmp_path):
+    """Test partition values are parsed from the matched paths when the path is a glob pattern"""
+    (tmp_path / "year=2023").mkdir()
+    (tmp_path / "year=2023" / "part-0.csv").write_text("id\n1\n")
+
+    files = list(LocalLocation(f"{tmp_path}/*/*.csv").iter_partitioned_files(filters=[("year", ">", 2020)]))
+    assert [partition_values for _, partition_values in files] == [{"year": "2023"}]
+    assert (
+        list(LocalLocation(f"{tmp_path}/*/*.csv").iter_partitioned_files(filters=[("year", ">", 2023)])) == []
+    )
+
+
+def test_delete_files_ignores_missing_files(tmp_path):
+    (tmp_path / "a.csv").write_text("id\n1\n")
+
+    LocalLocation(str(tmp_path)).delete_files([str(tmp_path / "a.csv"), str(tmp_path / "missing.csv")])
+
+    assert list(tmp_path.iterdir()) == []
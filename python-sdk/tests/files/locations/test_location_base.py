@@ -1,10 +1,17 @@
+import io
 import os
+import random
+import time
 import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import mock
 
 import pytest
 
 from astro.constants import FileLocation
 from astro.files.locations import create_file_location, get_class_name
+from astro.files.locations.amazon.s3 import S3Location
+from astro.files.locations.base import BaseFileLocation, ClientRegistry, MultipartUpload, ParallelUploadStream
 from astro.files.locations.local import LocalLocation
 
 LOCAL_FILENAME = str(uuid.uuid4())
@@ -35,6 +42,46 @@ def test_validate_path_with_supported_filepaths(local_file, filepath):
     assert location.is_valid_path(filepath) is True
 
 
+def test_validate_path_does_not_create_local_files():
+    """Test a non-existing local path is validated without creating it"""
+    path = f"/tmp/{uuid.uuid4()}.csv"
+    assert BaseFileLocation.is_valid_path(path) is True
+    assert not os.path.exists(path)
+    assert BaseFileLocation.is_valid_path(f"/tmp/{uuid.uuid4()}/missing-dir/file.csv") is False
+
+
+@pytest.mark.parametrize("ttl,expected_probes", [(0, 3), (60, 1)], ids=["without-cache", "with-cache"])
+def test_stat_caches_metadata_probes(ttl, expected_probes):
+    """Test the metadata probe result is reused while the cache entry is fresh"""
+    location = LocalLocation(f"/tmp/{uuid.uuid4()}.csv")
+    with mock.patch.object(LocalLocation, "get_metadata", return_value=None) as get_metadata, mock.patch(
+        "astro.settings.FILE_METADATA_CACHE_TTL", ttl
+    ):
+        assert not any([location.exists(), location.exists(), location.exists()])
+    location.invalidate_metadata_cache()
+    assert get_metadata.call_count == expected_probes
+
+
+def test_stat_evicts_expired_and_least_recently_used_metadata():
+    """Test the metadata cache only holds fresh results, for a bounded number of files"""
+    locations = [LocalLocation(f"/tmp/{uuid.uuid4()}.csv") for _ in range(3)]
+    keys = [(location.path, location.conn_id) for location in locations]
+    with mock.patch.object(LocalLocation, "get_metadata", return_value=None) as get_metadata, mock.patch(
+        "astro.settings.FILE_METADATA_CACHE_MAX_SIZE", 2
+    ), mock.patch.dict("astro.files.locations.base._METADATA_CACHE", clear=True) as cache:
+        for location in locations:
+            location.stat(ttl=60)
+        assert list(cache) == keys[1:]
+
+        locations[1].stat(ttl=60)
+        assert list(cache) == [keys[2], keys[1]]
+        assert get_metadata.call_count == 3
+
+        with mock.patch("astro.files.locations.base.time.monotonic", return_value=time.monotonic() + 120):
+            locations[2].stat(ttl=60)
+        assert get_metadata.call_count == 4
+
+
 def test_get_class_name_method_valid_name():
     """Test valid case of implicit naming dependency among the module name and class name for dynamic imports"""
 
@@ -142,3 +189,136 @@ def test_location_eq(loc_1, loc_2, equality):
 def test_location_hash():
     """Test that hashing works"""
     assert isinstance(hash(LocalLocation("/tmp/file_a.csv")), int)
+
+
+@pytest.mark.parametrize("part_size,max_concurrency", [(1, 1), (3, 2), (7, 8), (100, 4)])
+def test_download_in_parallel_reassembles_byte_ranges(part_size, max_concurrency):
+    """Test parts fetched concurrently, and completed out of order, are written back at the right offsets"""
+    content = bytes(range(50))
+    requested_ranges = []
+
+    def read_byte_range(start, end):
+        requested_ranges.append((start, end))
+        time.sleep(random.random() / 1000)
+        return content[start : end + 1]
+
+    location = S3Location("s3://bucket/some-file")
+    buffer = io.BytesIO()
+    with mock.patch.object(S3Location, "get_byte_range_reader", return_value=read_byte_range):
+        location.download_in_parallel(
+            buffer, part_size=part_size, max_concurrency=max_concurrency, size=len(content)
+        )
+
+    assert buffer.tell() == 0
+    assert buffer.read() == content
+    assert sorted(requested_ranges) == [
+        (start, min(start + part_size, len(content)) - 1) for start in range(0, len(content), part_size)
+    ]
+
+
+class InMemoryMultipartUpload(MultipartUpload):
+    """Upload engine keeping the parts in memory, to inspect what ParallelUploadStream sends"""
+
+    def __init__(self, fail_on_part=None):
+        self.fail_on_part = fail_on_part
+        self.whole = None
+        self.parts = {}
+        self.completed = None
+        self.aborted = None
+
+    def upload_whole(self, data):
+        self.whole = data
+
+    def begin(self):
+        self.parts = {}
+
+    def upload_part(self, part_number, data):
+        time.sleep(random.random() / 1000)
+        if part_number == self.fail_on_part:
+            raise OSError("Part upload failed")
+        self.parts[part_number] = data
+        return part_number
+
+    def complete(self, parts):
+        self.completed = b"".join(self.parts[part] for part in parts)
+
+    def abort(self, parts):
+        self.aborted = parts
+
+
+def test_parallel_upload_stream_uploads_small_content_in_a_single_request():
+    """Test content smaller than a part is not sent through a multipart upload"""
+    upload = InMemoryMultipartUpload()
+    with ParallelUploadStream(upload, part_size=10, max_concurrency=2) as stream:
+        stream.write(b"abc")
+    assert upload.whole == b"abc"
+    assert upload.completed is None
+
+
+@pytest.mark.parametrize("part_size,max_concurrency", [(1, 1), (3, 2), (7, 8)])
+def test_parallel_upload_stream_assembles_parts_in_order(part_size, max_concurrency):
+    """Test parts uploaded concurrently are completed in the order they were written"""
+    content = bytes(range(50))
+    upload = InMemoryMultipartUpload()
+    with ParallelUploadStream(upload, part_size=part_size, max_concurrency=max_concurrency) as stream:
+        for index in range(0, len(content), 4):
+            stream.write(content[index : index + 4])
+    assert upload.whole is None
+    assert upload.completed == content
+    assert all(len(upload.parts[part_number]) == part_size for part_number in sorted(upload.parts)[:-1])
+
+
+def test_parallel_upload_stream_aborts_when_a_part_fails():
+    """Test the upload is aborted, and the error raised, if one of the parts can't be uploaded"""
+    upload = InMemoryMultipartUpload(fail_on_part=2)
+    with pytest.raises(OSError, match="Part upload failed"):
+        with ParallelUploadStream(upload, part_size=2, max_concurrency=2) as stream:
+            stream.write(b"abcdefgh")
+    assert upload.completed is None
+    assert 2 not in upload.aborted
+
+
+def test_parallel_upload_stream_aborts_when_writer_fails():
+    """Test the upload is aborted if the code writing to the stream raises an exception"""
+    upload = InMemoryMultipartUpload()
+    with pytest.raises(ValueError):
+        with ParallelUploadStream(upload, part_size=2, max_concurrency=2) as stream:
+            stream.write(b"abcdef")
+            raise ValueError()
+    assert upload.completed is None
+    assert sorted(upload.aborted) == [1, 2, 3]
+
+
+def test_client_registry_reuses_clients_until_their_credentials_expire():
+    """Test clients are shared per key, and rebuilt shortly before their credentials expire"""
+    registry = ClientRegistry()
+    expiries = iter([datetime.now(timezone.utc) + timedelta(minutes=1), None])
+    create_client = mock.Mock(side_effect=lambda: (mock.Mock(), next(expiries)))
+
+    expiring_client = registry.get_client("key", create_client)
+    refreshed_client = registry.get_client("key", create_client)
+    assert refreshed_client is not expiring_client
+    assert registry.get_client("key", create_client) is refreshed_client
+    assert create_client.call_count == 2
+
+
+def test_client_registry_rebuilds_clients_after_fork():
+    """Test clients created by a parent process are not reused by its children"""
+    registry = ClientRegistry()
+    create_client = mock.Mock(side_effect=lambda: (mock.Mock(), None))
+    client = registry.get_client("key", create_client)
+    with mock.patch("astro.files.locations.base.os.getpid", return_value=os.getpid() + 1):
+        assert registry.get_client("key", create_client) is not client
+
+
+def test_client_registry_builds_clients_without_holding_its_lock():
+    """Test slow client creations don't block the lookups of other clients"""
+    registry = ClientRegistry()
+    other_client = registry.get_client("other_key", lambda: (mock.Mock(), None))
+
+    def create_client():
+        assert registry.get_client("other_key", mock.Mock()) is other_client
+        return mock.Mock(), None
+
+    client = registry.get_client("key", create_client)
+    assert registry.get_client("key", mock.Mock()) is client
@@ -1,11 +1,26 @@
+import io
 import os
-from unittest.mock import patch
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
 
+import pytest
 from airflow.models.connection import Connection
+from airflow.providers.amazon.aws.hooks.s3 import S3Hook
 from botocore.client import BaseClient
+from botocore.exceptions import ClientError
 
 from astro.files.locations import create_file_location
 from astro.files.locations.amazon.s3 import S3Location
+from astro.files.locations.base import FileMetadata, client_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_client_registry():
+    """Don't share the pooled clients across tests"""
+    client_registry.clear()
+    yield
+    client_registry.clear()
 
 
 def test_get_transport_params_with_s3():  # skipcq: PYL-W0612
@@ -26,6 +41,105 @@ def test_remote_object_store_prefix(remote_file):
     assert sorted(location.paths) == sorted(["s3://tmp/house1.csv", "s3://tmp/house2.csv"])
 
 
+@patch("astro.files.locations.amazon.s3.S3Location.get_client")
+def test_iter_files_lists_metadata_page_by_page(get_client):
+    """Test objects are listed lazily, one page at a time, keeping the metadata returned by the listing"""
+    modified = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    pages = [
+        {"Contents": [{"Key": "house1.csv", "Size": 10, "ETag": '"abc"', "LastModified": modified}]},
+        {"Contents": [{"Key": "house2.json", "Size": 20, "ETag": '"def"', "LastModified": modified}]},
+        {"Contents": [{"Key": "house3.csv", "Size": 30, "ETag": '"ghi"', "LastModified": modified}]},
+    ]
+    requested_pages = []
+
+    def paginate(**kwargs):
+        for page in pages:
+            requested_pages.append(page)
+            yield page
+
+    paginator = get_client.return_value.get_paginator.return_value
+    paginator.paginate.side_effect = paginate
+
+    files = S3Location("s3://tmp/house").iter_files(suffix=".csv")
+    assert next(files) == FileMetadata(path="s3://tmp/house1.csv", size=10, etag="abc", mtime=modified)
+    assert len(requested_pages) == 1
+    assert list(files) == [FileMetadata(path="s3://tmp/house3.csv", size=30, etag="ghi", mtime=modified)]
+    paginator.paginate.assert_called_once_with(Bucket="tmp", Prefix="house")
+
+
+@patch("astro.files.locations.amazon.s3.S3Location.get_client")
+def test_iter_partitioned_files_lists_matching_prefixes(get_client):
+    """Test partitions are listed level by level with a delimiter, skipping the prefixes not matching the filters"""
+    modified = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    listing = {
+        "events/": {
+            "CommonPrefixes": [{"Prefix": "events/dt=2024-01-01/"}, {"Prefix": "events/dt=2024-01-02/"}]
+        },
+        "events/dt=2024-01-02/": {
+            "Contents": [
+                {"Key": "events/dt=2024-01-02/", "Size": 0, "ETag": '"dir"', "LastModified": modified},
+                {
+                    "Key": "events/dt=2024-01-02/part-0.csv",
+                    "Size": 10,
+                    "ETag": '"abc"',
+                    "LastModified": modified,
+                },
+            ]
+        },
+    }
+    paginator = get_client.return_value.get_paginator.return_value
+    paginator.paginate.side_effect = lambda Bucket, Prefix, Delimiter: [listing[Prefix]]
+
+    files = list(S3Location("s3://tmp/events").iter_partitioned_files(filters=[("dt", ">", "2024-01-01")]))
+
+    assert files == [
+        (
+            FileMetadata(
+                path="s3://tmp/events/dt=2024-01-02/part-0.csv", size=10, etag="abc", mtime=modified
+            ),
+            {"dt": "2024-01-02"},
+        )
+    ]
+    assert [call.kwargs["Prefix"] for call in paginator.paginate.call_args_list] == [
+        "events/",
+        "events/dt=2024-01-02/",
+    ]
+
+
+@patch("astro.files.locations.amazon.s3.S3Location.get_client")
+def test_exists_and_size_use_a_single_head_request(get_client):
+    """Test existence and size checks are answered by HEAD requests instead of opening the object"""
+    client = get_client.return_value
+    client.head_object.return_value = {"ContentLength": 65, "ETag": '"abc"'}
+    location = S3Location("s3://tmp/house1.csv")
+    assert location.exists() is True
+    assert location.size == 65
+    client.head_object.assert_called_with(Bucket="tmp", Key="house1.csv")
+
+    client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404"}, "ResponseMetadata": {"HTTPStatusCode": 404}}, "HeadObject"
+    )
+    assert location.exists() is False
+
+
+@patch("astro.files.locations.amazon.s3.S3Location.get_client")
+def test_exists_reports_forbidden_objects_as_missing(get_client):
+    """Test S3 answering 403 for an object, e.g. missing with no permission to list the bucket, means it is missing"""
+    get_client.return_value.head_object.side_effect = ClientError(
+        {"Error": {"Code": "403"}, "ResponseMetadata": {"HTTPStatusCode": 403}}, "HeadObject"
+    )
+    location = S3Location("s3://tmp/house1.csv")
+    assert location.exists() is False
+    with pytest.raises(FileNotFoundError):
+        _ = location.size
+
+    get_client.return_value.head_object.side_effect = ClientError(
+        {"Error": {"Code": "500"}, "ResponseMetadata": {"HTTPStatusCode": 500}}, "HeadObject"
+    )
+    with pytest.raises(ClientError):
+        location.exists()
+
+
 @patch.dict(
     os.environ,
     {"AWS_ACCESS_KEY_ID": "abcd", "AWS_SECRET_ACCESS_KEY": "@#$%@$#ASDH@Ksd23%SD546"},
@@ -49,3 +163,109 @@ def test_transport_params_is_created_with_correct_endpoint(monkeypatch):
     location = S3Location(path="s3://astro-sdk/imdb.csv", conn_id="minio_conn")
     tp = location.transport_params["client"]
     assert tp.meta.endpoint_url == "http://127.0.0.1:9000"
+
+
+@patch("airflow.providers.amazon.aws.hooks.s3.S3Hook.get_client_type")
+def test_byte_range_reader_uses_the_pooled_client(get_client_type):
+    """Test byte ranges are fetched with ranged GET requests, sharing a client whose pool fits the concurrency"""
+    client = get_client_type.return_value
+    client.get_object.return_value = {"Body": io.BytesIO(b"abc")}
+
+    read_byte_range = S3Location(path="s3://bucket/some/file.csv").get_byte_range_reader(max_concurrency=4)
+    assert read_byte_range(10, 12) == b"abc"
+
+    get_client_type.assert_called_once()
+    assert get_client_type.call_args.kwargs["config"].max_pool_connections == 32
+    client.get_object.assert_called_once_with(Bucket="bucket", Key="some/file.csv", Range="bytes=10-12")
+
+
+@patch("airflow.providers.amazon.aws.hooks.s3.S3Hook.get_client_type")
+def test_transport_params_share_a_pooled_client_per_connection(get_client_type):
+    """Test the files using the same connection share a single client, with a tuned connection pool"""
+    get_client_type.side_effect = lambda config: MagicMock(config=config)
+    clients = [
+        S3Location(f"s3://bucket/file_{index}.csv", "aws_default").transport_params for index in range(10)
+    ]
+    other_client = S3Location("s3://bucket/file.csv", "other_conn").transport_params["client"]
+
+    assert all(params["client"] is clients[0]["client"] for params in clients)
+    assert other_client is not clients[0]["client"]
+    assert get_client_type.call_count == 2
+    assert clients[0]["client"].config.max_pool_connections == 32
+
+
+@patch("airflow.providers.amazon.aws.hooks.s3.S3Hook.get_client_type")
+def test_get_client_looks_up_the_connection_once_per_ttl(get_client_type, monkeypatch):
+    """Test the connection is cached instead of looked up for every file, and rotated credentials are picked up"""
+    get_client_type.side_effect = lambda config: MagicMock(config=config)
+    monkeypatch.setenv(
+        "AIRFLOW_CONN_ROTATED_CONN", Connection(conn_type="aws", login="id", password="old").get_uri()
+    )
+    with patch("astro.files.locations.amazon.s3.S3Hook", wraps=S3Hook) as hook_class:
+        client = S3Location("s3://bucket/file_0.csv", "rotated_conn").get_client()
+        assert S3Location("s3://bucket/file_1.csv", "rotated_conn").get_client() is client
+        assert hook_class.call_count == 1
+
+        monkeypatch.setenv(
+            "AIRFLOW_CONN_ROTATED_CONN", Connection(conn_type="aws", login="id", password="new").get_uri()
+        )
+        with patch("astro.files.locations.base.time.monotonic", return_value=time.monotonic() + 301):
+            rotated_client = S3Location("s3://bucket/file_2.csv", "rotated_conn").get_client()
+        assert rotated_client is not client
+        assert hook_class.call_count == 2
+    assert get_client_type.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "path,expected", [("s3://bucket/file.csv", True), ("s3://bucket/file.csv.gz", False)], ids=["plain", "gz"]
+)
+def test_supports_ranged_reads(path, expected):
+    """Compressed objects are decompressed by smart_open, so they can't be fetched in ranges"""
+    assert S3Location(path=path).supports_ranged_reads is expected
+
+
+@patch("airflow.providers.amazon.aws.hooks.s3.S3Hook.get_client_type")
+def test_multipart_upload(get_client_type):
+    """Test parts are sent with the S3 multipart upload API, sharing a client whose pool fits the concurrency"""
+    client = get_client_type.return_value
+    client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+    client.upload_part.side_effect = lambda PartNumber, **kwargs: {"ETag": f"etag-{PartNumber}"}
+
+    location = S3Location(path="s3://bucket/some/file.parquet")
+    with location.open_parallel_upload_stream(part_size=5 * 1024 * 1024, max_concurrency=64) as stream:
+        stream.write(b"a" * (11 * 1024 * 1024))
+
+    assert get_client_type.call_args.kwargs["config"].max_pool_connections == 64
+    assert client.upload_part.call_count == 3
+    client.complete_multipart_upload.assert_called_once_with(
+        Bucket="bucket",
+        Key="some/file.parquet",
+        UploadId="upload-id",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1"},
+                {"PartNumber": 2, "ETag": "etag-2"},
+                {"PartNumber": 3, "ETag": "etag-3"},
+            ]
+        },
+    )
+    client.abort_multipart_upload.assert_not_called()
+
+
+@patch("astro.files.locations.amazon.s3.S3Location.get_client")
+@patch("astro.files.locations.amazon.s3.MAX_DELETE_OBJECTS", new=2)
+def test_delete_files_sends_batched_requests(get_client):
+    """Test objects are deleted with DeleteObjects requests of up to MAX_DELETE_OBJECTS keys"""
+    client = get_client.return_value
+    client.delete_objects.return_value = {}
+
+    S3Location("s3://tmp/dags/").delete_files(["s3://tmp/dags/a", "s3://tmp/dags/b", "s3://tmp/dags/c"])
+
+    assert [call.kwargs["Delete"]["Objects"] for call in client.delete_objects.call_args_list] == [
+        [{"Key": "dags/a"}, {"Key": "dags/b"}],
+        [{"Key": "dags/c"}],
+    ]
+
+    client.delete_objects.return_value = {"Errors": [{"Key": "dags/a", "Code": "AccessDenied"}]}
+    with pytest.raises(OSError):
+        S3Location("s3://tmp/dags/").delete_files(["s3://tmp/dags/a"])
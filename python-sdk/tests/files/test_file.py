@@ -1,14 +1,19 @@
+import io
 import pathlib
 import pickle
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from airflow import DAG
 
 from astro import constants
-from astro.files import File, get_file_list, resolve_file_path_pattern
+from astro.files import File, get_file_list, iter_file_path_pattern, resolve_file_path_pattern
+from astro.files.locations import create_file_location
+from astro.files.locations.base import FileMetadata
+from astro.files.types import ParquetFileType
 
 sample_file = pathlib.Path(pathlib.Path(__file__).parent.parent, "data/sample.csv")
 sample_filepaths_per_filetype = [
@@ -75,6 +80,49 @@ def test_resolve_file_path_pattern_raise_exception(invalid_path):
     assert expected_error in str(e.value)
 
 
+@patch("astro.files.locations.amazon.s3.S3Location.size", new_callable=PropertyMock)
+@patch("astro.files.locations.amazon.s3.S3Location.iter_files")
+def test_resolve_file_path_pattern_reuses_listing_metadata(iter_files, size):
+    """Test the size of resolved files comes from the listing instead of a request per file"""
+    iter_files.return_value = iter(
+        [
+            FileMetadata(path="s3://tmp/folder/", size=0),
+            FileMetadata(path="s3://tmp/folder/house1.csv", size=10),
+            FileMetadata(path="s3://tmp/folder/house2.csv", size=20),
+        ]
+    )
+    files = resolve_file_path_pattern("s3://tmp/folder/", conn_id="aws_default")
+    assert [(file.path, file.size) for file in files] == [
+        ("s3://tmp/folder/house1.csv", 10),
+        ("s3://tmp/folder/house2.csv", 20),
+    ]
+    size.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "path_pattern,expected_suffix",
+    [("s3://tmp/folder/", None), ("s3://tmp/folder/house", None), ("s3://tmp/folder/house.csv", ".csv")],
+)
+@patch("astro.files.locations.amazon.s3.S3Location.iter_files")
+def test_iter_file_path_pattern_lists_files_lazily_by_suffix(iter_files, path_pattern, expected_suffix):
+    """Test the listing is consumed as files are used, only matching the extension the pattern ends with"""
+    listing = iter(
+        [
+            FileMetadata(path="s3://tmp/folder/house.csv", size=10),
+            FileMetadata(path="s3://tmp/folder/house.csv/part-1.csv", size=20),
+        ]
+    )
+    iter_files.return_value = listing
+
+    files = iter_file_path_pattern(path_pattern, conn_id="aws_default")
+    first_file = next(files)
+
+    iter_files.assert_called_once_with(suffix=expected_suffix)
+    assert first_file.path == "s3://tmp/folder/house.csv"
+    assert first_file.size == 10
+    assert next(listing).path == "s3://tmp/folder/house.csv/part-1.csv"
+
+
 def test_get_file_list():
     """Assert that get_file_list handle kwargs correctly"""
     dag = DAG(dag_id="dag1", start_date=datetime(2022, 1, 1))
@@ -209,3 +257,163 @@ def test_if_file_object_can_be_pickled():
     """Verify if we can pickle File object"""
     file = File(path="./test.csv")
     assert pickle.loads(pickle.dumps(file)) == file
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["data/sample.csv", "data/sample.json", "data/sample.ndjson", "data/sample.parquet"],
+    ids=["csv", "json", "ndjson", "parquet"],
+)
+def test_export_to_dataframe_memory_maps_local_files(path):
+    """Verify that local files are read through a memory map instead of a smart_open stream"""
+    sample_file_object = File(str(pathlib.Path(pathlib.Path(__file__).parent.parent, path)))
+    with patch("astro.files.base.smart_open.open") as smart_open_open:
+        df = sample_file_object.export_to_dataframe()
+        byte_stream_df = sample_file_object.export_to_dataframe_via_byte_stream()
+    smart_open_open.assert_not_called()
+    assert df.shape == byte_stream_df.shape == (3, 2)
+
+
+@pytest.mark.parametrize("path", ["data/sample.csv", "data/sample.parquet"], ids=["csv", "parquet"])
+def test_export_to_dataframe_via_byte_stream_closes_memory_map(path):
+    """Verify that the memory map of a local file is closed once the dataframe is read"""
+    sample_file_object = File(str(pathlib.Path(pathlib.Path(__file__).parent.parent, path)))
+    memory_maps = []
+
+    def open_memory_map():
+        memory_maps.append(pa.memory_map(sample_file_object.path, "r"))
+        return memory_maps[-1]
+
+    with patch.object(type(sample_file_object.location), "open_memory_map", side_effect=open_memory_map):
+        df = sample_file_object.export_to_dataframe_via_byte_stream()
+
+    assert df.shape == (3, 2)
+    assert len(memory_maps) == 1
+    assert memory_maps[0].closed
+
+
+def test_convert_remote_file_to_byte_stream_is_zero_copy_for_local_parquet():
+    """Verify that local parquet files are handed to pyarrow as a memory map rather than a BytesIO copy"""
+    sample_file_object = File(str(pathlib.Path(pathlib.Path(__file__).parent.parent, "data/sample.parquet")))
+    stream = sample_file_object._convert_remote_file_to_byte_stream()
+    assert isinstance(stream, pa.MemoryMappedFile)
+    assert ParquetFileType._convert_remote_file_to_byte_stream(stream) is stream
+
+
+@pytest.mark.parametrize("method", ["export_to_dataframe", "export_to_dataframe_via_byte_stream"])
+@pytest.mark.parametrize(
+    "path", ["s3://bucket/sample.parquet", "gs://bucket/sample.parquet"], ids=["s3", "gcs"]
+)
+def test_convert_remote_file_to_byte_stream_downloads_large_objects_in_parallel(path, method):
+    """Verify that objects bigger than a single part are fetched using concurrent byte range requests"""
+    content = pathlib.Path(pathlib.Path(__file__).parent.parent, "data/sample.parquet").read_bytes()
+    sample_file_object = File(path)
+    location_class = type(sample_file_object.location)
+
+    def download_in_parallel(target, size=None):
+        target.write(content)
+        target.seek(0)
+
+    with patch.object(location_class, "size", new=len(content)), patch.object(
+        location_class, "download_in_parallel", side_effect=download_in_parallel
+    ) as download, patch("astro.files.base.settings.PARALLEL_DOWNLOAD_PART_SIZE", new=10), patch(
+        "astro.files.base.smart_open.open"
+    ) as smart_open_open:
+        df = getattr(sample_file_object, method)()
+
+    download.assert_called_once()
+    smart_open_open.assert_not_called()
+    assert df.shape == (3, 2)
+
+
+@pytest.mark.parametrize("filetype", ["csv", "json", "ndjson", "parquet"])
+@pytest.mark.parametrize("path", ["s3://bucket/sample", "gs://bucket/sample"], ids=["s3", "gcs"])
+def test_create_from_dataframe_uploads_parts_in_parallel(path, filetype):
+    """Verify that files written to object stores are uploaded through a parallel upload stream"""
+    df = pd.DataFrame({"id": range(1000), "name": ["a name"] * 1000})
+    sample_file_object = File(f"{path}.{filetype}")
+    location_class = type(sample_file_object.location)
+    buffer = io.BytesIO()
+
+    def open_parallel_upload_stream():
+        stream = MagicMock()
+        stream.__enter__.return_value = buffer
+        return stream
+
+    with patch.object(
+        location_class, "open_parallel_upload_stream", side_effect=open_parallel_upload_stream
+    ), patch("astro.files.base.smart_open.open") as smart_open_open:
+        sample_file_object.create_from_dataframe(df)
+
+    smart_open_open.assert_not_called()
+    buffer.seek(0)
+    assert sample_file_object.type.export_to_dataframe(buffer).shape == (1000, 2)
+
+
+@patch("astro.files.locations.amazon.s3.S3Location.get_client")
+@patch("astro.files.base.create_file_location", wraps=create_file_location)
+def test_load_builds_location_and_client_once(create_location, get_client):
+    """Micro-benchmark: count the locations and clients built while loading a file and inspecting it"""
+    file = File("s3://bucket/sample.csv", conn_id="aws_default")
+    with patch(
+        "astro.files.base.smart_open.open", side_effect=lambda *args, **kwargs: io.StringIO("a,b\n1,2\n")
+    ):
+        for _ in range(10):
+            assert file.location.location_type == constants.FileLocation.S3
+            assert file.type.name == constants.FileType.CSV
+            file.export_to_dataframe()
+    assert create_location.call_count == 1
+    assert get_client.call_count == 1
+
+    file.path = "s3://bucket/other.csv"
+    assert file.location.path == "s3://bucket/other.csv"
+    assert create_location.call_count == 2
+
+
+def test_cache_is_not_pickled():
+    """Cached objects may hold clients which can't be pickled, they are rebuilt after unpickling"""
+    file = File("s3://bucket/sample.csv", conn_id="aws_default")
+    file._cache["transport_params"] = (file.location, {"client": MagicMock()})
+    unpickled = pickle.loads(pickle.dumps(file))
+    assert unpickled == file
+    assert "transport_params" not in unpickled._cache
+
+
+@pytest.mark.parametrize("filetype", ["csv", "ndjson", "parquet"])
+def test_record_batches_round_trip(filetype, tmp_path):
+    """Verify that files are exported to, and created from, Arrow record batches"""
+    source = File(str(pathlib.Path(pathlib.Path(__file__).parent.parent, f"data/sample.{filetype}")))
+    batches = list(source.export_to_record_batches(batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+
+    target = File(str(tmp_path / f"sample.{filetype}"))
+    target.create_from_record_batches(batches)
+    assert target.export_to_dataframe().equals(source.export_to_dataframe())
+
+
+def test_resolve_file_path_pattern_adds_partition_columns(tmp_path):
+    """Test the files of a Hive-partitioned dataset are pruned, and read with their partition columns"""
+    for year, region in [(2022, "eu"), (2023, "eu"), (2023, "us")]:
+        (tmp_path / f"year={year}" / f"region={region}").mkdir(parents=True)
+        pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_csv(
+            tmp_path / f"year={year}" / f"region={region}" / "part-0.csv", index=False
+        )
+    dataset = File(str(tmp_path), hive_partitioning=True)
+    filters = [("year", ">=", 2023), ("region", "=", "eu"), ("id", "=", 2)]
+
+    files = resolve_file_path_pattern(
+        dataset.path, filetype=constants.FileType.CSV, hive_partitioning=True, filters=filters
+    )
+
+    assert [file.path for file in files] == [f"{tmp_path}/year=2023/region=eu/part-0.csv"]
+    df = files[0].export_to_dataframe(
+        columns=["name", "year"], filters=filters, columns_names_capitalization="upper"
+    )
+    assert df.to_dict("list") == {"NAME": ["b"], "YEAR": ["2023"]}
+    assert files[0].export_to_dataframe().to_dict("list") == {
+        "id": [1, 2],
+        "name": ["a", "b"],
+        "year": ["2023", "2023"],
+        "region": ["eu", "eu"],
+    }
+    assert File.from_json(dataset.to_json()).hive_partitioning is True
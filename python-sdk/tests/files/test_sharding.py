@@ -0,0 +1,73 @@
+from unittest.mock import PropertyMock, patch
+
+import pandas as pd
+import pytest
+
+from astro.files import File
+from astro.files.sharding import ShardedFileReader, find_record_boundaries
+
+
+@pytest.fixture
+def sample_dataframe():
+    return pd.DataFrame(
+        {
+            "id": list(range(500)),
+            # Every seventh value contains a newline, which must not be taken for a record boundary
+            "name": [f"first line\nsecond line {i}" if i % 7 == 0 else f'name "{i}"' for i in range(500)],
+            "value": [i * 1.5 for i in range(500)],
+        }
+    )
+
+
+def test_find_record_boundaries_are_aligned_to_lines():
+    content = b"".join(f"{i},{'x' * i}\n".encode() for i in range(100))
+
+    def read_byte_range(start, end):
+        return content[start : end + 1]
+
+    boundaries = find_record_boundaries(read_byte_range, 0, len(content), shard_size=200)
+
+    assert boundaries[0] == 0
+    assert boundaries[-1] == len(content)
+    assert len(boundaries) > 3
+    assert all(content[boundary - 1 : boundary] == b"\n" for boundary in boundaries[1:-1])
+
+
+@pytest.mark.parametrize("extension", ["csv", "ndjson"])
+def test_sharded_reader_matches_sequential_read(extension, sample_dataframe, tmp_path):
+    path = str(tmp_path / f"sample.{extension}")
+    if extension == "csv":
+        sample_dataframe.to_csv(path, index=False)
+    else:
+        sample_dataframe.to_json(path, orient="records", lines=True)
+
+    dataframes = list(ShardedFileReader(File(path), shard_size=500, max_workers=2).iter_dataframes())
+
+    assert len(dataframes) > 1
+    pd.testing.assert_frame_equal(pd.concat(dataframes, ignore_index=True), sample_dataframe)
+
+
+@patch("astro.settings.SHARDED_READ_MAX_WORKERS", 2)
+@patch("astro.settings.SHARDED_READ_SHARD_SIZE", 1000)
+@patch("astro.settings.SHARDED_READ_MIN_SIZE", 1)
+def test_file_reads_large_files_in_shards(sample_dataframe, tmp_path):
+    path = str(tmp_path / "sample.csv")
+    sample_dataframe.to_csv(path, index=False)
+    file = File(path)
+
+    assert file.supports_chunked_reads
+    assert len(list(file.export_to_dataframe_chunks())) > 1
+    df = file.export_to_dataframe(columns=["id", "name"], filters=[("id", "<", 10)])
+    pd.testing.assert_frame_equal(df, sample_dataframe[["id", "name"]].head(10))
+    # Options the byte ranges can't be parsed with are read sequentially
+    assert not file._is_sharded_read_available(nrows=10)
+
+
+def test_file_reads_are_not_sharded_by_default(tmp_path):
+    path = tmp_path / "sample.csv"
+    path.write_text("id\n1\n")
+    file = File(str(path))
+
+    with patch.object(File, "size", new_callable=PropertyMock) as size:
+        assert not file._is_sharded_read_available()
+    size.assert_not_called()
@@ -0,0 +1,48 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+
+from astro.dataframes.pandas import PandasDataframe
+from astro.files import File
+from astro.files.types import ArrowFileType, FeatherFileType
+
+sample_df = pd.DataFrame({"id": [1, 2, 3], "name": ["First", "Second", "Third with unicode पांचाल"]})
+
+
+def test_read_arrow_file_with_columns_and_filters():
+    """Test reading the projected columns and matching rows of the first rows of an Arrow IPC file"""
+    stream = io.BytesIO()
+    ArrowFileType("sample.arrow").create_from_dataframe(sample_df, stream)
+    stream.seek(0)
+
+    df = ArrowFileType("sample.arrow").export_to_dataframe(
+        stream, nrows=2, columns=["name"], filters=[("id", ">=", 2)], columns_names_capitalization="upper"
+    )
+    assert isinstance(df, PandasDataframe)
+    assert df.to_dict("list") == {"NAME": ["Second"]}
+
+
+def test_feather_file_is_memory_mapped(tmp_path):
+    """Test local Feather files are read from a memory map, without copying their buffers"""
+    path = str(tmp_path / "sample.feather")
+    file = File(path)
+    file.create_from_dataframe(sample_df)
+
+    assert isinstance(file.type, FeatherFileType)
+    assert file.is_binary()
+    allocated_bytes = pa.total_allocated_bytes()
+    assert file.export_to_dataframe().equals(sample_df)
+    assert pa.total_allocated_bytes() == allocated_bytes
+
+
+def test_arrow_record_batches_round_trip():
+    """Test Arrow IPC files are written and read one record batch at a time"""
+    batches = pa.Table.from_pandas(sample_df).to_batches(max_chunksize=2)
+    stream = io.BytesIO()
+    ArrowFileType("sample.arrow").write_record_batches(batches, stream)
+    stream.seek(0)
+
+    batches = list(ArrowFileType("sample.arrow").read_record_batches(stream, batch_size=1))
+    assert [batch.num_rows for batch in batches] == [1, 1, 1]
+    assert pa.Table.from_batches(batches).to_pandas().equals(sample_df)
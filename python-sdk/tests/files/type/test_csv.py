@@ -1,7 +1,11 @@
+import io
 import pathlib
 import tempfile
+from unittest import mock
 
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from astro.dataframes.pandas import PandasDataframe
 from astro.files.types import CSVFileType
@@ -32,3 +36,64 @@ def test_write_csv_file():
         csv_type = CSVFileType(path)
         csv_type.create_from_dataframe(stream=temp_file, df=df)
         assert pd.read_csv(path).shape == (3, 2)
+
+
+@pytest.mark.parametrize("nrows,expected_rows", [(None, 3), (2, 2)], ids=["all-rows", "nrows"])
+def test_read_csv_file_with_pyarrow_engine(nrows, expected_rows):
+    """Test the pyarrow engine parses csv files into NumPy-backed columns"""
+    path = str(sample_file.absolute())
+    with open(path) as file:
+        df = CSVFileType(path).export_to_dataframe(file, engine="pyarrow", nrows=nrows)
+    assert isinstance(df, PandasDataframe)
+    assert df.shape == (expected_rows, 2)
+    assert list(df.columns) == ["id", "name"]
+    assert df["id"].dtype == "int64"
+
+
+def test_read_csv_file_with_pyarrow_engine_setting():
+    """Test the global setting selects the engine, and a memory map is read without copies"""
+    path = str(sample_file.absolute())
+    with mock.patch("astro.settings.CSV_ENGINE", "pyarrow"), pa.memory_map(path) as memory_map:
+        df = CSVFileType(path).export_to_dataframe(memory_map)
+    assert df["name"].tolist() == ["First", "Second", "Third with unicode पांचाल"]
+
+
+def test_write_csv_file_with_pyarrow_engine():
+    """Test csv files written with the pyarrow engine setting are the same as the pandas writer's"""
+    df = pd.DataFrame(
+        data={
+            "id": [1, 2, 3],
+            "name": ["First", "Second", "Third, with a comma"],
+            "flag": [True, False, None],
+        }
+    )
+    expected = df.to_csv(index=False).encode()
+    stream = io.BytesIO()
+    with mock.patch("astro.settings.CSV_ENGINE", "pyarrow"):
+        CSVFileType("/tmp/sample.csv").create_from_dataframe(stream=stream, df=df)
+    assert stream.getvalue() == expected
+
+
+def test_csv_record_batches_round_trip():
+    """Test csv files are streamed as Arrow record batches of at most batch_size rows, and written back"""
+    path = str(sample_file.absolute())
+    with open(path) as file:
+        batches = list(CSVFileType(path).read_record_batches(file, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+
+    stream = io.BytesIO()
+    CSVFileType("/tmp/sample.csv").write_record_batches(batches, stream)
+    stream.seek(0)
+    assert pd.read_csv(stream).equals(pd.read_csv(path))
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+def test_read_csv_file_with_columns_and_filters(engine):
+    """Test only the selected columns are parsed, and only the matching rows are kept"""
+    path = str(sample_file.absolute())
+    with open(path) as file:
+        df = CSVFileType(path).export_to_dataframe(
+            file, engine=engine, columns=["name"], filters=[("id", "in", [1, 3])]
+        )
+    assert list(df.columns) == ["name"]
+    assert list(df["name"]) == ["First", "Third with unicode पांचाल"]
@@ -1,10 +1,16 @@
+import io
+import json
 import pathlib
 import tempfile
+from unittest.mock import patch
 
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from astro.dataframes.pandas import PandasDataframe
 from astro.files.types import JSONFileType
+from astro.files.types.json import JSONArrayReader
 
 sample_file = pathlib.Path(pathlib.Path(__file__).parent.parent.parent, "data/sample.json")
 
@@ -32,3 +38,64 @@ def test_write_json_file():
         json_type = JSONFileType(path)
         json_type.create_from_dataframe(stream=temp_file, df=df)
         assert pd.read_json(path).shape == (3, 2)
+
+
+@patch("astro.files.types.json.JSON_READ_SIZE", 3)
+def test_json_array_reader_splits_items_across_blocks():
+    """Test items are split correctly when they span several blocks, including numbers cut by a block"""
+    items = [{"id": 12345, "name": 'a ] , [ \\" b'}, [1, {"x": None}], 6789, "text", True]
+    document = " [ " + " ,\n ".join(json.dumps(item) for item in items) + " ] "
+    assert [json.loads(item) for item in JSONArrayReader(io.StringIO(document))] == items
+    assert list(JSONArrayReader(io.StringIO(" [ ] "))) == []
+    with pytest.raises(ValueError):
+        list(JSONArrayReader(io.StringIO('[{"id": 1}, {"id": ')))
+
+
+def test_export_to_dataframe_chunks():
+    """Test JSON arrays are read in chunks of bounded size, honoring nrows, columns and filters"""
+    json_type = JSONFileType("sample.json")
+    document = json.dumps([{"id": index, "name": f"name_{index}"} for index in range(5)])
+
+    chunks = list(json_type.export_to_dataframe_chunks(io.StringIO(document), chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks, ignore_index=True).equals(pd.read_json(io.StringIO(document)))
+
+    chunks = json_type.export_to_dataframe_chunks(
+        io.StringIO(document), chunk_size=2, nrows=3, columns=["name"], filters=[("id", "!=", 1)]
+    )
+    assert [chunk.to_dict("list") for chunk in chunks] == [{"name": ["name_0"]}, {"name": ["name_2"]}]
+
+
+def test_export_to_dataframe_chunks_reconciles_column_types():
+    """Test the chunks of a JSON array share the column types pandas infers for the whole array"""
+    json_type = JSONFileType("sample.json")
+    document = json.dumps(
+        [{"a": 1, "b": None, "c": 1}, {"a": 2, "b": None, "c": 2}, {"a": 3, "b": "x", "c": 2.5}]
+    )
+
+    chunks = list(json_type.export_to_dataframe_chunks(io.StringIO(document), chunk_size=2))
+    assert [dict(chunk.dtypes) for chunk in chunks] == [dict(pd.read_json(io.StringIO(document)).dtypes)] * 2
+    assert pd.concat(chunks, ignore_index=True).equals(pd.read_json(io.StringIO(document)))
+
+
+def test_read_record_batches_types_columns_null_in_the_first_chunk():
+    """Test record batches of a JSON array share a schema typing the columns after all of their values"""
+    json_type = JSONFileType("sample.json")
+    document = json.dumps([{"a": 1, "b": None}, {"a": 2, "b": None}, {"a": 3, "b": "x"}])
+
+    batches = list(json_type.read_record_batches(io.StringIO(document), batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert {batch.schema.field("b").type for batch in batches} == {pa.string()}
+    assert pa.Table.from_batches(batches).to_pydict() == {"a": [1, 2, 3], "b": [None, None, "x"]}
+
+
+def test_read_json_file_with_nrows():
+    """Test only the first items of the array are parsed when sampling, and other documents are read whole"""
+    json_type = JSONFileType("sample.json")
+    with open(sample_file) as file:
+        df = json_type.export_to_dataframe(file, nrows=2)
+    assert df.shape == (2, 2)
+    assert isinstance(df, PandasDataframe)
+
+    df = json_type.export_to_dataframe(io.StringIO('{"id": {"0": 1, "1": 2}}'), nrows=1)
+    assert df.to_dict("list") == {"id": [1]}
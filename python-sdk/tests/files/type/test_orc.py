@@ -0,0 +1,33 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+
+from astro.dataframes.pandas import PandasDataframe
+from astro.files.types import ORCFileType
+
+sample_df = pd.DataFrame({"id": [1, 2, 3], "name": ["First", "Second", "Third with unicode पांचाल"]})
+
+
+def test_read_orc_file_with_columns_and_filters():
+    """Test reading the projected columns and matching rows of the first rows of an ORC file"""
+    stream = io.BytesIO()
+    ORCFileType("sample.orc").create_from_dataframe(sample_df, stream)
+    stream.seek(0)
+
+    df = ORCFileType("sample.orc").export_to_dataframe(
+        stream, nrows=2, columns=["name"], filters=[("id", ">=", 2)]
+    )
+    assert isinstance(df, PandasDataframe)
+    assert df.to_dict("list") == {"name": ["Second"]}
+
+
+def test_orc_record_batches_round_trip():
+    """Test ORC files are written one record batch at a time, and read one stripe at a time"""
+    stream = io.BytesIO()
+    ORCFileType("sample.orc").write_record_batches(pa.Table.from_pandas(sample_df).to_batches(), stream)
+    stream.seek(0)
+
+    batches = list(ORCFileType("sample.orc").read_record_batches(stream, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).to_pandas().equals(sample_df)
@@ -1,7 +1,11 @@
+import io
 import pathlib
 import tempfile
+from unittest import mock
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from astro.dataframes.pandas import PandasDataframe
 from astro.files.types import ParquetFileType
@@ -32,3 +36,57 @@ def test_write_parquet_file():
         parquet_type = ParquetFileType(path)
         parquet_type.create_from_dataframe(stream=temp_file, df=df)
         assert pd.read_parquet(temp_file).shape == (3, 2)
+
+
+def test_parquet_record_batches_round_trip():
+    """Test parquet files are streamed as Arrow record batches of at most batch_size rows, and written back"""
+    path = str(sample_file.absolute())
+    with open(path, mode="rb") as file:
+        batches = list(ParquetFileType(path).read_record_batches(file, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+
+    stream = io.BytesIO()
+    ParquetFileType("/tmp/sample.parquet").write_record_batches(batches, stream)
+    stream.seek(0)
+    assert pd.read_parquet(stream).equals(pd.read_parquet(path))
+
+
+def test_read_parquet_file_with_columns_and_filters():
+    """Test the columns and filters are pushed down to the Parquet reader"""
+    path = str(sample_file.absolute())
+    with open(path, mode="rb") as file, mock.patch(
+        "pandas.read_parquet", wraps=pd.read_parquet
+    ) as read_parquet:
+        df = ParquetFileType(path).export_to_dataframe(file, columns=["name"], filters=[("id", ">", 1)])
+    assert read_parquet.call_args.kwargs["columns"] == ["name", "id"]
+    assert read_parquet.call_args.kwargs["filters"] == [("id", ">", 1)]
+    assert df.to_dict("list") == {"name": ["Second", "Third with unicode पांचाल"]}
+
+
+@mock.patch("astro.files.types.parquet.settings.PARQUET_COMPRESSION", "zstd")
+@mock.patch("astro.files.types.parquet.settings.PARQUET_ROW_GROUP_SIZE", 2)
+def test_write_parquet_file_in_row_groups():
+    """Test dataframes are written in row groups of the configured size, with the configured codec"""
+    df = pd.DataFrame({"id": [1, 2, 3, 4, 5], "name": ["a", "b", "c", "d", None]}, index=[5, 6, 7, 8, 9])
+    stream = io.BytesIO()
+    ParquetFileType("sample.parquet").create_from_dataframe(df, stream)
+
+    metadata = pq.ParquetFile(io.BytesIO(stream.getvalue())).metadata
+    assert [metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)] == [2, 2, 1]
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    assert metadata.row_group(0).column(0).statistics.has_min_max
+    assert pd.read_parquet(io.BytesIO(stream.getvalue())).equals(df)
+
+
+def test_parquet_row_group_writer_coalesces_small_batches():
+    """Test record batches smaller than a row group are buffered into full row groups"""
+    batches = pa.table({"id": list(range(10))}).to_batches(max_chunksize=3)
+    stream = io.BytesIO()
+    with ParquetFileType("sample.parquet").open_writer(
+        stream, row_group_size=4, compression="none"
+    ) as writer:
+        writer.write_batches(batches)
+
+    metadata = pq.ParquetFile(io.BytesIO(stream.getvalue())).metadata
+    assert [metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)] == [4, 4, 2]
+    assert metadata.row_group(0).column(0).compression == "UNCOMPRESSED"
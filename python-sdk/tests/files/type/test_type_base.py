@@ -11,6 +11,10 @@ sample_filepaths_per_filetype = [
     (FileType.JSON, "sample.json"),
     (FileType.NDJSON, "sample.ndjson"),
     (FileType.PARQUET, "sample.parquet"),
+    (FileType.ARROW, "sample.arrow"),
+    (FileType.FEATHER, "sample.feather"),
+    (FileType.ORC, "sample.orc"),
+    (FileType.AVRO, "sample.avro"),
 ]
 sample_filetypes = [items[0] for items in sample_filepaths_per_filetype]
 sample_filepaths = [items[1] for items in sample_filepaths_per_filetype]
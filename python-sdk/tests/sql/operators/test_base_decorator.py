@@ -1,4 +1,12 @@
-from astro.sql.operators.base_decorator import BaseSQLDecoratedOperator
+import threading
+from unittest import mock
+
+import pandas as pd
+
+from astro.databases.sqlite import SqliteDatabase
+from astro.sql.operators import base_decorator
+from astro.sql.operators.base_decorator import BaseSQLDecoratedOperator, load_dataframes_into_sql
+from astro.table import Table
 
 
 def test_base_sql_decorated_operator_template_fields_with_parameters():
@@ -7,3 +15,47 @@ def test_base_sql_decorated_operator_template_fields_with_parameters():
      as this required for taskflow to work if XCom args are being passed via parameters.
     """
     assert "parameters" in BaseSQLDecoratedOperator.template_fields
+
+
+def test_load_dataframes_into_sql_stages_dataframes_concurrently():
+    """Test the dataframe arguments are loaded to distinct temporary tables at the same time"""
+    database = mock.MagicMock(MAX_CONCURRENT_DATAFRAME_LOADS=None)
+    database.populate_table_metadata.side_effect = lambda table: table
+    # Each load waits for the two other ones, which only succeeds when they run concurrently
+    barrier = threading.Barrier(3, timeout=10)
+    database.load_pandas_dataframe_to_table.side_effect = lambda **kwargs: barrier.wait()
+    target_table = Table(conn_id="sqlite_default")
+    input_table = Table(name="input", conn_id="sqlite_default")
+    df = pd.DataFrame({"id": [1, 2]})
+
+    op_args, op_kwargs = load_dataframes_into_sql(
+        database, (df, input_table, df), {"other": df, "value": 1}, target_table
+    )
+
+    assert op_args[0] is target_table
+    assert op_args[1] is input_table
+    assert op_kwargs["value"] == 1
+    staged_tables = [op_args[0], op_args[2], op_kwargs["other"]]
+    assert len({table.name for table in staged_tables}) == 3
+    assert [
+        call.kwargs["target_table"] for call in database.load_pandas_dataframe_to_table.call_args_list
+    ] == staged_tables
+
+
+def test_load_dataframes_into_sql_with_sqlite():
+    """Test SQLite, which allows a single writer, loads the dataframes one at a time"""
+    database = SqliteDatabase()
+    df = pd.DataFrame({"id": [1, 2]})
+
+    with mock.patch.object(base_decorator, "ThreadPoolExecutor") as thread_pool_executor:
+        op_args, op_kwargs = load_dataframes_into_sql(
+            database, (df,), {"other": df.assign(id=[3, 4])}, Table(conn_id="sqlite_default")
+        )
+        thread_pool_executor.assert_not_called()
+
+    try:
+        assert database.export_table_to_pandas_dataframe(op_args[0])["id"].tolist() == [1, 2]
+        assert database.export_table_to_pandas_dataframe(op_kwargs["other"])["id"].tolist() == [3, 4]
+    finally:
+        database.drop_table(op_args[0])
+        database.drop_table(op_kwargs["other"])
@@ -1,5 +1,6 @@
 import os
 import pathlib
+from datetime import timedelta
 from unittest import mock
 
 import pytest
@@ -17,7 +18,7 @@ from airflow.utils.timezone import datetime
 
 from astro.constants import Database
 from astro.files import File
-from astro.sql.operators.cleanup import CleanupOperator
+from astro.sql.operators.cleanup import CleanupOperator, DataframeStorageCleanupOperator
 
 CWD = pathlib.Path(__file__).parent
 
@@ -138,3 +139,18 @@ def test_single_worker_mode_scheduler_job(executor_in_cfg, expected_val):
         assert CleanupOperator._is_single_worker_mode(dr) == expected_val
 
         session.rollback()
+
+
+@mock.patch("astro.sql.operators.cleanup.DataframeStorage")
+def test_dataframe_storage_cleanup_operator(storage_class):
+    """Test the operator deletes the dataframes of expired DAG runs and returns their directories"""
+    storage_class.return_value.cleanup.return_value = [mock.Mock(path="/tmp/dag/run/")]
+    operator = DataframeStorageCleanupOperator(
+        task_id="cleanup_dataframes", dag_id_to_cleanup="dag", max_age=timedelta(days=7), storage_url="/tmp"
+    )
+
+    assert operator.execute(context={}) == ["/tmp/dag/run/"]
+    storage_class.assert_called_once_with(url="/tmp", conn_id=None)
+    storage_class.return_value.cleanup.assert_called_once_with(
+        dag_id="dag", delete_finished=True, max_age=timedelta(days=7)
+    )
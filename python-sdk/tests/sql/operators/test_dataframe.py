@@ -9,7 +9,9 @@ from airflow.utils import timezone
 
 import astro.sql as aql
 from astro.airflow.datasets import DATASET_SUPPORT
+from astro.constants import Database
 from astro.files import File
+from astro.sql.operators.dataframe import DataframeOperator
 from astro.table import Table
 
 from ..operators import utils as test_utils
@@ -87,7 +89,6 @@ def _find_validator(function_output):
     ],
 )
 def test_columns_name_cap_multi_output(sample_dag, capital_settings, function_output):
-
     validator = _find_validator(function_output)
 
     @aql.dataframe(columns_names_capitalization=capital_settings["column_setting"])
@@ -210,3 +211,107 @@ def test_col_case_is_preserved(sample_dag):
         task1 = sample_df_1()
         validate(task1)
     test_utils.run_dag(sample_dag)
+
+
+@pytest.mark.parametrize(
+    "database_table_fixture",
+    [{"database": Database.SQLITE, "file": File(str(CWD.parent.parent / "data/sample.csv"))}],
+    indirect=True,
+    ids=["sqlite"],
+)
+def test_chunked_dataframe_appends_each_chunk_to_output_table(database_table_fixture, sample_dag):
+    """Test the function is called once per chunk of the input table, with the other arguments passed whole"""
+    database, input_table = database_table_fixture
+    output_table = Table(conn_id=input_table.conn_id)
+    chunk_lengths = []
+
+    @aql.dataframe(chunked=True, chunk_size=2)
+    def multiply_ids(df: pandas.DataFrame, factors: pandas.DataFrame):  # skipcq: PY-D0003
+        chunk_lengths.append(len(df))
+        df["id"] = df["id"] * len(factors)
+        return df
+
+    with sample_dag:
+        multiply_ids(input_table, factors=input_table, output_table=output_table)
+    test_utils.run_dag(sample_dag)
+
+    assert chunk_lengths == [2, 1]
+    df = database.export_table_to_pandas_dataframe(output_table)
+    assert df["id"].tolist() == [3, 6, 9]
+    database.drop_table(output_table)
+
+
+def test_chunked_dataframe_concatenates_outputs_without_output_table():
+    df = pandas.DataFrame({"id": range(5)})
+    file = File(path="/tmp/chunked.parquet", is_dataframe=True)
+    with mock.patch.object(File, "export_to_dataframe_chunks", return_value=iter([df[:3], df[3:]])):
+        operator = DataframeOperator(
+            task_id="count",
+            python_callable=lambda data: pandas.DataFrame({"rows": [len(data)]}),
+            op_args=(file,),
+            chunked=True,
+            chunk_size=3,
+        )
+        output = operator.execute(context={})
+
+    assert output["rows"].tolist() == [3, 2]
+
+
+def test_chunked_dataframe_returns_none_without_partitions():
+    file = File(path="/tmp/chunked.parquet", is_dataframe=True)
+    with mock.patch.object(File, "export_to_dataframe", return_value=pandas.DataFrame({"key": []})):
+        operator = DataframeOperator(
+            task_id="count",
+            python_callable=lambda data: data,
+            op_args=(file,),
+            partition_by="key",
+        )
+        assert operator.execute(context={}) is None
+
+
+def test_chunked_dataframe_requires_dataframe_argument():
+    operator = DataframeOperator(
+        task_id="count", python_callable=lambda data: data, op_args=(1,), chunked=True
+    )
+
+    with pytest.raises(ValueError, match="needs a Table or dataframe File argument"):
+        operator.execute(context={})
+
+
+@pytest.mark.parametrize("partition_by", [None, "key"])
+def test_dataframe_runs_partitions_in_parallel(partition_by):
+    """Test the function is called on partitions of the input in a pool of processes"""
+    df = pandas.DataFrame({"key": ["a", "b", "a", "c", "b"], "value": range(5)})
+    file = File(path="/tmp/parallel.parquet", is_dataframe=True)
+
+    def sum_values(data: pandas.DataFrame):  # skipcq: PY-D0003
+        return data.groupby("key", as_index=False)["value"].sum()
+
+    with mock.patch.object(
+        File, "export_to_dataframe_chunks", return_value=iter([df[:2], df[2:]])
+    ), mock.patch.object(File, "export_to_dataframe", return_value=df):
+        operator = DataframeOperator(
+            task_id="sum_values",
+            python_callable=sum_values,
+            op_args=(file,),
+            parallelism=2,
+            partition_by=partition_by,
+        )
+        output = operator.execute(context={})
+
+    if partition_by:
+        # Each key is aggregated by a single call
+        assert output.sort_values("key")["value"].tolist() == [2, 5, 3]
+    else:
+        # Each chunk of rows is aggregated separately
+        assert output["value"].tolist() == [0, 1, 2, 4, 3]
+
+
+def test_dataframe_optimizes_dtypes_of_input_files(sample_dag):
+    @aql.dataframe(optimize_dtypes=True)
+    def validate_file(df: pandas.DataFrame):  # skipcq: PY-D0003
+        assert str(df["sell"].dtype) == "uint8"
+
+    with sample_dag:
+        validate_file(df=File(path=str(CWD) + "/../../data/homes2.csv"))
+    test_utils.run_dag(sample_dag)
@@ -9,8 +9,9 @@ from astro import sql as aql
 from astro.airflow.datasets import DATASET_SUPPORT
 from astro.constants import Database, FileType
 from astro.files import File
-from astro.sql.operators.load_file import load_file
+from astro.sql.operators.load_file import LoadFileOperator, load_file
 from astro.table import Metadata, Table
+from astro.utils.dataframe import optimize_dtypes
 from tests.utils.airflow import create_context
 
 from ..operators import utils as test_utils
@@ -165,3 +166,50 @@ def test_tables_creation_if_they_dont_exist(database_table_fixture, if_exists):
 
     database_df = db.export_table_to_pandas_dataframe(test_table)
     assert database_df.shape == (3, 9)
+
+
+def test_load_file_to_dataframe_with_columns_and_filters():
+    """Test only the selected columns and rows of the file are loaded to the dataframe"""
+    path = str(CWD.parent.parent / "data/sample.csv")
+    operator = LoadFileOperator(
+        task_id="load_file", input_file=File(path), columns=["name"], filters=[("id", "<=", 2)]
+    )
+    df = operator.execute(context=create_context(operator))
+    assert df.to_dict("list") == {"name": ["First", "Second"]}
+
+
+def test_load_file_rejects_invalid_filters():
+    """Test the filters are validated when the operator is instantiated"""
+    with pytest.raises(ValueError, match="Invalid filter operator"):
+        LoadFileOperator(task_id="load_file", input_file=File("/tmp/sample.csv"), filters=[("id", "~", 2)])
+
+
+def test_load_file_to_dataframe_with_optimized_dtypes():
+    """Test the columns of the dataframe are converted to compact dtypes"""
+    path = str(CWD.parent.parent / "data/sample.csv")
+    operator = LoadFileOperator(task_id="load_file", input_file=File(path), optimize_dtypes=True)
+    df = operator.execute(context=create_context(operator))
+    assert df.dtypes.astype(str).to_dict() == {"id": "uint8", "name": "string"}
+    assert df["id"].tolist() == [1, 2, 3]
+
+
+def test_load_files_to_dataframe_with_optimized_dtypes(tmp_path):
+    """Test the files matching a pattern are optimized once each, and their categoricals concatenated as such"""
+    pd.DataFrame({"id": range(4), "kind": ["a", "b", "a", "b"]}).to_csv(
+        tmp_path / "sample_1.csv", index=False
+    )
+    pd.DataFrame({"id": range(4, 8), "kind": ["c", "a", "c", "a"]}).to_csv(
+        tmp_path / "sample_2.csv", index=False
+    )
+    operator = LoadFileOperator(
+        task_id="load_file", input_file=File(str(tmp_path / "sample_*.csv")), optimize_dtypes=True
+    )
+
+    with mock.patch(
+        "astro.sql.operators.load_file.optimize_dtypes", wraps=optimize_dtypes
+    ) as optimize_dtypes_mock:
+        df = operator.execute(context=create_context(operator))
+
+    assert optimize_dtypes_mock.call_count == 2
+    assert df["kind"].dtype == pd.CategoricalDtype(["a", "b", "c"])
+    assert sorted(df["kind"].tolist()) == ["a", "a", "a", "a", "b", "b", "c", "c"]
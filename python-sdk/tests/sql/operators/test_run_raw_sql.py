@@ -1,8 +1,13 @@
 import pathlib
+from unittest import mock
 
+import pyarrow as pa
 import pytest
+import sqlalchemy
 
 from astro import sql as aql
+from astro.files import File
+from astro.sql.operators.raw_sql import ColumnarRows, SdkLegacyRow
 
 CWD = pathlib.Path(__file__).parent
 DATA_FILEPATH = pathlib.Path(CWD.parent.parent, "data/sample.csv")
@@ -16,3 +21,91 @@ def test_make_row_serializable(rows):
     input_rows, expected_output = rows
     result = aql.RawSQLOperator.make_row_serializable(input_rows)
     assert result == expected_output
+
+
+@pytest.fixture
+def sqlalchemy_rows():
+    engine = sqlalchemy.create_engine("sqlite://")
+    with engine.connect() as connection:
+        return connection.execute(
+            sqlalchemy.text("SELECT 1 AS id, 'a' AS name, 0.5 AS ratio UNION ALL SELECT 2, 'b', NULL")
+        ).fetchall()
+
+
+def test_make_row_serializable_stores_rows_by_column(sqlalchemy_rows):
+    """Test SQLAlchemy rows are stored by column, and are read back as rows"""
+    rows = aql.RawSQLOperator.make_row_serializable(sqlalchemy_rows)
+
+    assert isinstance(rows, ColumnarRows)
+    assert rows.column_names == ["id", "name", "ratio"]
+    assert rows.table.column("id").type == pa.int64()
+    assert rows == [(1, "a", 0.5), (2, "b", None)]
+    assert isinstance(rows[0], SdkLegacyRow)
+    assert rows[0]["name"] == "a"
+    assert rows[-1].id == 2
+    assert rows[:1] == [(1, "a", 0.5)]
+    assert len(rows[5:]) == 0
+
+
+def test_make_row_serializable_keeps_rows_with_ambiguous_columns():
+    """Test rows whose columns can't be stored by name are converted one by one"""
+    engine = sqlalchemy.create_engine("sqlite://")
+    with engine.connect() as connection:
+        sqlalchemy_rows = connection.execute(sqlalchemy.text("SELECT 1 AS id, 2 AS id")).fetchall()
+
+    rows = aql.RawSQLOperator.make_row_serializable(sqlalchemy_rows)
+
+    assert isinstance(rows, list)
+    assert isinstance(rows[0], SdkLegacyRow)
+    assert rows == [(1, 2)]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [(1, 2.5), ({"a": 1}, {"a": 2}), (2**64, 1)],
+    ids=["mixed-numbers", "dicts", "out-of-int64-range"],
+)
+def test_make_row_serializable_keeps_rows_arrow_would_change(values, sqlalchemy_rows):
+    """Test rows whose values Arrow would convert to another type are kept as they are, one by one"""
+    key_map = sqlalchemy_rows[0]._keymap
+    sqlalchemy_rows = [
+        SdkLegacyRow(None, None, key_map, sqlalchemy_rows[0]._key_style, (value, "a", None))
+        for value in values
+    ]
+
+    rows = aql.RawSQLOperator.make_row_serializable(sqlalchemy_rows)
+
+    assert isinstance(rows, list)
+    assert [row[0] for row in rows] == list(values)
+    assert [type(row[0]) for row in rows] == [type(value) for value in values]
+
+
+def test_columnar_rows_serialize_deserialize_in_xcom_db(sqlalchemy_rows):
+    """Test small results are stored in XCom as a single Arrow stream, with the names of the columns once"""
+    rows = aql.RawSQLOperator.make_row_serializable(sqlalchemy_rows)
+
+    serialized_rows = rows.serialize()
+
+    assert serialized_rows == {"format": "arrow", "data": mock.ANY, "key_style": mock.ANY}
+    deserialized_rows = ColumnarRows.deserialize(serialized_rows, version=ColumnarRows.version)
+    assert deserialized_rows == sqlalchemy_rows
+    assert deserialized_rows[1].name == "b"
+
+
+def test_columnar_rows_serialize_deserialize_in_storage(sqlalchemy_rows, tmp_path):
+    """Test large results are stored in a file, which is only read when the rows are accessed"""
+    rows = aql.RawSQLOperator.make_row_serializable(sqlalchemy_rows)
+
+    with mock.patch("astro.settings.MAX_DATAFRAME_MEMORY_FOR_XCOM_DB", new=0), mock.patch(
+        "astro.settings.DATAFRAME_STORAGE_URL", new=str(tmp_path)
+    ):
+        serialized_rows = rows.serialize()
+
+    assert serialized_rows["format"] == "file"
+    assert [path.suffix for path in tmp_path.iterdir()] == [".parquet"]
+    deserialized_rows = ColumnarRows.deserialize(serialized_rows, version=ColumnarRows.version)
+    # Forwarding the rows keeps the reference to their file
+    with mock.patch.object(File, "export_to_record_batches") as export_to_record_batches:
+        assert deserialized_rows.serialize() == serialized_rows
+        export_to_record_batches.assert_not_called()
+    assert deserialized_rows == sqlalchemy_rows
@@ -7,7 +7,7 @@ def test_supported_file_locations():
 
 
 def test_supported_file_types():
-    expected = ["csv", "json", "ndjson", "parquet"]
+    expected = ["arrow", "avro", "csv", "feather", "json", "ndjson", "orc", "parquet"]
     assert sorted(SUPPORTED_FILE_TYPES) == expected
 
 
@@ -1,7 +1,16 @@
+import tracemalloc
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from astro.dataframes.pandas import PandasDataframe
-from astro.utils.dataframe import convert_dataframe_to_file
+from astro.utils.dataframe import (
+    concat_dataframes,
+    convert_columns_names_capitalization,
+    convert_dataframe_to_file,
+    optimize_dtypes,
+)
 
 
 def test_convert_to_file():
@@ -13,3 +22,87 @@ def test_convert_to_file():
     out = f.export_to_dataframe()
     assert df.equals(out)
     assert isinstance(out, PandasDataframe)
+
+
+def test_optimize_dtypes_keeps_values():
+    """Test columns are converted to compact dtypes only when they hold the same values"""
+    df = pd.DataFrame(
+        {
+            "id": range(1000),
+            "delta": [-1, 1] * 500,
+            "ratio": [0.5] * 1000,
+            "price": [0.1] * 1000,
+            "count": [1.0, None] * 500,
+            "country": ["FR", "DE"] * 500,
+            "name": [f"name {i}" for i in range(1000)],
+            "active": [True, None] * 500,
+            "created_at": pd.date_range("2024-01-01", periods=1000),
+        }
+    )
+
+    optimized_df = optimize_dtypes(df)
+
+    assert optimized_df.dtypes.astype(str).to_dict() == {
+        "id": "uint16",
+        "delta": "int8",
+        "ratio": "float32",
+        "price": "float64",
+        "count": "UInt8",
+        "country": "category",
+        "name": "string",
+        "active": "boolean",
+        "created_at": "datetime64[ns]",
+    }
+    assert optimized_df["name"].dtype.storage == "pyarrow"
+    assert optimized_df.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum() / 4
+    pd.testing.assert_frame_equal(optimized_df.astype(object), df.astype(object).where(df.notna(), pd.NA))
+
+
+def test_optimize_dtypes_keeps_floats_out_of_the_int64_range():
+    """Test integers parsed as floats are only converted to nullable integers when they fit in int64"""
+    df = pd.DataFrame({"small": [1.0, None, -(2.0**63)], "large": [1.0, None, 2.0**63]})
+
+    optimized_df = optimize_dtypes(df)
+
+    assert optimized_df.dtypes.astype(str).to_dict() == {"small": "Int64", "large": "float32"}
+    assert optimized_df["large"].tolist()[2] == 2.0**63
+
+
+@pytest.mark.parametrize("columns_names_capitalization", ["original", "lower", "upper"])
+def test_convert_columns_names_capitalization_does_not_copy_blocks(columns_names_capitalization):
+    """Test wrapping and relabeling a large dataframe allocates none of its data, and leaves it unchanged"""
+    df = pd.DataFrame({f"Column{i}": np.arange(1_000_000, dtype=np.float64) for i in range(8)})
+    data_size = df.memory_usage(index=False).sum()
+
+    tracemalloc.start()
+    try:
+        converted_df = convert_columns_names_capitalization(df, columns_names_capitalization)
+        # The file readers and the dataframe operator wrap the dataframe again
+        converted_df = PandasDataframe.from_pandas_df(converted_df)
+        _, peak_allocated_size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert isinstance(converted_df, PandasDataframe)
+    assert PandasDataframe.from_pandas_df(converted_df) is converted_df
+    assert peak_allocated_size < data_size / 100
+    assert all(
+        np.shares_memory(converted_df.iloc[:, i].to_numpy(), df.iloc[:, i].to_numpy()) for i in range(8)
+    )
+    assert list(df.columns) == [f"Column{i}" for i in range(8)]
+
+
+def test_concat_dataframes_keeps_categoricals():
+    """Test categoricals with different categories are concatenated as categoricals holding all the categories"""
+    dfs = [
+        pd.DataFrame({"id": [1, 2], "kind": pd.Categorical(["a", "b"]), "name": pd.Categorical(["x", "y"])}),
+        pd.DataFrame({"id": [3, 4], "kind": pd.Categorical(["c", "a"]), "name": ["z", "x"]}),
+    ]
+
+    df = concat_dataframes(dfs)
+
+    assert df["kind"].dtype == pd.CategoricalDtype(["a", "b", "c"])
+    assert df["kind"].tolist() == ["a", "b", "c", "a"]
+    # Columns which aren't categoricals in all the dataframes are concatenated by pandas
+    assert df["name"].dtype == object
+    assert df["id"].tolist() == [1, 2, 3, 4]
@@ -0,0 +1,60 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from astro.utils.filters import (
+    filter_dataframe,
+    match_partition_values,
+    render_filters_as_sql,
+    validate_filters,
+)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [[("id", "~", 1)], [("id", ">")], [("name", "in", "First")]],
+    ids=["operator", "shape", "in-value"],
+)
+def test_validate_filters_raises_on_invalid_predicates(filters):
+    """Test malformed predicates are rejected before any file is read"""
+    with pytest.raises(ValueError):
+        validate_filters(filters)
+
+
+def test_filter_dataframe_drops_missing_values():
+    """Test predicates on missing values are not true, like in SQL and pyarrow, and filter columns are dropped"""
+    df = pd.DataFrame({"id": [1, 2, None, 4], "name": ["a", "b", "c", None]})
+    result = filter_dataframe(df, columns=["name"], filters=[("id", ">", 1), ("name", "not in", ["x"])])
+    assert result.to_dict("list") == {"name": ["b"]}
+
+
+def test_render_filters_as_sql():
+    """Test filters are rendered as a WHERE condition with escaped literals"""
+    filters = [
+        ("year", ">=", 2020),
+        ("country", "in", ["FR", "it's"]),
+        ("day", "==", datetime.date(2023, 1, 2)),
+    ]
+    assert render_filters_as_sql(filters, lambda name: f"`{name}`") == (
+        "`year` >= 2020 AND `country` IN ('FR', 'it\\'s') AND `day` = '2023-01-02'"
+    )
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ([("year", ">=", 2020)], True),
+        ([("year", "<", 2020)], False),
+        ([("dt", "=", datetime.date(2023, 1, 2))], True),
+        ([("region", "in", ["eu", "us"])], True),
+        ([("region", "not in", ["eu"])], False),
+        ([("country", "=", "FR")], False),
+        ([("id", "=", 1), ("year", "=", "2023")], True),
+    ],
+    ids=["int", "int-mismatch", "date", "in", "not-in", "null-partition", "non-partition-column"],
+)
+def test_match_partition_values(filters, expected):
+    """Test partition values are converted to the type of the filter values, and null partitions never match"""
+    partition_values = {"year": "2023", "dt": "2023-01-02", "region": "eu", "country": None}
+    assert match_partition_values(partition_values, filters) is expected
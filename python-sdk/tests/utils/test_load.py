@@ -0,0 +1,42 @@
+import pathlib
+from unittest.mock import patch
+
+from astro.files.locations.amazon.s3 import S3Location
+from astro.utils.load import copy_remote_file_to_local
+
+
+def test_copy_remote_file_to_local_downloads_large_objects_in_parallel(tmp_path):
+    """Verify that objects bigger than a single part are copied using concurrent byte range requests"""
+    target = pathlib.Path(tmp_path, "sample.csv")
+
+    def download_in_parallel(target, size=None):
+        target.write(b"id,name\n1,First\n")
+
+    with patch.object(S3Location, "size", new=100), patch.object(
+        S3Location, "download_in_parallel", side_effect=download_in_parallel
+    ) as download, patch("astro.utils.load.settings.PARALLEL_DOWNLOAD_PART_SIZE", new=10), patch(
+        "astro.utils.load.smart_open.open"
+    ) as smart_open_open:
+        assert copy_remote_file_to_local("s3://bucket/sample.csv", str(target)) == str(target)
+
+    download.assert_called_once()
+    smart_open_open.assert_not_called()
+    assert target.read_text() == "id,name\n1,First\n"
+
+
+def test_copy_remote_file_to_local_streams_objects_with_explicit_transport_params(tmp_path):
+    """Verify that explicit transport params, which may hold other credentials, are used by smart_open"""
+    target = pathlib.Path(tmp_path, "sample.csv")
+    transport_params = {"client": object()}
+
+    with patch.object(S3Location, "download_in_parallel") as download, patch(
+        "astro.utils.load.smart_open.open"
+    ) as smart_open_open:
+        smart_open_open.return_value.__enter__.return_value.read.return_value = "id,name\n"
+        copy_remote_file_to_local("s3://bucket/sample.csv", str(target), transport_params=transport_params)
+
+    download.assert_not_called()
+    smart_open_open.assert_called_once_with(
+        "s3://bucket/sample.csv", mode="r", transport_params=transport_params
+    )
+    assert target.read_text() == "id,name\n"
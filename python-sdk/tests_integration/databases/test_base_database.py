@@ -91,19 +91,19 @@ def test_load_file_to_table_natively(sample_dag, database_table_fixture, remote_
 @mock.patch("astro.databases.base.BaseDatabase.create_schema_if_needed")
 @mock.patch("astro.databases.base.BaseDatabase.create_table")
 @mock.patch("astro.databases.base.BaseDatabase.load_file_to_table_natively_with_fallback")
-@mock.patch("astro.databases.base.resolve_file_path_pattern")
-def test_load_file_calls_resolve_file_path_pattern_with_filetype(
-    resolve_file_path_pattern,
+@mock.patch("astro.databases.base.iter_file_path_pattern")
+def test_load_file_calls_iter_file_path_pattern_with_filetype(
+    iter_file_path_pattern,
     load_file_to_table_natively_with_fallback,
     create_table,
     create_schema_if_needed,
     drop_table,
 ):
-    resolve_file_path_pattern.return_value = [File(path="S3://somebucket/test.csv")]
+    iter_file_path_pattern.return_value = iter([File(path="S3://somebucket/test.csv")])
     database = create_database("gcp_conn")
     database.load_file_to_table(
         input_file=File(path="S3://somebucket/test.csv"),
         output_table=Table(conn_id="gcp_conn", metadata=Metadata(schema=SCHEMA)),
         use_native_support=True,
     )
-    assert resolve_file_path_pattern.call_args.kwargs["filetype"] == FileType.CSV
+    assert iter_file_path_pattern.call_args.kwargs["filetype"] == FileType.CSV